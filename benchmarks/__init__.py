@@ -0,0 +1 @@
+"""Benchmarks for the Zerion SDK run against a local stand-in server."""
@@ -0,0 +1,331 @@
+"""Benchmark ZerionClient against the local stand-in server.
+
+Measures throughput, latency percentiles and peak Python memory for single
+calls, bulk wallet fetches, paginated transaction streaming and blocking
+calls through ZerionSyncClient, and writes the results as JSON for
+comparison across versions::
+
+    python -m benchmarks.run --output bench.json
+    python -m benchmarks.run --latency 0.02 --rate-limit-every 50 --compare bench.json
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+)
+
+from hyper_agent.zerion.cache import CachePolicy
+from hyper_agent.zerion.client import ZerionClient
+from hyper_agent.zerion.constants import API_BASE_URL_ENV_VAR
+from hyper_agent.zerion.sync_client import ZerionSyncClient
+from hyper_agent.zerion.wallet import ZerionWallet
+
+from .server import ServerConfig, StandInServer
+
+SCENARIOS = ("single", "bulk", "pagination", "sync")
+
+
+def percentile(values: Sequence[float], fraction: float) -> float:
+    """Nearest-rank percentile of a sample.
+
+    Args:
+        values: Sample values
+        fraction: Percentile as a fraction, e.g. 0.99
+
+    Returns:
+        float: The percentile, or 0.0 for an empty sample
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, int(round(fraction * len(ordered))) - 1))
+    return ordered[rank]
+
+
+def summarize(
+    operations: int,
+    seconds: float,
+    latencies: List[float],
+    peak_memory: int,
+    server: StandInServer,
+    requests_before: int,
+    throttled_before: int
+) -> Dict[str, Any]:
+    """Build the result record of one scenario."""
+    return {
+        "operations": operations,
+        "seconds": round(seconds, 6),
+        "ops_per_sec": round(operations / seconds, 2) if seconds else 0.0,
+        "latency_p50_ms": round(percentile(latencies, 0.50) * 1000, 3),
+        "latency_p99_ms": round(percentile(latencies, 0.99) * 1000, 3),
+        "peak_memory_bytes": peak_memory,
+        "server_requests": server.requests - requests_before,
+        "throttled": server.throttled - throttled_before,
+    }
+
+
+async def measure(
+    server: StandInServer,
+    scenario: Callable[[List[float]], Awaitable[int]]
+) -> Dict[str, Any]:
+    """Run a scenario under tracemalloc and a wall clock.
+
+    Args:
+        server: Server the scenario talks to, for request counters
+        scenario: Coroutine function appending per-operation latencies to
+            the given list and returning the number of operations
+
+    Returns:
+        Dict[str, Any]: Scenario results
+    """
+    latencies: List[float] = []
+    requests_before, throttled_before = server.requests, server.throttled
+    tracemalloc.start()
+    started = time.perf_counter()
+    try:
+        operations = await scenario(latencies)
+        seconds = time.perf_counter() - started
+        _, peak_memory = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return summarize(
+        operations, seconds, latencies, peak_memory,
+        server, requests_before, throttled_before
+    )
+
+
+@contextlib.contextmanager
+def _base_url_env(url: str) -> Iterator[None]:
+    """Set ZERION_API_BASE_URL while a client is created, then restore it.
+
+    Clients require the variable even though the benchmark sets their
+    ``base_url`` directly.
+    """
+    previous = os.environ.get(API_BASE_URL_ENV_VAR)
+    os.environ[API_BASE_URL_ENV_VAR] = url
+    try:
+        yield
+    finally:
+        if previous is None:
+            del os.environ[API_BASE_URL_ENV_VAR]
+        else:
+            os.environ[API_BASE_URL_ENV_VAR] = previous
+
+
+async def run_benchmarks(
+    config: ServerConfig,
+    requests: int = 200,
+    wallets: int = 500,
+    concurrency: int = 20,
+    scenarios: Sequence[str] = SCENARIOS
+) -> Dict[str, Any]:
+    """Run the benchmark scenarios against a fresh stand-in server.
+
+    The response cache is disabled so that every operation reaches the
+    server.
+
+    Args:
+        config: Stand-in server behaviour
+        requests: Number of sequential single calls, async and sync
+        wallets: Number of wallets in the bulk fetch
+        concurrency: Concurrency of the bulk fetch
+        scenarios: Names of the scenarios to run
+
+    Returns:
+        Dict[str, Any]: Results keyed by scenario name
+    """
+    results: Dict[str, Any] = {}
+    async with StandInServer(config) as server:
+        with _base_url_env(server.url):
+            client = ZerionClient(
+                api_key="benchmark", cache_policy=CachePolicy(ttls={})
+            )
+        async with client:
+            client.base_url = server.url
+            wallet = ZerionWallet(client)
+
+            async def single(latencies: List[float]) -> int:
+                for i in range(requests):
+                    started = time.perf_counter()
+                    await wallet.get_wallet_portfolio(f"0x{i:040x}")
+                    latencies.append(time.perf_counter() - started)
+                return requests
+
+            async def bulk(latencies: List[float]) -> int:
+                async def fetch(address: str) -> Any:
+                    started = time.perf_counter()
+                    try:
+                        return await wallet.get_wallet_portfolio(address)
+                    finally:
+                        latencies.append(time.perf_counter() - started)
+
+                addresses = (f"0x{i:040x}" for i in range(wallets))
+                failures = 0
+                async for result in wallet.get_many(addresses, fetch, concurrency):
+                    failures += not result.ok
+                if failures:
+                    raise RuntimeError(f"{failures} bulk fetches failed")
+                return wallets
+
+            async def pagination(latencies: List[float]) -> int:
+                items = 0
+                iterator = wallet.iter_transactions(
+                    "0x1", page_size=config.items, use_cache=False
+                )
+                started = time.perf_counter()
+                async for _ in iterator:
+                    items += 1
+                    if items % config.items == 0:
+                        now = time.perf_counter()
+                        latencies.append(now - started)
+                        started = now
+                return items
+
+            async def sync(latencies: List[float]) -> int:
+                # Blocking calls must not run on the loop serving the server.
+                def calls() -> int:
+                    with _base_url_env(server.url):
+                        zerion = ZerionSyncClient(
+                            api_key="benchmark", cache_policy=CachePolicy(ttls={})
+                        )
+                    with zerion:
+                        zerion.client.base_url = server.url
+                        for i in range(requests):
+                            started = time.perf_counter()
+                            zerion.wallet.get_wallet_portfolio(f"0x{i:040x}")
+                            latencies.append(time.perf_counter() - started)
+                    return requests
+
+                return await asyncio.get_running_loop().run_in_executor(None, calls)
+
+            available = {
+                "single": single,
+                "bulk": bulk,
+                "pagination": pagination,
+                "sync": sync,
+            }
+            for name in scenarios:
+                results[name] = await measure(server, available[name])
+    return results
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any]) -> List[str]:
+    """Describe the change of each metric against a previous results file.
+
+    Args:
+        current: Results of this run
+        baseline: Results loaded from a previous run
+
+    Returns:
+        List[str]: One line per scenario and metric present in both
+    """
+    lines = []
+    for name, metrics in current["results"].items():
+        previous = baseline.get("results", {}).get(name)
+        if not previous:
+            continue
+        for metric in ("ops_per_sec", "latency_p50_ms", "latency_p99_ms",
+                       "peak_memory_bytes"):
+            before, after = previous.get(metric), metrics.get(metric)
+            if not before or after is None:
+                continue
+            change = (after - before) / before * 100
+            lines.append(f"{name}.{metric}: {before} -> {after} ({change:+.1f}%)")
+    return lines
+
+
+def package_version() -> str:
+    """Installed version of the package, or ``unknown``."""
+    try:
+        from importlib.metadata import version
+        return version("hyper-agent")
+    except Exception:
+        return "unknown"
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenario", action="append", choices=SCENARIOS,
+                        help="Scenario to run; repeat for several (default: all)")
+    parser.add_argument("--requests", type=int, default=200,
+                        help="Sequential single calls")
+    parser.add_argument("--wallets", type=int, default=500,
+                        help="Wallets in the bulk fetch")
+    parser.add_argument("--concurrency", type=int, default=20,
+                        help="Bulk fetch concurrency")
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="Server latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0,
+                        help="Maximum extra random latency in seconds")
+    parser.add_argument("--items", type=int, default=100,
+                        help="Resources per list response")
+    parser.add_argument("--padding", type=int, default=0,
+                        help="Extra bytes per resource")
+    parser.add_argument("--pages", type=int, default=20,
+                        help="Pages of transaction history")
+    parser.add_argument("--rate-limit-every", type=int, default=0,
+                        help="Answer every Nth request with 429")
+    parser.add_argument("--retry-after", type=float, default=0.0,
+                        help="Retry-After seconds of injected 429s")
+    parser.add_argument("--output", help="Write results to this JSON file")
+    parser.add_argument("--compare", help="Previous results file to compare against")
+    args = parser.parse_args(argv)
+
+    config = ServerConfig(
+        latency=args.latency,
+        jitter=args.jitter,
+        items=args.items,
+        padding=args.padding,
+        pages=args.pages,
+        rate_limit_every=args.rate_limit_every,
+        retry_after=args.retry_after,
+    )
+    results = asyncio.run(run_benchmarks(
+        config,
+        requests=args.requests,
+        wallets=args.wallets,
+        concurrency=args.concurrency,
+        scenarios=args.scenario or SCENARIOS,
+    ))
+    report = {
+        "version": package_version(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "server": config.as_dict(),
+        "parameters": {
+            "requests": args.requests,
+            "wallets": args.wallets,
+            "concurrency": args.concurrency,
+        },
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(text + "\n")
+    print(text)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            for line in compare(report, json.load(file)):
+                print(line, file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,214 @@
+"""Local stand-in for the Zerion API used by the benchmarks.
+
+Serves every flat ``ENDPOINTS`` route under ``/v1`` with synthetic
+JSON:API bodies. Latency, payload size, pagination depth and 429 injection
+are configurable so that client overheads can be measured in isolation.
+"""
+import asyncio
+import random
+from typing import Any, Dict, Optional
+
+from aiohttp import web
+
+from hyper_agent.zerion.constants import ENDPOINTS
+
+LIST_ENDPOINTS = frozenset({
+    "wallet_balances",
+    "wallet_transactions",
+    "wallet_protocols",
+    "token_holders",
+    "token_transactions",
+    "protocol_pools",
+    "protocol_tokens",
+})
+PAGINATED_ENDPOINTS = frozenset({
+    "wallet_transactions",
+    "token_transactions",
+    "token_holders",
+})
+
+
+class ServerConfig:
+    """Behaviour of the stand-in server."""
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        items: int = 20,
+        padding: int = 0,
+        pages: int = 1,
+        rate_limit_every: int = 0,
+        retry_after: float = 0.0
+    ):
+        """Initialize the configuration.
+
+        Args:
+            latency: Seconds added to every response
+            jitter: Maximum random seconds added on top of ``latency``
+            items: Resources per list response (per page when paginated)
+            padding: Extra bytes of text in every resource, to grow payloads
+            pages: Pages served by paginated endpoints
+            rate_limit_every: Answer every Nth request with 429; 0 disables
+            retry_after: Retry-After seconds sent with injected 429s
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.items = items
+        self.padding = padding
+        self.pages = pages
+        self.rate_limit_every = rate_limit_every
+        self.retry_after = retry_after
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the configuration as a plain dict."""
+        return {
+            "latency": self.latency,
+            "jitter": self.jitter,
+            "items": self.items,
+            "padding": self.padding,
+            "pages": self.pages,
+            "rate_limit_every": self.rate_limit_every,
+            "retry_after": self.retry_after,
+        }
+
+
+def make_resource(name: str, index: int, padding: int = 0) -> Dict[str, Any]:
+    """Build a synthetic resource for an endpoint.
+
+    Args:
+        name: ENDPOINTS name of the route
+        index: Position of the resource in the response
+        padding: Extra bytes of text to include
+
+    Returns:
+        Dict[str, Any]: JSON:API resource
+    """
+    chain = ("ethereum", "base", "arbitrum", "optimism")[index % 4]
+    attributes: Dict[str, Any] = {
+        "name": f"Asset {index % 50}",
+        "value": float(index),
+        "price": 1.0 + index % 7,
+        "quantity": {"int": str(index * 10 ** 18), "decimals": 18, "float": index},
+        "fungible_info": {"name": f"Token {index % 50}", "symbol": f"T{index % 50}"},
+    }
+    if name.endswith("transactions"):
+        attributes.update({
+            "operation_type": ("trade", "send", "receive")[index % 3],
+            "hash": f"0x{index:064x}",
+            "mined_at": f"2024-01-01T00:{index // 60 % 60:02d}:{index % 60:02d}Z",
+            "mined_at_block": index,
+            "status": "confirmed",
+            "fee": {"value": 0.01},
+            "transfers": [
+                {"direction": "in", "value": float(index), "quantity": {"float": 1.0}},
+            ],
+        })
+    if padding:
+        attributes["description"] = "x" * padding
+    return {
+        "type": name.split("_", 1)[-1],
+        "id": f"{name}-{index}",
+        "attributes": attributes,
+        "relationships": {"chain": {"data": {"type": "chains", "id": chain}}},
+    }
+
+
+class StandInServer:
+    """Zerion API stand-in running on a local port::
+
+        async with StandInServer(ServerConfig(latency=0.01)) as server:
+            client.base_url = server.url
+    """
+
+    def __init__(
+        self,
+        config: Optional[ServerConfig] = None,
+        host: str = "127.0.0.1",
+        port: int = 0
+    ):
+        """Initialize the server.
+
+        Args:
+            config: Server behaviour; defaults to an instant server
+            host: Interface to bind
+            port: Port to bind; 0 picks a free one
+        """
+        self.config = config or ServerConfig()
+        self.host = host
+        self.port = port
+        self.requests = 0
+        self.throttled = 0
+        self._runner: Optional[web.AppRunner] = None
+        self._random = random.Random(0)
+
+    @property
+    def url(self) -> str:
+        """Base URL to use as ``ZerionClient.base_url``."""
+        return f"http://{self.host}:{self.port}/v1"
+
+    def make_app(self) -> web.Application:
+        """Build the aiohttp application serving all flat ENDPOINTS routes."""
+        app = web.Application()
+        for name, template in ENDPOINTS.items():
+            if isinstance(template, str):
+                app.router.add_get("/v1" + template, self._handler(name))
+        return app
+
+    def _handler(self, name: str):
+        async def handle(request: web.Request) -> web.Response:
+            self.requests += 1
+            config = self.config
+            delay = config.latency + self._random.uniform(0, config.jitter)
+            if delay:
+                await asyncio.sleep(delay)
+            if config.rate_limit_every and self.requests % config.rate_limit_every == 0:
+                self.throttled += 1
+                return web.json_response(
+                    {"errors": [{"title": "Too many requests"}]},
+                    status=429,
+                    headers={"Retry-After": str(config.retry_after)},
+                )
+            return web.json_response(self._body(name, request))
+
+        return handle
+
+    def _body(self, name: str, request: web.Request) -> Dict[str, Any]:
+        config = self.config
+        if name not in LIST_ENDPOINTS:
+            return {"data": make_resource(name, 0, config.padding)}
+        page = int(request.query.get("page[after]", "0"))
+        start = page * config.items
+        body: Dict[str, Any] = {
+            "data": [
+                make_resource(name, start + i, config.padding)
+                for i in range(config.items)
+            ],
+            "links": {"self": str(request.url)},
+        }
+        if name in PAGINATED_ENDPOINTS and page + 1 < config.pages:
+            body["links"]["next"] = str(
+                request.url.update_query({"page[after]": str(page + 1)})
+            )
+        return body
+
+    async def start(self) -> None:
+        """Start serving; ``port`` is updated when a free port was picked."""
+        self._runner = web.AppRunner(self.make_app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> "StandInServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.stop()
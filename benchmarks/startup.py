@@ -0,0 +1,112 @@
+"""Measure ``zerion --help`` startup time against a budget.
+
+Each run starts a fresh interpreter, so the numbers include interpreter
+startup plus every module the CLI imports. With ``--importtime`` the
+slowest imports of one run are listed as well::
+
+    python -m benchmarks.startup --budget 150
+    python -m benchmarks.startup --importtime
+
+Exits with status 1 when the median exceeds the budget.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+DEFAULT_BUDGET_MS = 150.0
+COMMAND = ("-m", "hyper_agent.zerion.cli", "--help")
+
+
+def _environment() -> Dict[str, str]:
+    return {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+
+
+def time_command(runs: int) -> List[float]:
+    """Run ``zerion --help`` repeatedly.
+
+    Args:
+        runs: Number of fresh interpreter runs
+
+    Returns:
+        List[float]: Wall-clock milliseconds of each run
+    """
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run(
+            [sys.executable, *COMMAND],
+            check=True,
+            stdout=subprocess.DEVNULL,
+            env=_environment(),
+        )
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def slowest_imports(limit: int = 15) -> List[Tuple[str, float]]:
+    """Profile one run with ``-X importtime``.
+
+    Args:
+        limit: Number of modules to return
+
+    Returns:
+        List of ``(module, cumulative milliseconds)``, slowest first
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *COMMAND],
+        check=True,
+        capture_output=True,
+        text=True,
+        env=_environment(),
+    )
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line.split("|")
+        imports.append((module.strip(), int(cumulative) / 1000))
+    imports.sort(key=lambda item: item[1], reverse=True)
+    return imports[:limit]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10, help="Interpreter runs")
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET_MS,
+                        help="Maximum median startup in milliseconds")
+    parser.add_argument("--importtime", action="store_true",
+                        help="Also list the slowest imports")
+    parser.add_argument("--output", help="Write results to this JSON file")
+    args = parser.parse_args(argv)
+
+    timings = time_command(args.runs)
+    median = statistics.median(timings)
+    report = {
+        "command": "zerion --help",
+        "runs": args.runs,
+        "median_ms": round(median, 2),
+        "min_ms": round(min(timings), 2),
+        "max_ms": round(max(timings), 2),
+        "budget_ms": args.budget,
+        "within_budget": median <= args.budget,
+    }
+    if args.importtime:
+        report["slowest_imports_ms"] = [
+            [module, round(ms, 2)] for module, ms in slowest_imports()
+        ]
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(text + "\n")
+    print(text)
+    return 0 if report["within_budget"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
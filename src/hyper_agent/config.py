@@ -2,10 +2,22 @@
 import os
 from typing import Optional
 
-from dotenv import load_dotenv
+_dotenv_loaded = False
 
-# Load environment variables from .env file
-load_dotenv()
+def load_env() -> None:
+    """Load environment variables from the .env file, once.
+
+    Called on the first variable lookup rather than at import time, so that
+    importing the package (e.g. for ``zerion --help``) does not pay for
+    python-dotenv and the file search. Variables already set in the
+    environment take precedence over the file.
+    """
+    global _dotenv_loaded
+    if _dotenv_loaded:
+        return
+    _dotenv_loaded = True
+    from dotenv import load_dotenv
+    load_dotenv()
 
 def get_env_var(key: str) -> Optional[str]:
     """Get an environment variable.
@@ -16,6 +28,7 @@ def get_env_var(key: str) -> Optional[str]:
     Returns:
         Optional[str]: The environment variable value if found, None otherwise.
     """
+    load_env()
     return os.getenv(key)
 
 def require_env_var(key: str, service: str) -> str:
@@ -41,7 +54,7 @@ def require_env_var(key: str, service: str) -> str:
 
 def get_api_key(key_name: str) -> Optional[str]:
     """Get API key from environment variables."""
-    return os.getenv(key_name)
+    return get_env_var(key_name)
 
 def require_api_key(key_name: str) -> str:
     """Get API key from environment variables or raise an error."""
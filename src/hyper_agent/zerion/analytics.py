@@ -0,0 +1,313 @@
+"""Vectorized portfolio analytics over columnar positions and transfers.
+
+All computations run over the NumPy arrays built by
+:mod:`hyper_agent.zerion.columnar`, so thousands of wallets are analysed in
+a single pass without Python loops over records::
+
+    positions = PositionColumns()
+    async for result in wallet.get_many_balances(addresses):
+        if result.ok:
+            positions.extend(result.value["data"], wallet=result.key)
+
+    by_chain = allocation(positions, by="chain_id")
+    by_chain.shares        # (wallets, chains) matrix of portfolio weights
+    by_chain.hhi()         # concentration per wallet
+    by_chain.top(5)        # largest exposures per wallet
+
+Requires NumPy (the ``analytics`` extra).
+"""
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .columnar import PositionColumns, TransferColumns, _require_numpy
+
+
+def _unify(
+    codes: Any,
+    categories: Sequence[Optional[str]],
+    index: Dict[Optional[str], int]
+) -> Any:
+    """Translate category codes into positions in a shared category index.
+
+    Missing values (code -1) map to the ``None`` category. New categories
+    are added to ``index`` in order of first appearance.
+    """
+    np = _require_numpy()
+    lookup = np.empty(len(categories) + 1, dtype=np.int64)
+    for code, category in enumerate(categories):
+        lookup[code] = index.setdefault(category, len(index))
+    missing = codes < 0
+    if not missing.any():
+        return lookup[codes]
+    lookup[-1] = index.setdefault(None, len(index))
+    return lookup[np.where(missing, len(categories), codes)]
+
+
+class Breakdown:
+    """Portfolio value per wallet and group (chain, asset, protocol, ...)."""
+
+    __slots__ = ("wallets", "groups", "values")
+
+    def __init__(
+        self,
+        wallets: List[Optional[str]],
+        groups: List[Optional[str]],
+        values: Any
+    ):
+        """Initialize the breakdown.
+
+        Args:
+            wallets: Wallet address of each row
+            groups: Group name of each column; None collects records without
+                a value for the grouping column, e.g. positions held outside
+                any protocol
+            values: ``(len(wallets), len(groups))`` array of USD values
+        """
+        self.wallets = wallets
+        self.groups = groups
+        self.values = values
+
+    @property
+    def totals(self) -> Any:
+        """Total value per wallet."""
+        return self.values.sum(axis=1)
+
+    @property
+    def shares(self) -> Any:
+        """Fraction of each wallet's value held in each group."""
+        np = _require_numpy()
+        totals = self.totals[:, None]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(totals > 0, self.values / totals, 0.0)
+
+    def hhi(self) -> Any:
+        """Herfindahl-Hirschman index per wallet.
+
+        Returns:
+            numpy.ndarray: Sum of squared shares, from ``1 / groups`` for an
+            even spread to 1.0 for a single holding; 0.0 for empty wallets
+        """
+        return (self.shares ** 2).sum(axis=1)
+
+    def top(self, n: int) -> Tuple[Any, Any]:
+        """Largest exposures per wallet.
+
+        Args:
+            n: Number of exposures per wallet
+
+        Returns:
+            Tuple of ``(groups, shares)`` arrays, both shaped
+            ``(len(wallets), min(n, len(groups)))`` and ordered from the
+            largest share down
+        """
+        np = _require_numpy()
+        shares = self.shares
+        n = min(n, shares.shape[1])
+        if n <= 0:
+            empty = np.empty((len(self.wallets), 0))
+            return empty.astype(object), empty
+        if n < shares.shape[1]:
+            candidates = np.argpartition(-shares, n - 1, axis=1)[:, :n]
+        else:
+            candidates = np.broadcast_to(np.arange(n), shares.shape).copy()
+        picked = np.take_along_axis(shares, candidates, axis=1)
+        order = np.argsort(-picked, axis=1, kind="stable")
+        indices = np.take_along_axis(candidates, order, axis=1)
+        groups = np.array(self.groups, dtype=object)
+        return groups[indices], np.take_along_axis(picked, order, axis=1)
+
+    def for_wallet(self, wallet: Optional[str]) -> Dict[Optional[str], float]:
+        """Get one wallet's non-zero values by group.
+
+        Args:
+            wallet: Wallet address
+
+        Returns:
+            Dict[Optional[str], float]: Value per group
+
+        Raises:
+            KeyError: If the wallet is not in the breakdown.
+        """
+        try:
+            row = self.values[self.wallets.index(wallet)]
+        except ValueError:
+            raise KeyError(wallet) from None
+        return {
+            group: float(value)
+            for group, value in zip(self.groups, row)
+            if value
+        }
+
+
+def allocation(positions: PositionColumns, by: str = "chain_id") -> Breakdown:
+    """Break down wallet values by a categorical position column.
+
+    Args:
+        positions: Positions of one or more wallets
+        by: Categorical column to group by, e.g. ``chain_id``,
+            ``fungible_id``, ``symbol``, ``protocol`` or ``position_type``
+
+    Returns:
+        Breakdown: Values per wallet and group
+
+    Raises:
+        ValueError: If ``by`` is not a categorical position column.
+    """
+    np = _require_numpy()
+    categories = positions.categories()
+    if by not in categories or by == "wallet":
+        raise ValueError(f"Cannot group positions by {by!r}")
+    arrays = positions.to_arrays()
+    wallet_index: Dict[Optional[str], int] = {}
+    group_index: Dict[Optional[str], int] = {}
+    wallets = _unify(arrays["wallet"], categories["wallet"], wallet_index)
+    groups = _unify(arrays[by], categories[by], group_index)
+    values = np.nan_to_num(arrays["value"])
+    size = len(wallet_index) * len(group_index)
+    matrix = np.bincount(
+        wallets * len(group_index) + groups, weights=values, minlength=size
+    ).reshape(len(wallet_index), len(group_index))
+    used_wallets = np.flatnonzero(np.bincount(wallets, minlength=len(wallet_index)))
+    used_groups = np.flatnonzero(matrix.any(axis=0))
+    wallet_names = list(wallet_index)
+    group_names = list(group_index)
+    return Breakdown(
+        [wallet_names[i] for i in used_wallets],
+        [group_names[i] for i in used_groups],
+        matrix[np.ix_(used_wallets, used_groups)],
+    )
+
+
+def concentration(
+    positions: PositionColumns,
+    by: str = "fungible_id"
+) -> Tuple[List[Optional[str]], Any]:
+    """Herfindahl-Hirschman concentration of each wallet.
+
+    Args:
+        positions: Positions of one or more wallets
+        by: Categorical column defining the exposures
+
+    Returns:
+        Tuple of the wallet list and the HHI array in the same order
+    """
+    breakdown = allocation(positions, by)
+    return breakdown.wallets, breakdown.hhi()
+
+
+class PnL:
+    """Realized and unrealized profit and loss per wallet and asset."""
+
+    __slots__ = ("wallets", "assets", "cost_basis", "realized", "unrealized")
+
+    def __init__(
+        self,
+        wallets: List[Optional[str]],
+        assets: List[Optional[str]],
+        cost_basis: Any,
+        realized: Any,
+        unrealized: Any
+    ):
+        """Initialize the result.
+
+        Args:
+            wallets: Wallet address of each row
+            assets: Fungible id of each column
+            cost_basis: Average acquisition price; NaN where unknown
+            realized: Sale proceeds minus the cost of the sold quantity
+            unrealized: Current value minus the cost of the held quantity
+        """
+        self.wallets = wallets
+        self.assets = assets
+        self.cost_basis = cost_basis
+        self.realized = realized
+        self.unrealized = unrealized
+
+    def totals(self) -> Dict[str, Any]:
+        """Per-wallet sums, ignoring assets without a known cost basis.
+
+        Returns:
+            Dict with ``realized``, ``unrealized`` and ``total`` arrays in
+            wallet order
+        """
+        np = _require_numpy()
+        realized = np.nansum(self.realized, axis=1)
+        unrealized = np.nansum(self.unrealized, axis=1)
+        return {
+            "realized": realized,
+            "unrealized": unrealized,
+            "total": realized + unrealized,
+        }
+
+
+def pnl(positions: PositionColumns, transfers: TransferColumns) -> PnL:
+    """Compute average-cost PnL from transfers and current positions.
+
+    The cost basis of an asset is the average price of its priced incoming
+    transfers over the whole history. Priced outgoing transfers realize their
+    value minus that basis, while unpriced ones, e.g. sends to another
+    wallet, realize nothing; current holdings are unrealized PnL. Assets that never
+    came in with a price have an unknown (NaN) basis. Both builders must tag
+    records with the same wallet addresses.
+
+    Args:
+        positions: Current positions, for value still held
+        transfers: Transfer history of the same wallets
+
+    Returns:
+        PnL: Results per wallet and fungible id
+    """
+    np = _require_numpy()
+    position_arrays = positions.to_arrays()
+    transfer_arrays = transfers.to_arrays()
+    position_categories = positions.categories()
+    transfer_categories = transfers.categories()
+
+    wallet_index: Dict[Optional[str], int] = {}
+    asset_index: Dict[Optional[str], int] = {}
+    position_wallets = _unify(
+        position_arrays["wallet"], position_categories["wallet"], wallet_index
+    )
+    transfer_wallets = _unify(
+        transfer_arrays["wallet"], transfer_categories["wallet"], wallet_index
+    )
+    position_assets = _unify(
+        position_arrays["fungible_id"], position_categories["fungible_id"], asset_index
+    )
+    transfer_assets = _unify(
+        transfer_arrays["fungible_id"], transfer_categories["fungible_id"], asset_index
+    )
+    n_assets = len(asset_index)
+    shape = (len(wallet_index), n_assets)
+    size = shape[0] * n_assets
+
+    def total(keys: Any, weights: Any) -> Any:
+        return np.bincount(keys, weights=weights, minlength=size).reshape(shape)
+
+    directions = transfer_categories["direction"]
+    codes = transfer_arrays["direction"]
+    incoming = codes == (directions.index("in") if "in" in directions else -2)
+    outgoing = codes == (directions.index("out") if "out" in directions else -2)
+    quantity = np.nan_to_num(transfer_arrays["quantity"])
+    value = transfer_arrays["value"]
+    priced = ~np.isnan(value)
+    value = np.nan_to_num(value)
+    keys = transfer_wallets * n_assets + transfer_assets
+
+    bought = incoming & priced
+    buy_quantity = total(keys, np.where(bought, quantity, 0.0))
+    buy_cost = total(keys, np.where(bought, value, 0.0))
+    sold = outgoing & priced
+    sell_quantity = total(keys, np.where(sold, quantity, 0.0))
+    sell_value = total(keys, np.where(sold, value, 0.0))
+
+    position_keys = position_wallets * n_assets + position_assets
+    held_quantity = total(position_keys, np.nan_to_num(position_arrays["quantity"]))
+    held_value = total(position_keys, np.nan_to_num(position_arrays["value"]))
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cost_basis = np.where(buy_quantity > 0, buy_cost / buy_quantity, np.nan)
+    realized = np.where(sell_quantity > 0, sell_value - sell_quantity * cost_basis, 0.0)
+    unrealized = np.where(
+        held_quantity > 0, held_value - held_quantity * cost_basis, 0.0
+    )
+    return PnL(list(wallet_index), list(asset_index), cost_basis, realized, unrealized)
@@ -0,0 +1,81 @@
+"""Parallel backfill of transaction histories split into time windows."""
+import heapq
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .models import parse_timestamp
+
+Window = Tuple[float, float]
+
+
+def time_windows(start: float, end: float, count: int) -> List[Window]:
+    """Split a time range into equal, contiguous windows.
+
+    Args:
+        start: Range start as a Unix timestamp in seconds
+        end: Range end as a Unix timestamp in seconds
+        count: Number of windows
+
+    Returns:
+        List[Window]: ``(min, max)`` pairs, newest window first to match the
+        order of the transactions endpoint
+
+    Raises:
+        ValueError: If count is not positive or end is before start.
+    """
+    if count <= 0:
+        raise ValueError("count must be positive")
+    if end < start:
+        raise ValueError("end must not be before start")
+    step = (end - start) / count
+    bounds = [start + step * i for i in range(count)] + [end]
+    return [(bounds[i], bounds[i + 1]) for i in reversed(range(count))]
+
+
+def _sort_key(tx: Dict[str, Any]) -> float:
+    mined_at = parse_timestamp((tx.get("attributes") or {}).get("mined_at"))
+    return -(mined_at if mined_at is not None else float("-inf"))
+
+
+def merge_windows(windows: Iterable[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """Merge per-window transaction lists into one de-duplicated history.
+
+    Each list must already be ordered newest first, as returned by the API.
+    Transactions on a shared window boundary appear in both neighbours and
+    are kept once.
+
+    Args:
+        windows: Raw transactions of each window
+
+    Returns:
+        List[Dict[str, Any]]: Transactions ordered newest first
+    """
+    seen = set()
+    merged = []
+    for tx in heapq.merge(*windows, key=_sort_key):
+        tx_id = tx.get("id")
+        if tx_id in seen:
+            continue
+        seen.add(tx_id)
+        merged.append(tx)
+    return merged
+
+
+def window_params(
+    min_mined_at: Optional[float] = None,
+    max_mined_at: Optional[float] = None
+) -> Dict[str, int]:
+    """Build the mined_at filter parameters of the transactions endpoint.
+
+    Args:
+        min_mined_at: Oldest mined_at to include, as a Unix timestamp
+        max_mined_at: Newest mined_at to include, as a Unix timestamp
+
+    Returns:
+        Dict of query parameters, with timestamps in milliseconds
+    """
+    params = {}
+    if min_mined_at is not None:
+        params["filter[min_mined_at]"] = int(min_mined_at * 1000)
+    if max_mined_at is not None:
+        params["filter[max_mined_at]"] = int(max_mined_at * 1000)
+    return params
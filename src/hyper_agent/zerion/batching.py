@@ -0,0 +1,96 @@
+"""Micro-batching of concurrent single-key lookups."""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+
+class MicroBatcher:
+    """Coalesces concurrent single-key calls into batched calls.
+
+    Keys requested within ``window`` seconds of the first pending key are
+    fetched with one call to ``fetch_many``, or sooner once ``max_batch``
+    distinct keys are pending. Each caller receives the value for its key,
+    and every caller of a failed batch receives its exception::
+
+        batcher = MicroBatcher(token.get_token_prices, window=0.005)
+        prices = await asyncio.gather(*(batcher.get(i) for i in token_ids))
+    """
+
+    def __init__(
+        self,
+        fetch_many: Callable[[List[str]], Awaitable[Dict[str, Any]]],
+        window: float,
+        max_batch: int
+    ):
+        """Initialize the batcher.
+
+        Args:
+            fetch_many: Coroutine function taking a list of distinct keys and
+                returning values keyed by key; missing keys yield None
+            window: Seconds to wait for more keys after the first one
+            max_batch: Maximum number of keys per batch
+
+        Raises:
+            ValueError: If window is negative or max_batch is lower than 1.
+        """
+        if window < 0:
+            raise ValueError("window must not be negative")
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1")
+        self.fetch_many = fetch_many
+        self.window = window
+        self.max_batch = max_batch
+        self.batches = 0
+        self._pending: Dict[str, List["asyncio.Future[Any]"]] = {}
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set["asyncio.Task[None]"] = set()
+
+    async def get(self, key: str) -> Any:
+        """Get the value for one key as part of the next batch.
+
+        Args:
+            key: Key to look up
+
+        Returns:
+            The value ``fetch_many`` returned for the key, or None
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        waiters = self._pending.get(key)
+        if waiters is None:
+            waiters = self._pending[key] = []
+        waiters.append(future)
+        if len(self._pending) >= self.max_batch:
+            self.flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self.flush)
+        return await future
+
+    def flush(self) -> None:
+        """Start fetching the pending keys now."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        self.batches += 1
+        task = asyncio.ensure_future(self._run(pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, pending: Dict[str, List["asyncio.Future[Any]"]]) -> None:
+        try:
+            values = await self.fetch_many(list(pending))
+        except BaseException as exc:
+            for waiters in pending.values():
+                for future in waiters:
+                    if not future.done():
+                        future.set_exception(exc)
+            if not isinstance(exc, Exception):
+                raise
+            return
+        for key, waiters in pending.items():
+            value = values.get(key)
+            for future in waiters:
+                if not future.done():
+                    future.set_result(value)
@@ -0,0 +1,99 @@
+"""Bounded-concurrency bulk execution for Zerion requests."""
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, Optional
+
+from .constants import DEFAULT_BULK_CONCURRENCY
+
+
+class BulkResult:
+    """Outcome of one item in a bulk request.
+
+    Exactly one of ``value`` and ``error`` is set.
+    """
+
+    __slots__ = ("key", "value", "error")
+
+    def __init__(
+        self,
+        key: str,
+        value: Any = None,
+        error: Optional[BaseException] = None
+    ):
+        """Initialize the result.
+
+        Args:
+            key: Input the request was made for, e.g. a wallet address
+            value: Decoded response on success
+            error: Exception raised on failure
+        """
+        self.key = key
+        self.value = value
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """Whether the request succeeded."""
+        return self.error is None
+
+    def __repr__(self) -> str:
+        status = "ok" if self.ok else f"error={self.error!r}"
+        return f"BulkResult(key={self.key!r}, {status})"
+
+
+async def run_bulk(
+    keys: Iterable[str],
+    fetch: Callable[[str], Awaitable[Any]],
+    concurrency: int = DEFAULT_BULK_CONCURRENCY
+) -> AsyncIterator[BulkResult]:
+    """Run ``fetch`` for every key with at most ``concurrency`` in flight.
+
+    Keys are consumed lazily by a fixed pool of workers, so memory stays
+    bounded for very large inputs. Results are yielded as they complete, not
+    in input order. A failing key produces a result carrying its error and
+    does not stop the batch.
+
+    Args:
+        keys: Inputs to process, e.g. wallet addresses
+        fetch: Coroutine function called with each key
+        concurrency: Maximum number of concurrent calls
+
+    Yields:
+        BulkResult: One result per key
+
+    Raises:
+        ValueError: If concurrency is lower than 1.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    key_iter = iter(keys)
+    results: "asyncio.Queue[Optional[BulkResult]]" = asyncio.Queue(maxsize=concurrency)
+    iteration_errors = []
+
+    async def worker() -> None:
+        try:
+            for key in key_iter:
+                try:
+                    result = BulkResult(key, value=await fetch(key))
+                except Exception as exc:
+                    result = BulkResult(key, error=exc)
+                await results.put(result)
+        except Exception as exc:
+            # The keys iterable itself failed; surface it once all workers stop.
+            iteration_errors.append(exc)
+        await results.put(None)
+
+    workers = [asyncio.ensure_future(worker()) for _ in range(concurrency)]
+    running = len(workers)
+    try:
+        while running:
+            result = await results.get()
+            if result is None:
+                running -= 1
+            else:
+                yield result
+        if iteration_errors:
+            raise iteration_errors[0]
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
@@ -0,0 +1,241 @@
+"""Response caching for Zerion API requests."""
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
+from urllib.parse import urlencode
+
+from .constants import (
+    DEFAULT_CACHE_MAX_SIZE,
+    DEFAULT_CACHE_TTLS,
+    DEFAULT_REVALIDATE_ENDPOINTS,
+    DEFAULT_REVALIDATE_TTL,
+)
+from .endpoints import endpoint_name
+
+# Prefix of the keys under which revalidatable responses are stored
+REVALIDATE_KEY_PREFIX = "revalidate:"
+
+
+def make_cache_key(
+    method: str,
+    endpoint: str,
+    params: Optional[Mapping[str, Any]] = None
+) -> str:
+    """Build a cache key from a request's method, endpoint and parameters.
+
+    Parameters are sorted so that equivalent requests share a key.
+
+    Args:
+        method: HTTP method
+        endpoint: API endpoint path
+        params: Query parameters
+
+    Returns:
+        str: Cache key
+    """
+    key = f"{method.upper()} {endpoint}"
+    if params:
+        key += "?" + urlencode(sorted((k, str(v)) for k, v in params.items()))
+    return key
+
+
+class CacheStats:
+    """Counters describing cache effectiveness."""
+
+    __slots__ = ("hits", "misses", "evictions", "expirations", "revalidations")
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.revalidations = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups served from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def as_dict(self) -> Dict[str, float]:
+        """Return the counters as a plain dict."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "revalidations": self.revalidations,
+            "hit_ratio": self.hit_ratio,
+        }
+
+
+class CacheBackend:
+    """Interface for response cache backends.
+
+    Backends store decoded responses under string keys with a time-to-live.
+    Implement this class to plug in another store.
+    """
+
+    def __init__(self):
+        self.stats = CacheStats()
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Optional[Any]: The cached value, or None if missing or expired
+        """
+        raise NotImplementedError
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        """Store a value.
+
+        Args:
+            key: Cache key
+            value: Decoded response to store
+            ttl: Seconds until the value expires
+        """
+        raise NotImplementedError
+
+    async def delete(self, key: str) -> None:
+        """Remove a value if present.
+
+        Args:
+            key: Cache key
+        """
+        raise NotImplementedError
+
+    async def clear(self) -> None:
+        """Remove all values."""
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        """Release resources held by the backend."""
+
+
+class MemoryCache(CacheBackend):
+    """In-process cache with per-entry TTL and LRU eviction.
+
+    Cached responses are shared between callers and must be treated as
+    read-only.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_CACHE_MAX_SIZE):
+        """Initialize the cache.
+
+        Args:
+            max_size: Maximum number of entries kept before evicting the least
+                recently used one
+
+        Raises:
+            ValueError: If max_size is not positive.
+        """
+        super().__init__()
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return value
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        if ttl <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+
+
+class CachePolicy:
+    """Decides which requests are cached, for how long, and which are revalidated.
+
+    Responses of revalidated endpoints are kept for ``revalidate_ttl`` along
+    with their ``ETag`` and ``Last-Modified`` validators. Once the regular
+    TTL has passed the client sends a conditional request and, on
+    ``304 Not Modified``, serves the kept body instead of downloading it
+    again.
+    """
+
+    def __init__(
+        self,
+        ttls: Optional[Mapping[str, float]] = None,
+        default_ttl: Optional[float] = None,
+        revalidate: Optional[Iterable[str]] = None,
+        revalidate_ttl: float = DEFAULT_REVALIDATE_TTL
+    ):
+        """Initialize the cache policy.
+
+        Args:
+            ttls: Mapping of ENDPOINTS name (e.g. ``token_price``) to TTL in
+                seconds. Defaults to ``DEFAULT_CACHE_TTLS``.
+            default_ttl: TTL for endpoints not listed in ``ttls``; None means
+                such endpoints are not cached
+            revalidate: ENDPOINTS names using conditional requests. Defaults
+                to ``DEFAULT_REVALIDATE_ENDPOINTS``; pass ``()`` to disable.
+            revalidate_ttl: Seconds a revalidatable body and its validators
+                are kept after being fetched or revalidated
+        """
+        self.ttls = dict(DEFAULT_CACHE_TTLS if ttls is None else ttls)
+        self.default_ttl = default_ttl
+        self.revalidate = frozenset(
+            DEFAULT_REVALIDATE_ENDPOINTS if revalidate is None else revalidate
+        )
+        self.revalidate_ttl = revalidate_ttl
+
+    def ttl_for(self, method: str, endpoint: str) -> Optional[float]:
+        """Get the TTL for a request.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint path
+
+        Returns:
+            Optional[float]: TTL in seconds, or None if the request is not cacheable
+        """
+        if method.upper() != "GET":
+            return None
+        name = endpoint_name(endpoint)
+        if name is not None and name in self.ttls:
+            return self.ttls[name]
+        return self.default_ttl
+
+    def revalidates(self, method: str, endpoint: str) -> bool:
+        """Whether a request uses conditional revalidation.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint path
+
+        Returns:
+            bool: True for GET requests to a revalidated endpoint
+        """
+        if method.upper() != "GET":
+            return False
+        return endpoint_name(endpoint) in self.revalidate
@@ -1,20 +1,140 @@
-"""Command-line interface for Zerion SDK."""
+"""Command-line interface for Zerion SDK.
 
-import asyncio
-import click
-from typing import Optional
+Startup matters for scripted use, so this module only imports click and
+the constants at import time. aiohttp, the endpoint clients and the
+``.env`` file are loaded inside the commands that need them, which keeps
+``zerion --help`` fast (see ``benchmarks/startup.py``).
+"""
 
-from .client import ZerionClient
-from .wallet import ZerionWallet
-from .token import ZerionToken
-from .protocol import ZerionProtocol
-from .constants import require_zerion_api_key
+import json
+import click
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Dict,
+    Iterator,
+    Optional,
+    Tuple,
+)
+
+from .constants import (
+    CACHE_PATH_ENV_VAR,
+    DEFAULT_BULK_CONCURRENCY,
+    DEFAULT_WATCH_BACKOFF,
+    DEFAULT_WATCH_MAX_INTERVAL,
+    DEFAULT_WATCH_MIN_INTERVAL,
+    require_zerion_api_key,
+)
+
+if TYPE_CHECKING:
+    from .bulk import BulkResult
+    from .client import ZerionClient
+
+
+def make_client() -> "ZerionClient":
+    """Create a client configured from the root command's options."""
+    from .client import ZerionClient
+
+    ctx = click.get_current_context(silent=True)
+    options = (ctx.find_root().obj if ctx else None) or {}
+    # The client owns a cache it builds from cache_path and closes it.
+    return ZerionClient(
+        api_key=require_zerion_api_key(), cache_path=options.get("cache_path")
+    )
+
+
+def run(coroutine: Awaitable[Any]) -> Any:
+    """Run a command's coroutine to completion on a new event loop."""
+    import asyncio
+
+    return asyncio.run(coroutine)
+
+
+def read_addresses(stream: IO[str]) -> Iterator[str]:
+    """Read one address per line, skipping blank lines and # comments."""
+    for line in stream:
+        address = line.strip()
+        if address and not address.startswith("#"):
+            yield address
+
+
+def bulk_result_record(result: "BulkResult") -> Dict[str, Any]:
+    """Convert a bulk result into a JSON-serializable NDJSON record."""
+    if result.ok:
+        return {"address": result.key, "data": result.value}
+    return {
+        "address": result.key,
+        "error": str(result.error),
+        "status": getattr(result.error, "status", None),
+    }
+
+
+def batch_options(command):
+    """Add an optional ADDRESS argument plus batch mode options to a command."""
+    command = click.option(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_BULK_CONCURRENCY,
+        show_default=True,
+        help="Maximum concurrent requests in batch mode",
+    )(command)
+    command = click.option(
+        "--from-file",
+        type=click.File("r"),
+        help="Read addresses from a file ('-' for stdin); prints NDJSON results",
+    )(command)
+    return click.argument("address", required=False)(command)
+
+
+def run_wallet_command(
+    address: Optional[str],
+    from_file: Optional[IO[str]],
+    concurrency: int,
+    method: str
+) -> None:
+    """Run a ZerionWallet method for one address or for every address in a file.
+
+    In batch mode all addresses share one client and one event loop, and each
+    result is printed as soon as it arrives. The exit code is 1 if any
+    address failed.
+    """
+    if (address is None) == (from_file is None):
+        raise click.UsageError("Provide either ADDRESS or --from-file.")
+    from .wallet import ZerionWallet
+
+    async def _run() -> int:
+        async with make_client() as client:
+            wallet_client = ZerionWallet(client)
+            fetch = getattr(wallet_client, method)
+            if from_file is None:
+                click.echo(await fetch(address))
+                return 0
+            failures = 0
+            async for result in wallet_client.get_many(
+                read_addresses(from_file), fetch, concurrency
+            ):
+                failures += not result.ok
+                click.echo(json.dumps(bulk_result_record(result)))
+            return failures
+
+    if run(_run()):
+        raise SystemExit(1)
 
 
 @click.group()
-def cli():
+@click.option(
+    "--cache",
+    "cache_path",
+    type=click.Path(dir_okay=False),
+    envvar=CACHE_PATH_ENV_VAR,
+    help=f"SQLite file used as a persistent response cache (env: {CACHE_PATH_ENV_VAR})",
+)
+@click.pass_context
+def cli(ctx: click.Context, cache_path: Optional[str]):
     """Zerion SDK CLI."""
-    pass
+    ctx.obj = {"cache_path": cache_path}
 
 
 @cli.group()
@@ -24,70 +144,150 @@ def wallet():
 
 
 @wallet.command()
-@click.argument("address")
-def info(address: str):
+@batch_options
+def info(address: Optional[str], from_file: Optional[IO[str]], concurrency: int):
     """Get wallet information."""
-    async def _run():
-        client = ZerionClient(api_key=require_zerion_api_key())
-        wallet_client = ZerionWallet(client)
-        info = await wallet_client.get_wallet_info(address)
-        click.echo(info)
-
-    asyncio.run(_run())
+    run_wallet_command(address, from_file, concurrency, "get_wallet_info")
 
 
 @wallet.command()
-@click.argument("address")
-def balances(address: str):
+@batch_options
+def balances(address: Optional[str], from_file: Optional[IO[str]], concurrency: int):
     """Get wallet balances."""
-    async def _run():
-        client = ZerionClient(api_key=require_zerion_api_key())
-        wallet_client = ZerionWallet(client)
-        balances = await wallet_client.get_wallet_balances(address)
-        click.echo(balances)
-
-    asyncio.run(_run())
+    run_wallet_command(address, from_file, concurrency, "get_wallet_balances")
 
 
 @wallet.command()
 @click.argument("address")
 @click.option("--limit", type=int, help="Maximum number of transactions to return")
 @click.option("--cursor", help="Pagination cursor")
-def transactions(address: str, limit: Optional[int], cursor: Optional[str]):
+@click.option("--all", "fetch_all", is_flag=True, help="Follow pagination and print every transaction")
+@click.option("--max-items", type=int, help="Stop after this many transactions (with --all)")
+def transactions(
+    address: str,
+    limit: Optional[int],
+    cursor: Optional[str],
+    fetch_all: bool,
+    max_items: Optional[int]
+):
     """Get wallet transactions."""
+    from .wallet import ZerionWallet
+
     async def _run():
-        client = ZerionClient(api_key=require_zerion_api_key())
-        wallet_client = ZerionWallet(client)
-        transactions = await wallet_client.get_wallet_transactions(address, limit, cursor)
-        click.echo(transactions)
+        async with make_client() as client:
+            wallet_client = ZerionWallet(client)
+            if fetch_all:
+                async for transaction in wallet_client.iter_transactions(
+                    address, page_size=limit, max_items=max_items
+                ):
+                    click.echo(transaction)
+                return
+            transactions = await wallet_client.get_wallet_transactions(address, limit, cursor)
+            click.echo(transactions)
 
-    asyncio.run(_run())
+    run(_run())
 
 
 @wallet.command()
-@click.argument("address")
-def protocols(address: str):
+@batch_options
+def protocols(address: Optional[str], from_file: Optional[IO[str]], concurrency: int):
     """Get wallet protocols."""
-    async def _run():
-        client = ZerionClient(api_key=require_zerion_api_key())
-        wallet_client = ZerionWallet(client)
-        protocols = await wallet_client.get_wallet_protocols(address)
-        click.echo(protocols)
-
-    asyncio.run(_run())
+    run_wallet_command(address, from_file, concurrency, "get_wallet_protocols")
 
 
 @wallet.command()
-@click.argument("address")
-def portfolio(address: str):
+@batch_options
+def portfolio(address: Optional[str], from_file: Optional[IO[str]], concurrency: int):
     """Get wallet portfolio."""
-    async def _run():
-        client = ZerionClient(api_key=require_zerion_api_key())
-        wallet_client = ZerionWallet(client)
-        portfolio = await wallet_client.get_wallet_portfolio(address)
-        click.echo(portfolio)
-
-    asyncio.run(_run())
+    run_wallet_command(address, from_file, concurrency, "get_wallet_portfolio")
+
+
+@cli.command()
+@click.argument("addresses", nargs=-1)
+@click.option(
+    "--from-file",
+    type=click.File("r"),
+    help="Also watch the addresses in a file ('-' for stdin)",
+)
+@click.option(
+    "--min-interval",
+    type=float,
+    default=DEFAULT_WATCH_MIN_INTERVAL,
+    show_default=True,
+    help="Seconds between polls of a wallet that just changed",
+)
+@click.option(
+    "--max-interval",
+    type=float,
+    default=DEFAULT_WATCH_MAX_INTERVAL,
+    show_default=True,
+    help="Longest interval in seconds between polls of a dormant wallet",
+)
+@click.option(
+    "--backoff",
+    type=float,
+    default=DEFAULT_WATCH_BACKOFF,
+    show_default=True,
+    help="Interval growth factor after a poll without changes",
+)
+@click.option("--budget", type=float, help="Maximum polls per second overall")
+@click.option(
+    "--concurrency",
+    type=int,
+    default=DEFAULT_BULK_CONCURRENCY,
+    show_default=True,
+    help="Maximum concurrent polls",
+)
+@click.option("--max-events", type=int, help="Exit after printing this many events")
+def watch(
+    addresses: Tuple[str, ...],
+    from_file: Optional[IO[str]],
+    min_interval: float,
+    max_interval: float,
+    backoff: float,
+    budget: Optional[float],
+    concurrency: int,
+    max_events: Optional[int]
+):
+    """Watch wallets' positions and print change events as NDJSON.
+
+    Each wallet is polled on its own interval, which shrinks to
+    --min-interval when its holdings change and grows by --backoff while
+    they do not.
+    """
+    from .wallet import ZerionWallet
+    from .watch import Watcher, WatchPolicy
+
+    watchlist = list(addresses)
+    if from_file is not None:
+        watchlist.extend(read_addresses(from_file))
+    if not watchlist:
+        raise click.UsageError("Provide ADDRESSES or --from-file.")
+    try:
+        policy = WatchPolicy(min_interval, max_interval, backoff)
+    except ValueError as exc:
+        raise click.BadParameter(str(exc))
+
+    async def _run() -> None:
+        async with make_client() as client:
+            watcher = Watcher(
+                ZerionWallet(client), watchlist, policy, budget, concurrency
+            )
+            events = watcher.events()
+            printed = 0
+            try:
+                async for event in events:
+                    click.echo(json.dumps(event.as_dict()))
+                    printed += 1
+                    if max_events is not None and printed >= max_events:
+                        return
+            finally:
+                await events.aclose()
+
+    try:
+        run(_run())
+    except KeyboardInterrupt:
+        pass
 
 
 @cli.group()
@@ -100,52 +300,75 @@ def token():
 @click.argument("token_id")
 def info(token_id: str):
     """Get token information."""
+    from .token import ZerionToken
+
     async def _run():
-        client = ZerionClient(api_key=require_zerion_api_key())
-        token_client = ZerionToken(client)
-        info = await token_client.get_token_info(token_id)
-        click.echo(info)
+        async with make_client() as client:
+            token_client = ZerionToken(client)
+            info = await token_client.get_token_info(token_id)
+            click.echo(info)
 
-    asyncio.run(_run())
+    run(_run())
 
 
 @token.command()
 @click.argument("token_id")
 def price(token_id: str):
     """Get token price."""
+    from .token import ZerionToken
+
     async def _run():
-        client = ZerionClient(api_key=require_zerion_api_key())
-        token_client = ZerionToken(client)
-        price = await token_client.get_token_price(token_id)
-        click.echo(price)
+        async with make_client() as client:
+            token_client = ZerionToken(client)
+            price = await token_client.get_token_price(token_id)
+            click.echo(price)
 
-    asyncio.run(_run())
+    run(_run())
+
+
+@token.command()
+@click.argument("token_ids", nargs=-1, required=True)
+def prices(token_ids: Tuple[str, ...]):
+    """Get the prices of many tokens in batched requests."""
+    from .token import ZerionToken
+
+    async def _run():
+        async with make_client() as client:
+            token_client = ZerionToken(client)
+            prices = await token_client.get_token_prices(token_ids)
+            click.echo(json.dumps(prices))
+
+    run(_run())
 
 
 @token.command()
 @click.argument("token_id")
 def holders(token_id: str):
     """Get token holders."""
+    from .token import ZerionToken
+
     async def _run():
-        client = ZerionClient(api_key=require_zerion_api_key())
-        token_client = ZerionToken(client)
-        holders = await token_client.get_token_holders(token_id)
-        click.echo(holders)
+        async with make_client() as client:
+            token_client = ZerionToken(client)
+            holders = await token_client.get_token_holders(token_id)
+            click.echo(holders)
 
-    asyncio.run(_run())
+    run(_run())
 
 
 @token.command()
 @click.argument("token_id")
 def transactions(token_id: str):
     """Get token transactions."""
+    from .token import ZerionToken
+
     async def _run():
-        client = ZerionClient(api_key=require_zerion_api_key())
-        token_client = ZerionToken(client)
-        transactions = await token_client.get_token_transactions(token_id)
-        click.echo(transactions)
+        async with make_client() as client:
+            token_client = ZerionToken(client)
+            transactions = await token_client.get_token_transactions(token_id)
+            click.echo(transactions)
 
-    asyncio.run(_run())
+    run(_run())
 
 
 @cli.group()
@@ -158,52 +381,60 @@ def protocol():
 @click.argument("protocol_id")
 def info(protocol_id: str):
     """Get protocol information."""
+    from .protocol import ZerionProtocol
+
     async def _run():
-        client = ZerionClient(api_key=require_zerion_api_key())
-        protocol_client = ZerionProtocol(client)
-        info = await protocol_client.get_protocol_info(protocol_id)
-        click.echo(info)
+        async with make_client() as client:
+            protocol_client = ZerionProtocol(client)
+            info = await protocol_client.get_protocol_info(protocol_id)
+            click.echo(info)
 
-    asyncio.run(_run())
+    run(_run())
 
 
 @protocol.command()
 @click.argument("protocol_id")
 def pools(protocol_id: str):
     """Get protocol pools."""
+    from .protocol import ZerionProtocol
+
     async def _run():
-        client = ZerionClient(api_key=require_zerion_api_key())
-        protocol_client = ZerionProtocol(client)
-        pools = await protocol_client.get_protocol_pools(protocol_id)
-        click.echo(pools)
+        async with make_client() as client:
+            protocol_client = ZerionProtocol(client)
+            pools = await protocol_client.get_protocol_pools(protocol_id)
+            click.echo(pools)
 
-    asyncio.run(_run())
+    run(_run())
 
 
 @protocol.command()
 @click.argument("protocol_id")
 def tokens(protocol_id: str):
     """Get protocol tokens."""
+    from .protocol import ZerionProtocol
+
     async def _run():
-        client = ZerionClient(api_key=require_zerion_api_key())
-        protocol_client = ZerionProtocol(client)
-        tokens = await protocol_client.get_protocol_tokens(protocol_id)
-        click.echo(tokens)
+        async with make_client() as client:
+            protocol_client = ZerionProtocol(client)
+            tokens = await protocol_client.get_protocol_tokens(protocol_id)
+            click.echo(tokens)
 
-    asyncio.run(_run())
+    run(_run())
 
 
 @protocol.command()
 @click.argument("protocol_id")
 def stats(protocol_id: str):
     """Get protocol statistics."""
+    from .protocol import ZerionProtocol
+
     async def _run():
-        client = ZerionClient(api_key=require_zerion_api_key())
-        protocol_client = ZerionProtocol(client)
-        stats = await protocol_client.get_protocol_stats(protocol_id)
-        click.echo(stats)
+        async with make_client() as client:
+            protocol_client = ZerionProtocol(client)
+            stats = await protocol_client.get_protocol_stats(protocol_id)
+            click.echo(stats)
 
-    asyncio.run(_run())
+    run(_run())
 
 
 if __name__ == "__main__":
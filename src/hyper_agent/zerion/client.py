@@ -1,19 +1,99 @@
 """Base client for Zerion API interactions."""
 import aiohttp
+import asyncio
 import base64
-from typing import Any, Dict, Optional
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
 
-from .constants import API_BASE_URL_ENV_VAR, API_KEY_ENV_VAR, HEADERS
-from ..config import require_env_var
+from .cache import (
+    REVALIDATE_KEY_PREFIX,
+    CacheBackend,
+    CachePolicy,
+    make_cache_key,
+)
+from .constants import (
+    API_BASE_URL_ENV_VAR,
+    API_KEY_ENV_VAR,
+    CACHE_PATH_ENV_VAR,
+    DEFAULT_DNS_CACHE_TTL,
+    DEFAULT_KEEPALIVE_TIMEOUT,
+    DEFAULT_POOL_SIZE,
+    DEFAULT_POOL_SIZE_PER_HOST,
+    HEADERS,
+    RATE_LIMIT_BURST_ENV_VAR,
+    RATE_LIMIT_ENV_VAR,
+)
+from .decoding import ResponseDecoder
+from .exceptions import ZerionAPIError, ZerionRateLimitError
+from .instrumentation import Instrumentation
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy, parse_retry_after
+from .sqlite_cache import SQLiteCache
+from ..config import get_env_var, require_env_var
 
 class ZerionClient:
-    """Client for interacting with the Zerion API."""
+    """Client for interacting with the Zerion API.
 
-    def __init__(self, api_key: Optional[str] = None):
+    The client owns a single long-lived ``aiohttp.ClientSession`` so that
+    connections, TLS sessions and DNS lookups are reused across requests.
+    The session stays open until the client is closed, so always use the
+    client as an async context manager or call :meth:`close` when done;
+    otherwise its pooled connections leak::
+
+        async with ZerionClient(api_key=key) as client:
+            wallet = ZerionWallet(client)
+            await wallet.get_wallet_portfolio(address)
+
+    A client may be reused across event loops, e.g. several ``asyncio.run``
+    calls; the session is rebuilt for each new loop. Blocking code should
+    prefer ``ZerionSyncClient``, which keeps one loop and session alive.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        *,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        pool_size_per_host: int = DEFAULT_POOL_SIZE_PER_HOST,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+        dns_cache_ttl: Optional[int] = DEFAULT_DNS_CACHE_TTL,
+        session: Optional[aiohttp.ClientSession] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[CacheBackend] = None,
+        cache_path: Optional[str] = None,
+        cache_policy: Optional[CachePolicy] = None,
+        coalesce_requests: bool = True,
+        decoder: Optional[ResponseDecoder] = None,
+        instrumentation: Optional[Instrumentation] = None
+    ):
         """Initialize the Zerion client.
 
         Args:
             api_key: The Zerion API key. If not provided, will be loaded from environment.
+            pool_size: Maximum number of simultaneous connections (0 for no limit)
+            pool_size_per_host: Maximum connections per host (0 for no limit)
+            keepalive_timeout: Seconds an idle connection is kept open for reuse
+            dns_cache_ttl: Seconds resolved hosts are cached (None caches forever)
+            session: Externally managed session to use instead of creating one.
+                The client never closes a session it did not create.
+            retry_policy: Retry policy applied by :meth:`request`. Defaults to
+                ``RetryPolicy()``; pass ``RetryPolicy(max_attempts=1)`` to disable.
+            rate_limiter: Limiter every request waits on before being sent.
+                Defaults to one built from ``ZERION_RATE_LIMIT`` (requests per
+                second) and ``ZERION_RATE_LIMIT_BURST`` when set, else no limit.
+            cache: Response cache backend, e.g. ``MemoryCache()``. Defaults to a
+                ``SQLiteCache`` at ``cache_path`` or ``ZERION_CACHE_PATH`` when
+                set, else no caching.
+            cache_path: SQLite file of the default cache, used when no
+                ``cache`` is passed. The client closes caches it creates.
+            cache_policy: Per-endpoint TTLs used with ``cache``. Defaults to ``CachePolicy()``.
+            coalesce_requests: Share one in-flight request between concurrent
+                identical GET calls instead of sending duplicates.
+            decoder: Response body decoder. Defaults to ``ResponseDecoder()``,
+                which picks the fastest installed JSON library.
+            instrumentation: Collects per-endpoint request metrics. Its trace
+                config is installed on the session the client creates.
 
         Raises:
             ValueError: If no API key is provided or found in environment.
@@ -34,13 +114,126 @@ class ZerionClient:
             "Authorization": f"Basic {base64_auth}"
         }
 
+        self.pool_size = pool_size
+        self.pool_size_per_host = pool_size_per_host
+        self.keepalive_timeout = keepalive_timeout
+        self.dns_cache_ttl = dns_cache_ttl
+        self._session = session
+        self._owns_session = session is None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy()
+        if rate_limiter is None:
+            rate_limiter = self._rate_limiter_from_env()
+        self.rate_limiter = rate_limiter
+        self._owns_cache = cache is None
+        if cache is None:
+            cache_path = cache_path or get_env_var(CACHE_PATH_ENV_VAR)
+            cache = SQLiteCache(cache_path) if cache_path else None
+        self.cache = cache
+        self.cache_policy = cache_policy if cache_policy is not None else CachePolicy()
+        self.coalesce_requests = coalesce_requests
+        self._inflight: Dict[str, "asyncio.Future[Dict[str, Any]]"] = {}
+        self.decoder = decoder if decoder is not None else ResponseDecoder()
+        self.instrumentation = instrumentation
+
+    async def __aenter__(self) -> "ZerionClient":
+        await self._get_session()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    @property
+    def closed(self) -> bool:
+        """Whether the underlying session has been closed or never opened."""
+        return self._session is None or self._session.closed
+
+    @staticmethod
+    def _rate_limiter_from_env() -> Optional[RateLimiter]:
+        """Build a rate limiter from environment variables, if configured."""
+        rate = get_env_var(RATE_LIMIT_ENV_VAR)
+        if not rate:
+            return None
+        burst = get_env_var(RATE_LIMIT_BURST_ENV_VAR)
+        return RateLimiter(float(rate), float(burst) if burst else None)
+
+    def _create_connector(self) -> aiohttp.TCPConnector:
+        """Create the pooled connector backing the session."""
+        return aiohttp.TCPConnector(
+            limit=self.pool_size,
+            limit_per_host=self.pool_size_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            use_dns_cache=True,
+            ttl_dns_cache=self.dns_cache_ttl,
+        )
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared session, creating it on first use.
+
+        A session is bound to the event loop it was created in. When the
+        client is used from another loop, e.g. by a second ``asyncio.run``
+        call, a session the client created is replaced with a new one.
+
+        Raises:
+            RuntimeError: If the session passed in by the caller belongs to
+                another event loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is not None and self._session_loop not in (None, loop):
+            if not self._owns_session:
+                raise RuntimeError(
+                    "The session passed to ZerionClient belongs to another event "
+                    "loop; create the session in the loop that uses the client"
+                )
+            await self._discard_session()
+        if self._session is None or (self._owns_session and self._session.closed):
+            trace_configs = None
+            if self.instrumentation is not None:
+                trace_configs = [self.instrumentation.trace_config()]
+            self._session = aiohttp.ClientSession(
+                connector=self._create_connector(), trace_configs=trace_configs
+            )
+            self._owns_session = True
+        self._session_loop = loop
+        return self._session
+
+    async def _discard_session(self) -> None:
+        """Drop the owned session of a previous event loop."""
+        session, loop = self._session, self._session_loop
+        self._session = None
+        if session is None or session.closed:
+            return
+        if loop is not None and loop.is_running():
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+        else:
+            # The loop is gone and its connections with it; closing the
+            # session only releases the pool.
+            await session.close()
+
+    async def close(self) -> None:
+        """Close the underlying session and release pooled connections.
+
+        A cache created by the client from ``ZERION_CACHE_PATH`` is closed too;
+        caches passed in by the caller are left open.
+        """
+        if self.cache is not None and self._owns_cache:
+            await self.cache.close()
+            self.cache = None
+        if self._session is not None and self._owns_session and not self._session.closed:
+            await self._session.close()
+        if self._owns_session:
+            self._session = None
+        self._session_loop = None
+
     async def _request(
         self,
         method: str,
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
-        data: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, Any]:
+        data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        validators: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
         """Make an API request.
 
         Args:
@@ -48,51 +241,238 @@ class ZerionClient:
             endpoint: API endpoint path
             params: Query parameters
             data: Request body data
+            headers: Extra request headers, e.g. conditional request headers
+            validators: Dict filled with the response's ``etag`` and
+                ``last_modified`` validators and ``status``
 
         Returns:
-            Dict[str, Any]: API response data
+            Dict[str, Any]: API response data, or None for a
+            ``304 Not Modified`` response to a conditional request
 
         Raises:
-            Exception: If the API request fails
+            ZerionRateLimitError: If the API responds with HTTP 429
+            ZerionAPIError: If the API responds with any other non-200 status
         """
         url = f"{self.base_url}{endpoint}"
-        async with aiohttp.ClientSession() as session:
+        session = await self._get_session()
+        record = None
+        if self.instrumentation is not None:
+            record = self.instrumentation.start(method, endpoint)
+        try:
             async with session.request(
                 method,
                 url,
-                headers=self.headers,
+                headers={**self.headers, **headers} if headers else self.headers,
                 params=params,
-                json=data
+                json=data,
+                trace_request_ctx=record
             ) as response:
+                if record is not None:
+                    record.status = response.status
+                if validators is not None:
+                    validators["status"] = response.status
+                    validators["etag"] = response.headers.get("ETag")
+                    validators["last_modified"] = response.headers.get("Last-Modified")
+                    if response.status == 304:
+                        return None
                 if response.status == 429:
                     retry_after = response.headers.get("Retry-After", "unknown")
-                    raise Exception(f"Rate limit exceeded. Retry after {retry_after} seconds")
+                    raise ZerionRateLimitError(
+                        f"Rate limit exceeded. Retry after {retry_after} seconds",
+                        status=429,
+                        retry_after=parse_retry_after(response.headers.get("Retry-After"))
+                    )
 
+                body = await response.read()
+                if record is not None:
+                    record.bytes = len(body)
                 if response.status != 200:
-                    error_data = await response.json()
-                    raise ValueError(f"API request failed: {error_data}")
+                    try:
+                        error_data = await self.decoder.decode(body)
+                    except Exception:
+                        error_data = body.decode("utf-8", "replace")
+                    raise ZerionAPIError(
+                        f"API request failed: {error_data}",
+                        status=response.status,
+                        data=error_data,
+                        retry_after=parse_retry_after(response.headers.get("Retry-After"))
+                    )
 
-                return await response.json()
+                return await self.decoder.decode(body)
+        except BaseException as exc:
+            if record is not None and record.status is None:
+                record.error = type(exc).__name__
+            raise
+        finally:
+            if record is not None:
+                self.instrumentation.finish(record)
 
     async def request(
         self,
         method: str,
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
-        data: Optional[Dict[str, Any]] = None
+        data: Optional[Dict[str, Any]] = None,
+        use_cache: bool = True
     ) -> Dict[str, Any]:
         """Make an API request with retries.
 
+        Cacheable requests are answered from :attr:`cache` when a fresh entry
+        exists, and stored there on success. Endpoints the cache policy
+        revalidates keep their body and validators past the TTL and are then
+        refreshed with a conditional request, reusing the body on 304.
+        Concurrent identical GET requests share a single in-flight call when
+        :attr:`coalesce_requests` is set, and every caller receives the same
+        decoded response. Every attempt first waits on
+        :attr:`rate_limiter`, if any. Transient failures (429, 5xx, connection
+        errors) are retried according to :attr:`retry_policy`.
+
         Args:
             method: HTTP method (GET, POST, etc.)
             endpoint: API endpoint path
             params: Query parameters
             data: Request body data
+            use_cache: Set to False to bypass the cache for this call
 
         Returns:
             Dict[str, Any]: API response data
 
         Raises:
-            Exception: If the API request fails
+            ZerionAPIError: If the API request fails after all retries
+            aiohttp.ClientError: If the connection fails after all retries
         """
-        return await self._request(method, endpoint, params, data)
\ No newline at end of file
+        ttl = None
+        if use_cache and self.cache is not None and data is None:
+            ttl = self.cache_policy.ttl_for(method, endpoint)
+        key = make_cache_key(method, endpoint, params)
+        revalidate = ttl is not None and self.cache_policy.revalidates(method, endpoint)
+        entry = None
+        if revalidate:
+            entry = await self.cache.get(REVALIDATE_KEY_PREFIX + key)
+            if entry is not None and entry["fresh_until"] > time.time():
+                return entry["body"]
+        elif ttl is not None:
+            cached = await self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        async def fetch() -> Dict[str, Any]:
+            if revalidate:
+                return await self._revalidate(method, endpoint, params, key, ttl, entry)
+            result = await self._retrying_request(method, endpoint, params, data)
+            if ttl is not None:
+                await self.cache.set(key, result, ttl)
+            return result
+
+        if self.coalesce_requests and method.upper() == "GET" and data is None:
+            return await self._coalesce(key, fetch)
+        return await fetch()
+
+    async def _revalidate(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        key: str,
+        ttl: float,
+        entry: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Fetch a revalidated endpoint, conditionally when an entry is cached.
+
+        The cache entry holds the body, its ``ETag``/``Last-Modified``
+        validators and the time it stops being fresh. A stale entry is
+        revalidated with ``If-None-Match``/``If-Modified-Since`` and its body
+        reused when the API answers ``304 Not Modified``.
+        """
+        headers = {}
+        if entry is not None:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        validators: Dict[str, Any] = {}
+        body = await self._retrying_request(
+            method, endpoint, params, headers=headers or None, validators=validators
+        )
+        if body is None:
+            if entry is None:
+                raise ZerionAPIError(
+                    "API returned 304 Not Modified without a cached body", status=304
+                )
+            body = entry["body"]
+            self.cache.stats.revalidations += 1
+            validators["etag"] = validators["etag"] or entry.get("etag")
+            validators["last_modified"] = (
+                validators["last_modified"] or entry.get("last_modified")
+            )
+        entry = {
+            "body": body,
+            "etag": validators["etag"],
+            "last_modified": validators["last_modified"],
+            "fresh_until": time.time() + ttl,
+        }
+        has_validators = entry["etag"] or entry["last_modified"]
+        await self.cache.set(
+            REVALIDATE_KEY_PREFIX + key,
+            entry,
+            self.cache_policy.revalidate_ttl if has_validators else ttl
+        )
+        return body
+
+    async def _coalesce(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """Run ``fetch`` once for all concurrent callers using the same key.
+
+        The shared call runs in its own task, so a cancelled caller does not
+        cancel the request for the others.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._inflight[key] = task
+
+            def _done(finished: "asyncio.Future[Dict[str, Any]]") -> None:
+                if self._inflight.get(key) is finished:
+                    del self._inflight[key]
+                if not finished.cancelled():
+                    # Mark the exception retrieved even if every caller left.
+                    finished.exception()
+
+            task.add_done_callback(_done)
+        return await asyncio.shield(task)
+
+    async def _retrying_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        **kwargs: Any
+    ) -> Optional[Dict[str, Any]]:
+        """Make an API request, retrying according to the retry policy."""
+        return await self.retry_policy.call(
+            method,
+            lambda: self._limited_request(method, endpoint, params, data, **kwargs)
+        )
+
+    async def _limited_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        **kwargs: Any
+    ) -> Optional[Dict[str, Any]]:
+        """Make a single API request paced by the rate limiter."""
+        if self.rate_limiter is None:
+            return await self._request(method, endpoint, params, data, **kwargs)
+        await self.rate_limiter.acquire(endpoint)
+        try:
+            return await self._request(method, endpoint, params, data, **kwargs)
+        except ZerionRateLimitError as exc:
+            if exc.retry_after:
+                self.rate_limiter.pause(exc.retry_after, endpoint)
+            raise
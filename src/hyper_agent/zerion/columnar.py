@@ -0,0 +1,352 @@
+"""Columnar conversion of positions and transactions to NumPy arrays.
+
+Builders accumulate records into typed, contiguous buffers while pages
+stream in, so analysis starts from arrays rather than lists of dicts::
+
+    columns = TransactionColumns()
+    await columns.aextend(wallet.iter_transactions(address))
+    arrays = columns.to_arrays()
+    columns.to_npz("transactions.npz")
+
+Numeric columns are ``float64`` with NaN for missing values, timestamps are
+``int64`` Unix seconds with ``NULL_TIMESTAMP`` (NaT when viewed as
+``datetime64[s]``) for missing values, and repetitive strings such as chains,
+types and symbols are stored as ``int32`` codes into a category list, with
+-1 for missing values. NumPy is only needed to produce arrays; install it
+with the ``analytics`` extra.
+"""
+import csv
+import math
+from array import array
+from typing import (
+    IO,
+    Any,
+    AsyncIterable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .models import Position, Transaction
+
+NULL_TIMESTAMP = -(2 ** 63)
+
+
+def _require_numpy() -> Any:
+    try:
+        import numpy
+    except ImportError as error:
+        raise ImportError(
+            "NumPy is required for columnar export; "
+            "install it with `pip install hyper-agent[analytics]`"
+        ) from error
+    return numpy
+
+
+class Categorical:
+    """Dictionary-encoded string column."""
+
+    __slots__ = ("codes", "categories", "_index")
+
+    def __init__(self):
+        self.codes = array("i")
+        self.categories: List[str] = []
+        self._index: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def append(self, value: Optional[str]) -> None:
+        """Append a value, assigning a new code on first sight."""
+        if value is None:
+            self.codes.append(-1)
+            return
+        code = self._index.get(value)
+        if code is None:
+            code = self._index[value] = len(self.categories)
+            self.categories.append(value)
+        self.codes.append(code)
+
+    def decode(self, code: int) -> Optional[str]:
+        """Get the string for a code, or None for -1."""
+        return self.categories[code] if code >= 0 else None
+
+
+class ColumnBuilder:
+    """Base class for incremental column builders.
+
+    Subclasses declare ``_schema`` as ``(column, kind)`` pairs, where kind
+    is ``float``, ``timestamp``, ``int``, ``category`` or ``str``, and
+    implement ``_row`` to extract those values from a model (or ``_rows``
+    when a record yields several rows). Every builder
+    also has a leading categorical ``wallet`` column, so records of many
+    wallets can share one set of arrays.
+    """
+
+    _schema: Tuple[Tuple[str, str], ...] = ()
+    _model: Any = None
+
+    def __init__(self):
+        self.schema = (("wallet", "category"),) + self._schema
+        self._columns: Dict[str, Any] = {}
+        for name, kind in self.schema:
+            if kind == "float":
+                self._columns[name] = array("d")
+            elif kind in ("timestamp", "int"):
+                self._columns[name] = array("q")
+            elif kind == "category":
+                self._columns[name] = Categorical()
+            else:
+                self._columns[name] = []
+
+    def __len__(self) -> int:
+        return len(self._columns["wallet"])
+
+    def _row(self, item: Any) -> Tuple[Any, ...]:
+        raise NotImplementedError
+
+    def _rows(self, item: Any) -> Iterable[Tuple[Any, ...]]:
+        yield self._row(item)
+
+    def append(
+        self,
+        item: Union[Dict[str, Any], Any],
+        wallet: Optional[str] = None
+    ) -> None:
+        """Append one record.
+
+        Args:
+            item: Raw JSON:API resource or the matching model
+            wallet: Address the record belongs to
+        """
+        if isinstance(item, dict):
+            item = self._model.from_json(item)
+        for row in self._rows(item):
+            for (name, kind), value in zip(self.schema, (wallet,) + row):
+                column = self._columns[name]
+                if kind == "float":
+                    column.append(math.nan if value is None else value)
+                elif kind == "timestamp":
+                    column.append(NULL_TIMESTAMP if value is None else int(value))
+                elif kind == "int":
+                    column.append(-1 if value is None else int(value))
+                else:
+                    column.append(value)
+
+    def extend(self, items: Iterable[Any], wallet: Optional[str] = None) -> None:
+        """Append many records, e.g. the ``data`` array of a page."""
+        for item in items:
+            self.append(item, wallet)
+
+    async def aextend(
+        self,
+        items: AsyncIterable[Any],
+        wallet: Optional[str] = None
+    ) -> None:
+        """Append records from an async iterator as they arrive."""
+        async for item in items:
+            self.append(item, wallet)
+
+    def categories(self) -> Dict[str, List[str]]:
+        """Category lists of the categorical columns, indexed by code."""
+        return {
+            name: list(column.categories)
+            for name, column in self._columns.items()
+            if isinstance(column, Categorical)
+        }
+
+    def to_arrays(self) -> Dict[str, Any]:
+        """Convert the buffers to NumPy arrays.
+
+        Each numeric buffer is copied with a single memcpy, so the builder
+        can keep growing afterwards; categorical columns yield their codes.
+
+        Returns:
+            Dict[str, numpy.ndarray]: Arrays keyed by column name
+        """
+        np = _require_numpy()
+        arrays = {}
+        for name, kind in self.schema:
+            column = self._columns[name]
+            if kind == "float":
+                arrays[name] = np.frombuffer(column, dtype=np.float64).copy()
+            elif kind in ("timestamp", "int"):
+                arrays[name] = np.frombuffer(column, dtype=np.int64).copy()
+            elif kind == "category":
+                arrays[name] = np.frombuffer(column.codes, dtype=np.int32).copy()
+            else:
+                arrays[name] = np.array(
+                    ["" if value is None else value for value in column], dtype=str
+                )
+        return arrays
+
+    def to_npz(self, path: Union[str, IO[bytes]], compressed: bool = True) -> None:
+        """Save the columns to a NumPy ``.npz`` archive.
+
+        Category lists are stored next to their codes as
+        ``<column>_categories``.
+
+        Args:
+            path: Destination file name or binary file object
+            compressed: Whether to zip-compress the archive
+        """
+        np = _require_numpy()
+        arrays = self.to_arrays()
+        for name, categories in self.categories().items():
+            arrays[f"{name}_categories"] = np.array(categories, dtype=str)
+        save = np.savez_compressed if compressed else np.savez
+        save(path, **arrays)
+
+    def rows(self) -> Iterable[List[Any]]:
+        """Iterate over records as lists of decoded values."""
+        decoders: List[Callable[[int], Any]] = []
+        for name, kind in self.schema:
+            column = self._columns[name]
+            if kind == "category":
+                decoders.append(lambda i, c=column: c.decode(c.codes[i]))
+            elif kind == "float":
+                decoders.append(
+                    lambda i, c=column: None if math.isnan(c[i]) else c[i]
+                )
+            elif kind == "timestamp":
+                decoders.append(
+                    lambda i, c=column: None if c[i] == NULL_TIMESTAMP else c[i]
+                )
+            elif kind == "int":
+                decoders.append(lambda i, c=column: None if c[i] == -1 else c[i])
+            else:
+                decoders.append(lambda i, c=column: c[i])
+        for index in range(len(self)):
+            yield [decode(index) for decode in decoders]
+
+    def to_csv(self, path: Union[str, IO[str]]) -> None:
+        """Write the columns as CSV with a header row.
+
+        Categorical codes are written as their strings and missing values as
+        empty fields.
+
+        Args:
+            path: Destination file name or text file object
+        """
+        if isinstance(path, str):
+            with open(path, "w", newline="", encoding="utf-8") as file:
+                self.to_csv(file)
+            return
+        writer = csv.writer(path)
+        writer.writerow([name for name, _ in self.schema])
+        writer.writerows(self.rows())
+
+
+class PositionColumns(ColumnBuilder):
+    """Column builder for wallet positions."""
+
+    _model = Position
+    _schema = (
+        ("id", "str"),
+        ("chain_id", "category"),
+        ("position_type", "category"),
+        ("protocol", "category"),
+        ("fungible_id", "category"),
+        ("symbol", "category"),
+        ("quantity", "float"),
+        ("price", "float"),
+        ("value", "float"),
+        ("change_1d_percent", "float"),
+    )
+
+    def _row(self, item: Position) -> Tuple[Any, ...]:
+        return (
+            item.id,
+            item.chain_id,
+            item.position_type,
+            item.protocol,
+            item.fungible_id,
+            item.symbol,
+            item.quantity,
+            item.price,
+            item.value,
+            item.changes.get("percent_1d"),
+        )
+
+
+class TransactionColumns(ColumnBuilder):
+    """Column builder for wallet transactions.
+
+    Transfers are summarised per transaction as the total value moved in
+    and out of the wallet.
+    """
+
+    _model = Transaction
+    _schema = (
+        ("id", "str"),
+        ("hash", "str"),
+        ("mined_at", "timestamp"),
+        ("block", "int"),
+        ("chain_id", "category"),
+        ("operation_type", "category"),
+        ("status", "category"),
+        ("fee", "float"),
+        ("value_in", "float"),
+        ("value_out", "float"),
+    )
+
+    def _row(self, item: Transaction) -> Tuple[Any, ...]:
+        value_in = value_out = 0.0
+        for transfer in item.transfers:
+            if transfer.value is None:
+                continue
+            if transfer.direction == "in":
+                value_in += transfer.value
+            elif transfer.direction == "out":
+                value_out += transfer.value
+        return (
+            item.id,
+            item.hash,
+            item.timestamp,
+            item.mined_at_block,
+            item.chain_id,
+            item.operation_type,
+            item.status,
+            item.fee_value,
+            value_in,
+            value_out,
+        )
+
+
+class TransferColumns(ColumnBuilder):
+    """Column builder with one row per transfer of each transaction.
+
+    Used for per-asset flows such as cost basis and PnL.
+    """
+
+    _model = Transaction
+    _schema = (
+        ("transaction_id", "str"),
+        ("mined_at", "timestamp"),
+        ("chain_id", "category"),
+        ("direction", "category"),
+        ("fungible_id", "category"),
+        ("symbol", "category"),
+        ("quantity", "float"),
+        ("price", "float"),
+        ("value", "float"),
+    )
+
+    def _rows(self, item: Transaction) -> Iterable[Tuple[Any, ...]]:
+        for transfer in item.transfers:
+            info = transfer.fungible_info
+            yield (
+                item.id,
+                item.timestamp,
+                item.chain_id,
+                transfer.direction,
+                info.id,
+                info.symbol,
+                transfer.quantity,
+                transfer.price,
+                transfer.value,
+            )
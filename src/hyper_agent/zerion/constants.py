@@ -6,6 +6,77 @@ from ..config import require_api_key
 API_BASE_URL_ENV_VAR: Final[str] = "ZERION_API_BASE_URL"
 API_KEY_ENV_VAR: Final[str] = "ZERION_API_KEY"
 DEFAULT_API_BASE_URL: Final[str] = "https://api.zerion.io/v1"
+RATE_LIMIT_ENV_VAR: Final[str] = "ZERION_RATE_LIMIT"
+RATE_LIMIT_BURST_ENV_VAR: Final[str] = "ZERION_RATE_LIMIT_BURST"
+CACHE_PATH_ENV_VAR: Final[str] = "ZERION_CACHE_PATH"
+
+# Connection pool defaults
+DEFAULT_POOL_SIZE: Final[int] = 100
+DEFAULT_POOL_SIZE_PER_HOST: Final[int] = 0
+DEFAULT_KEEPALIVE_TIMEOUT: Final[float] = 30.0
+DEFAULT_DNS_CACHE_TTL: Final[int] = 300
+
+# Response bodies at least this many bytes are decoded in slices that yield
+# to the event loop at least every DEFAULT_DECODE_SLICE seconds
+DEFAULT_DECODE_OFFLOAD_THRESHOLD: Final[int] = 256 * 1024
+DEFAULT_DECODE_SLICE: Final[float] = 0.005
+
+# Maximum concurrent requests for bulk wallet fetches
+DEFAULT_BULK_CONCURRENCY: Final[int] = 10
+
+# Number of time windows a transaction backfill is split into
+DEFAULT_BACKFILL_WINDOWS: Final[int] = 32
+
+# Adaptive polling intervals in seconds of the wallet watcher, and the factor
+# a dormant wallet's interval grows by after each poll without changes
+DEFAULT_WATCH_MIN_INTERVAL: Final[float] = 30.0
+DEFAULT_WATCH_MAX_INTERVAL: Final[float] = 3600.0
+DEFAULT_WATCH_BACKOFF: Final[float] = 2.0
+
+# Most token ids per batched price request, and how long in seconds the
+# price micro-batcher waits for more concurrent lookups before sending one
+DEFAULT_PRICE_BATCH_SIZE: Final[int] = 100
+DEFAULT_PRICE_BATCH_WINDOW: Final[float] = 0.005
+
+# Chains with their own value column in a new portfolio snapshot store
+DEFAULT_SNAPSHOT_CHAINS: Final[tuple] = (
+    "ethereum", "arbitrum", "base", "optimism", "polygon",
+    "binance-smart-chain", "avalanche", "solana",
+)
+
+# Upper bounds in seconds of the request timing histogram buckets
+DEFAULT_LATENCY_BUCKETS: Final[tuple] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+# Response cache defaults, TTLs in seconds keyed by ENDPOINTS name
+DEFAULT_CACHE_MAX_SIZE: Final[int] = 4096
+DEFAULT_SQLITE_CACHE_MAX_BYTES: Final[int] = 256 * 1024 * 1024
+DEFAULT_SQLITE_CACHE_TOUCH_INTERVAL: Final[float] = 60.0
+DEFAULT_CACHE_TTLS: Final[dict] = {
+    "token_price": 10,
+    "token_list": 10,
+    "token_info": 6 * 3600,
+    "token_holders": 300,
+    "protocol_info": 6 * 3600,
+    "protocol_pools": 3600,
+    "protocol_tokens": 3600,
+    "protocol_stats": 300,
+    "wallet_info": 60,
+    "wallet_balances": 30,
+    "wallet_protocols": 60,
+    "wallet_portfolio": 30,
+}
+
+# Endpoints revalidated with ETag/Last-Modified once their TTL expires, and
+# how long in seconds their bodies and validators are kept for that
+DEFAULT_REVALIDATE_ENDPOINTS: Final[frozenset] = frozenset({
+    "token_info",
+    "protocol_info",
+    "protocol_pools",
+    "protocol_tokens",
+})
+DEFAULT_REVALIDATE_TTL: Final[int] = 7 * 24 * 3600
 
 # API Headers
 HEADERS: Final[dict[str, str]] = {
@@ -25,6 +96,7 @@ ENDPOINTS: Final[dict] = {
         "price": "/tokens/{address}/price",
         "holders": "/tokens/{address}/holders",
         "transactions": "/tokens/{address}/transactions",
+        "list": "/fungibles/",
     },
     "protocol": {
         "info": "/protocols/{id}",
@@ -41,6 +113,7 @@ ENDPOINTS: Final[dict] = {
     "token_price": "/tokens/{token_id}/price",
     "token_holders": "/tokens/{token_id}/holders",
     "token_transactions": "/tokens/{token_id}/transactions",
+    "token_list": "/fungibles/",
     "protocol_info": "/protocols/{protocol_id}",
     "protocol_pools": "/protocols/{protocol_id}/pools",
     "protocol_tokens": "/protocols/{protocol_id}/tokens",
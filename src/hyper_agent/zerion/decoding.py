@@ -0,0 +1,208 @@
+"""JSON decoding of Zerion API responses."""
+import asyncio
+import json
+import time
+from concurrent.futures import Executor
+from json.decoder import WHITESPACE
+from json.scanner import make_scanner
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from .constants import DEFAULT_DECODE_OFFLOAD_THRESHOLD, DEFAULT_DECODE_SLICE
+
+Loads = Callable[[bytes], Any]
+
+_scan_once = make_scanner(json.JSONDecoder())
+
+
+def _stdlib_loads(body: bytes) -> Any:
+    return json.loads(body)
+
+
+def get_loads(name: str = "auto") -> Loads:
+    """Get a JSON ``loads`` function by name.
+
+    Args:
+        name: ``json`` (stdlib), ``orjson``, ``msgspec``, or ``auto`` to use the
+            fastest installed decoder
+
+    Returns:
+        Loads: Function decoding UTF-8 JSON bytes
+
+    Raises:
+        ValueError: If the name is unknown.
+        ImportError: If the requested decoder is not installed.
+    """
+    if name == "auto":
+        for candidate in ("orjson", "msgspec"):
+            try:
+                return get_loads(candidate)
+            except ImportError:
+                continue
+        return _stdlib_loads
+    if name == "json":
+        return _stdlib_loads
+    if name == "orjson":
+        import orjson
+        return orjson.loads
+    if name == "msgspec":
+        import msgspec
+        return msgspec.json.Decoder().decode
+    raise ValueError(f"Unknown JSON decoder: {name}")
+
+
+class _SlicedDecoder:
+    """Decodes a JSON document on the event loop, yielding between values.
+
+    The elements of top-level arrays, including arrays that are members of a
+    top-level object such as a JSON:API ``data`` list, are decoded one at a
+    time with the stdlib scanner. Control returns to the event loop whenever
+    a slice has run for ``slice_time`` seconds, so the loop stalls for at
+    most about one slice plus the decode time of a single element.
+    """
+
+    def __init__(self, text: str, slice_time: float):
+        self.text = text
+        self.slice_time = slice_time
+        self.deadline = time.perf_counter() + slice_time
+
+    def _skip(self, index: int) -> int:
+        return WHITESPACE.match(self.text, index).end()
+
+    def _error(self, message: str, index: int) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self.text, index)
+
+    def _scan(self, index: int) -> Tuple[Any, int]:
+        try:
+            return _scan_once(self.text, index)
+        except StopIteration as exc:
+            raise self._error("Expecting value", exc.value) from None
+
+    async def _pause(self) -> None:
+        if time.perf_counter() >= self.deadline:
+            await asyncio.sleep(0)
+            self.deadline = time.perf_counter() + self.slice_time
+
+    async def decode(self) -> Any:
+        index = self._skip(0)
+        if self.text.startswith("{", index):
+            value, index = await self._object(index + 1)
+        else:
+            value, index = await self._value(index)
+        index = self._skip(index)
+        if index != len(self.text):
+            raise self._error("Extra data", index)
+        return value
+
+    async def _value(self, index: int) -> Tuple[Any, int]:
+        if self.text.startswith("[", index):
+            return await self._array(index + 1)
+        return self._scan(index)
+
+    async def _array(self, index: int) -> Tuple[List[Any], int]:
+        values: List[Any] = []
+        index = self._skip(index)
+        if self.text.startswith("]", index):
+            return values, index + 1
+        while True:
+            value, index = self._scan(index)
+            values.append(value)
+            index = self._skip(index)
+            if self.text.startswith("]", index):
+                return values, index + 1
+            if not self.text.startswith(",", index):
+                raise self._error("Expecting ',' delimiter", index)
+            index = self._skip(index + 1)
+            await self._pause()
+
+    async def _object(self, index: int) -> Tuple[Dict[str, Any], int]:
+        members: Dict[str, Any] = {}
+        index = self._skip(index)
+        if self.text.startswith("}", index):
+            return members, index + 1
+        while True:
+            if not self.text.startswith('"', index):
+                raise self._error(
+                    "Expecting property name enclosed in double quotes", index
+                )
+            key, index = self._scan(index)
+            index = self._skip(index)
+            if not self.text.startswith(":", index):
+                raise self._error("Expecting ':' delimiter", index)
+            members[key], index = await self._value(self._skip(index + 1))
+            index = self._skip(index)
+            if self.text.startswith("}", index):
+                return members, index + 1
+            if not self.text.startswith(",", index):
+                raise self._error("Expecting ',' delimiter", index)
+            index = self._skip(index + 1)
+            await self._pause()
+
+
+async def decode_sliced(body: bytes, slice_time: float = DEFAULT_DECODE_SLICE) -> Any:
+    """Decode JSON on the running event loop without stalling it.
+
+    Args:
+        body: UTF-8 JSON bytes
+        slice_time: Seconds of decoding between yields to the event loop
+
+    Returns:
+        The decoded JSON value
+
+    Raises:
+        json.JSONDecodeError: If the body is not valid JSON.
+    """
+    return await _SlicedDecoder(body.decode("utf-8"), slice_time).decode()
+
+
+class ResponseDecoder:
+    """Decodes raw response bodies without stalling the event loop.
+
+    Bodies of at least ``offload_threshold`` bytes are decoded with
+    :func:`decode_sliced`, which yields to the loop between the elements of
+    the page's arrays, so a large transactions or holders page does not
+    stall other requests. Offloading to a thread pool would not help: the C
+    decoders hold the GIL for the whole document, and a process pool pays
+    the same cost again unpickling the result. The sliced path always uses
+    the stdlib scanner; pass an ``executor`` to decode large bodies with
+    ``loads`` there instead. Cyclic garbage collection over the objects of a
+    huge page can still pause the loop, however the page is decoded.
+    """
+
+    def __init__(
+        self,
+        loads: Union[str, Loads] = "auto",
+        offload_threshold: Optional[int] = DEFAULT_DECODE_OFFLOAD_THRESHOLD,
+        executor: Optional[Executor] = None,
+        slice_time: float = DEFAULT_DECODE_SLICE
+    ):
+        """Initialize the decoder.
+
+        Args:
+            loads: Decoder name accepted by :func:`get_loads`, or a callable
+                taking bytes and returning the decoded value
+            offload_threshold: Body size in bytes from which decoding yields
+                to the event loop; None always decodes in one call
+            executor: Executor that decodes large bodies with ``loads``
+                instead of the sliced decoder
+            slice_time: Seconds the sliced decoder runs between yields
+        """
+        self.loads = get_loads(loads) if isinstance(loads, str) else loads
+        self.offload_threshold = offload_threshold
+        self.executor = executor
+        self.slice_time = slice_time
+
+    async def decode(self, body: bytes) -> Any:
+        """Decode a response body.
+
+        Args:
+            body: Raw response bytes
+
+        Returns:
+            The decoded JSON value
+        """
+        if self.offload_threshold is None or len(body) < self.offload_threshold:
+            return self.loads(body)
+        if self.executor is None:
+            return await decode_sliced(body, self.slice_time)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self.loads, body)
@@ -0,0 +1,285 @@
+"""Position diffs between successive wallet snapshots.
+
+Both snapshots are indexed by a stable position key in one pass each, so a
+diff is linear in the number of positions rather than comparing every pair::
+
+    before = await wallet.get_wallet_balances(address, use_cache=False)
+    ...
+    after = await wallet.get_wallet_balances(address, use_cache=False)
+    for change in diff_positions(before, after):
+        print(change.kind, change.key, change.delta)
+"""
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Union,
+)
+
+from .models import Position
+
+OPENED = "opened"
+CLOSED = "closed"
+INCREASED = "increased"
+DECREASED = "decreased"
+
+Positions = Union[Dict[str, Any], Iterable[Union[Dict[str, Any], Position]]]
+
+
+def position_key(position: Position) -> Hashable:
+    """Stable key identifying a position across snapshots.
+
+    Args:
+        position: The position
+
+    Returns:
+        The Zerion position id, or ``(fungible_id, chain_id, protocol,
+        position_type)`` for positions without one
+    """
+    if position.id:
+        return position.id
+    return (
+        position.fungible_id, position.chain_id, position.protocol,
+        position.position_type,
+    )
+
+
+def index_positions(positions: Positions) -> Dict[Hashable, Position]:
+    """Index positions by :func:`position_key`.
+
+    Args:
+        positions: A positions response, a list of raw position resources or
+            a list of Position models
+
+    Returns:
+        Dict[Hashable, Position]: Positions keyed by position key
+    """
+    if isinstance(positions, dict):
+        positions = positions.get("data") or []
+    index = {}
+    for position in positions:
+        if not isinstance(position, Position):
+            position = Position.from_json(position)
+        index[position_key(position)] = position
+    return index
+
+
+class PositionChange:
+    """Change of one position between two snapshots.
+
+    Missing quantities count as zero. ``previous`` and ``current`` hold the
+    Position on either side when the diff was computed from positions.
+    """
+
+    __slots__ = ("key", "kind", "before", "after", "previous", "current")
+
+    def __init__(
+        self,
+        key: Hashable,
+        kind: str,
+        before: float,
+        after: float,
+        previous: Optional[Position] = None,
+        current: Optional[Position] = None
+    ):
+        self.key = key
+        self.kind = kind
+        self.before = before
+        self.after = after
+        self.previous = previous
+        self.current = current
+
+    @property
+    def delta(self) -> float:
+        """Quantity change, positive when the position grew."""
+        return self.after - self.before
+
+    @property
+    def position(self) -> Optional[Position]:
+        """The position after the change, or before it if it was closed."""
+        return self.current if self.current is not None else self.previous
+
+    def __repr__(self) -> str:
+        return (
+            f"PositionChange(key={self.key!r}, kind={self.kind!r}, "
+            f"before={self.before!r}, after={self.after!r})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PositionChange):
+            return NotImplemented
+        return (self.key, self.kind, self.before, self.after) == (
+            other.key, other.kind, other.before, other.after
+        )
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the change as a JSON-serializable dict."""
+        key = self.key if isinstance(self.key, str) else list(self.key)
+        return {
+            "key": key,
+            "kind": self.kind,
+            "before": self.before,
+            "after": self.after,
+            "delta": self.delta,
+        }
+
+
+class PositionDiff:
+    """All position changes of one wallet between two snapshots."""
+
+    __slots__ = ("changes",)
+
+    def __init__(self, changes: List[PositionChange]):
+        self.changes = changes
+
+    def __iter__(self) -> Iterator[PositionChange]:
+        return iter(self.changes)
+
+    def __len__(self) -> int:
+        return len(self.changes)
+
+    def __bool__(self) -> bool:
+        return bool(self.changes)
+
+    def __repr__(self) -> str:
+        counts = ", ".join(
+            f"{kind}={len(self.of_kind(kind))}"
+            for kind in (OPENED, CLOSED, INCREASED, DECREASED)
+        )
+        return f"PositionDiff({counts})"
+
+    def of_kind(self, kind: str) -> List[PositionChange]:
+        """Changes of one kind, e.g. ``opened``."""
+        return [change for change in self.changes if change.kind == kind]
+
+    @property
+    def opened(self) -> List[PositionChange]:
+        """Positions that appeared."""
+        return self.of_kind(OPENED)
+
+    @property
+    def closed(self) -> List[PositionChange]:
+        """Positions that disappeared or dropped to zero."""
+        return self.of_kind(CLOSED)
+
+    @property
+    def increased(self) -> List[PositionChange]:
+        """Positions whose quantity grew."""
+        return self.of_kind(INCREASED)
+
+    @property
+    def decreased(self) -> List[PositionChange]:
+        """Positions whose quantity shrank."""
+        return self.of_kind(DECREASED)
+
+    def as_dict(self) -> List[Dict[str, Any]]:
+        """Return the changes as JSON-serializable dicts."""
+        return [change.as_dict() for change in self.changes]
+
+
+def _classify(before: float, after: float, tolerance: float) -> Optional[str]:
+    if abs(after - before) <= tolerance:
+        return None
+    if abs(before) <= tolerance:
+        return OPENED
+    if abs(after) <= tolerance:
+        return CLOSED
+    return INCREASED if after > before else DECREASED
+
+
+def diff_holdings(
+    before: Mapping[Hashable, Optional[float]],
+    after: Mapping[Hashable, Optional[float]],
+    tolerance: float = 0.0
+) -> PositionDiff:
+    """Diff two mappings of position key to quantity.
+
+    Args:
+        before: Quantities of the earlier snapshot
+        after: Quantities of the later snapshot
+        tolerance: Quantity changes at or below this are ignored, and
+            quantities at or below it count as no position
+
+    Returns:
+        PositionDiff: Changes in the order of ``after``, then closed
+        positions in the order of ``before``
+    """
+    changes = []
+    for key, quantity in after.items():
+        previous = before.get(key) or 0.0
+        kind = _classify(previous, quantity or 0.0, tolerance)
+        if kind is not None:
+            changes.append(PositionChange(key, kind, previous, quantity or 0.0))
+    for key, quantity in before.items():
+        if key not in after:
+            kind = _classify(quantity or 0.0, 0.0, tolerance)
+            if kind is not None:
+                changes.append(PositionChange(key, kind, quantity or 0.0, 0.0))
+    return PositionDiff(changes)
+
+
+def diff_positions(
+    before: Positions,
+    after: Positions,
+    tolerance: float = 0.0
+) -> PositionDiff:
+    """Diff two position snapshots of one wallet.
+
+    Args:
+        before: Earlier snapshot, as accepted by :func:`index_positions`
+            or an index it returned, e.g. kept from the previous diff
+        after: Later snapshot, in the same forms as ``before``
+        tolerance: Quantity changes at or below this are ignored
+
+    Returns:
+        PositionDiff: Changes carrying the Position on either side
+    """
+    previous = before if _is_index(before) else index_positions(before)
+    current = after if _is_index(after) else index_positions(after)
+    diff = diff_holdings(
+        {key: position.quantity for key, position in previous.items()},
+        {key: position.quantity for key, position in current.items()},
+        tolerance,
+    )
+    for change in diff:
+        change.previous = previous.get(change.key)
+        change.current = current.get(change.key)
+    return diff
+
+
+def _is_index(positions: Positions) -> bool:
+    return isinstance(positions, dict) and "data" not in positions
+
+
+def diff_many(
+    before: Mapping[str, Positions],
+    after: Mapping[str, Positions],
+    tolerance: float = 0.0
+) -> Dict[str, PositionDiff]:
+    """Diff position snapshots of many wallets.
+
+    A wallet present on only one side is diffed against an empty snapshot,
+    so all of its positions are reported as opened or closed.
+
+    Args:
+        before: Earlier snapshots keyed by wallet address
+        after: Later snapshots keyed by wallet address
+        tolerance: Quantity changes at or below this are ignored
+
+    Returns:
+        Dict[str, PositionDiff]: Diffs of the wallets with changes, keyed by
+        address
+    """
+    result = {}
+    for address in {**before, **after}:
+        diff = diff_positions(
+            before.get(address, ()), after.get(address, ()), tolerance
+        )
+        if diff:
+            result[address] = diff
+    return result
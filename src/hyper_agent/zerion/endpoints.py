@@ -0,0 +1,56 @@
+"""Helpers for mapping request paths back to ENDPOINTS entries."""
+import re
+from typing import Dict, List, Optional, Pattern, Tuple
+
+from .constants import ENDPOINTS
+
+# Maps the first path segment of an endpoint ("wallets") to its ENDPOINTS
+# family ("wallet").
+ENDPOINT_FAMILIES: Dict[str, str] = {
+    template.split("/")[1]: family
+    for family, group in ENDPOINTS.items()
+    if isinstance(group, dict)
+    for template in group.values()
+}
+
+
+def _compile_template(template: str) -> Pattern[str]:
+    parts = re.split(r"\{[^}]+\}", template)
+    return re.compile("^" + "[^/]+".join(re.escape(part) for part in parts) + "$")
+
+
+# Flat ENDPOINTS names ("token_price") with a pattern matching their paths.
+_ENDPOINT_PATTERNS: List[Tuple[str, Pattern[str]]] = [
+    (name, _compile_template(template))
+    for name, template in ENDPOINTS.items()
+    if isinstance(template, str)
+]
+
+
+def endpoint_family(endpoint: str) -> Optional[str]:
+    """Get the ENDPOINTS family an endpoint path belongs to.
+
+    Args:
+        endpoint: API endpoint path, e.g. ``/wallets/0x123/positions``
+
+    Returns:
+        Optional[str]: Family name (``wallet``, ``token``, ``protocol``) or None
+    """
+    segment = endpoint.lstrip("/").split("/", 1)[0]
+    return ENDPOINT_FAMILIES.get(segment)
+
+
+def endpoint_name(endpoint: str) -> Optional[str]:
+    """Get the ENDPOINTS name matching an endpoint path.
+
+    Args:
+        endpoint: API endpoint path, e.g. ``/tokens/eth/price``
+
+    Returns:
+        Optional[str]: Endpoint name such as ``token_price``, or None if unknown
+    """
+    path = endpoint.split("?", 1)[0]
+    for name, pattern in _ENDPOINT_PATTERNS:
+        if pattern.match(path):
+            return name
+    return None
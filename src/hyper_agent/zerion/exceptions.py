@@ -0,0 +1,30 @@
+"""Exceptions raised by the Zerion SDK."""
+from typing import Any, Optional
+
+
+class ZerionAPIError(ValueError):
+    """Raised when the Zerion API returns a non-success response."""
+
+    def __init__(
+        self,
+        message: str,
+        status: Optional[int] = None,
+        data: Any = None,
+        retry_after: Optional[float] = None
+    ):
+        """Initialize the error.
+
+        Args:
+            message: Human readable error message
+            status: HTTP status code of the response
+            data: Decoded error body, if any
+            retry_after: Seconds the server asked us to wait, if provided
+        """
+        super().__init__(message)
+        self.status = status
+        self.data = data
+        self.retry_after = retry_after
+
+
+class ZerionRateLimitError(ZerionAPIError):
+    """Raised when the Zerion API responds with HTTP 429."""
@@ -0,0 +1,329 @@
+"""Request instrumentation for the Zerion client.
+
+Pass an :class:`Instrumentation` to ``ZerionClient`` to record, per
+ENDPOINTS template, request counts by status, response bytes and timing
+histograms for the connection-pool wait, DNS lookup, connect, time to
+first byte and total duration. Timings come from an ``aiohttp.TraceConfig``
+attached to the client's session. Without instrumentation no trace config
+is installed and requests pay only for a None check::
+
+    instrumentation = Instrumentation()
+    instrumentation.add_hook(lambda record: log.debug("%r", record))
+    async with ZerionClient(instrumentation=instrumentation) as client:
+        ...
+    print(instrumentation.to_prometheus())
+"""
+import bisect
+import json
+import logging
+import time
+from collections import Counter
+from types import SimpleNamespace
+from typing import IO, Any, Callable, Dict, List, Optional, Sequence, Union
+
+import aiohttp
+
+from .constants import DEFAULT_LATENCY_BUCKETS
+from .endpoints import endpoint_name
+
+logger = logging.getLogger(__name__)
+
+PHASES = ("queued", "dns", "connect", "ttfb", "total")
+
+
+class Histogram:
+    """Cumulative histogram with fixed upper bounds, Prometheus style."""
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        """Initialize the histogram.
+
+        Args:
+            buckets: Increasing bucket upper bounds; values above the last
+                bound are only counted in ``+Inf``
+        """
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Record a value."""
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> List[int]:
+        """Counts of values at or below each bound, ending with ``+Inf``."""
+        total = 0
+        result = []
+        for count in self.counts:
+            total += count
+            result.append(total)
+        return result
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the histogram as a plain dict."""
+        return {
+            "buckets": list(self.buckets),
+            "cumulative": self.cumulative(),
+            "sum": self.sum,
+            "count": self.count,
+        }
+
+
+class RequestRecord:
+    """Measurements of one HTTP request attempt.
+
+    Phase timings are in seconds and None when the phase did not happen,
+    e.g. ``dns`` and ``connect`` for a request on a pooled connection.
+    """
+
+    __slots__ = (
+        "method", "endpoint", "name", "status", "bytes", "error",
+        "queued", "dns", "connect", "ttfb", "total", "_started", "_marks",
+    )
+
+    def __init__(self, method: str, endpoint: str, name: str):
+        self.method = method
+        self.endpoint = endpoint
+        self.name = name
+        self.status: Optional[int] = None
+        self.bytes = 0
+        self.error: Optional[str] = None
+        self.queued: Optional[float] = None
+        self.dns: Optional[float] = None
+        self.connect: Optional[float] = None
+        self.ttfb: Optional[float] = None
+        self.total: Optional[float] = None
+        self._started = time.perf_counter()
+        self._marks: Dict[str, float] = {}
+
+    def __repr__(self) -> str:
+        return (
+            f"RequestRecord(method={self.method!r}, name={self.name!r}, "
+            f"status={self.status!r}, total={self.total!r})"
+        )
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the record as a plain dict."""
+        return {
+            name: getattr(self, name)
+            for name in self.__slots__
+            if not name.startswith("_")
+        }
+
+
+class EndpointMetrics:
+    """Aggregated measurements of one endpoint template."""
+
+    __slots__ = ("statuses", "errors", "bytes", "histograms")
+
+    def __init__(self, buckets: Sequence[float]):
+        self.statuses: Counter = Counter()
+        self.errors: Counter = Counter()
+        self.bytes = 0
+        self.histograms = {phase: Histogram(buckets) for phase in PHASES}
+
+    @property
+    def requests(self) -> int:
+        """Number of completed or failed request attempts."""
+        return sum(self.statuses.values()) + sum(self.errors.values())
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the metrics as a plain dict."""
+        return {
+            "requests": self.requests,
+            "statuses": {str(status): n for status, n in self.statuses.items()},
+            "errors": dict(self.errors),
+            "bytes": self.bytes,
+            "histograms": {
+                phase: histogram.as_dict()
+                for phase, histogram in self.histograms.items()
+            },
+        }
+
+
+def _record(params: SimpleNamespace) -> Optional[RequestRecord]:
+    record = getattr(params, "trace_request_ctx", None)
+    return record if isinstance(record, RequestRecord) else None
+
+
+def _mark(start: str) -> Callable[..., Any]:
+    async def callback(session: Any, context: SimpleNamespace, params: Any) -> None:
+        record = _record(context)
+        if record is not None:
+            record._marks[start] = time.perf_counter()
+    return callback
+
+
+def _measure(start: str) -> Callable[..., Any]:
+    async def callback(session: Any, context: SimpleNamespace, params: Any) -> None:
+        record = _record(context)
+        if record is not None and start in record._marks:
+            elapsed = time.perf_counter() - record._marks.pop(start)
+            setattr(record, start, (getattr(record, start) or 0.0) + elapsed)
+    return callback
+
+
+async def _on_request_end(session: Any, context: SimpleNamespace, params: Any) -> None:
+    record = _record(context)
+    if record is not None:
+        record.ttfb = time.perf_counter() - record._started
+
+
+class Instrumentation:
+    """Collects per-endpoint request metrics and forwards records to hooks."""
+
+    def __init__(
+        self,
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+        namespace: str = "zerion"
+    ):
+        """Initialize the instrumentation.
+
+        Args:
+            buckets: Upper bounds in seconds of the timing histograms
+            namespace: Prefix of the Prometheus metric names
+        """
+        self.buckets = tuple(buckets)
+        self.namespace = namespace
+        self.endpoints: Dict[str, EndpointMetrics] = {}
+        self.hooks: List[Callable[[RequestRecord], None]] = []
+
+    def add_hook(self, hook: Callable[[RequestRecord], None]) -> None:
+        """Call ``hook`` with every finished :class:`RequestRecord`.
+
+        Hooks run inline on the event loop and must not block. Exceptions
+        they raise are logged and never affect the request's result.
+
+        Args:
+            hook: Callable taking a RequestRecord
+        """
+        self.hooks.append(hook)
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """Build the trace config collecting phase timings.
+
+        ``ZerionClient`` installs it on the session it creates; add it to the
+        ``trace_configs`` of an externally managed session yourself.
+        """
+        config = aiohttp.TraceConfig()
+        config.on_connection_queued_start.append(_mark("queued"))
+        config.on_connection_queued_end.append(_measure("queued"))
+        config.on_dns_resolvehost_start.append(_mark("dns"))
+        config.on_dns_resolvehost_end.append(_measure("dns"))
+        config.on_connection_create_start.append(_mark("connect"))
+        config.on_connection_create_end.append(_measure("connect"))
+        config.on_request_end.append(_on_request_end)
+        return config
+
+    def start(self, method: str, endpoint: str) -> RequestRecord:
+        """Begin measuring a request.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint path
+
+        Returns:
+            RequestRecord: Record to pass as the request's
+            ``trace_request_ctx`` and then to :meth:`finish`
+        """
+        name = endpoint_name(endpoint) or "other"
+        return RequestRecord(method.upper(), endpoint, name)
+
+    def finish(self, record: RequestRecord) -> None:
+        """Complete a record, aggregate it and pass it to the hooks.
+
+        Args:
+            record: Record returned by :meth:`start`, with ``status``,
+                ``bytes`` or ``error`` filled in
+        """
+        record.total = time.perf_counter() - record._started
+        metrics = self.endpoints.get(record.name)
+        if metrics is None:
+            metrics = self.endpoints[record.name] = EndpointMetrics(self.buckets)
+        if record.status is not None:
+            metrics.statuses[record.status] += 1
+        else:
+            metrics.errors[record.error or "unknown"] += 1
+        metrics.bytes += record.bytes
+        for phase in PHASES:
+            value = getattr(record, phase)
+            if value is not None:
+                metrics.histograms[phase].observe(value)
+        for hook in self.hooks:
+            try:
+                hook(record)
+            except Exception:
+                logger.exception("Instrumentation hook %r failed", hook)
+
+    def reset(self) -> None:
+        """Discard all aggregated metrics."""
+        self.endpoints.clear()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return all metrics as a JSON-serializable dict keyed by endpoint."""
+        return {
+            name: metrics.as_dict()
+            for name, metrics in sorted(self.endpoints.items())
+        }
+
+    def dump_json(self, target: Union[str, IO[str]]) -> None:
+        """Write :meth:`to_dict` as JSON.
+
+        Args:
+            target: File name or text file object
+        """
+        if isinstance(target, str):
+            with open(target, "w", encoding="utf-8") as file:
+                self.dump_json(file)
+            return
+        json.dump(self.to_dict(), target, indent=2)
+
+    def to_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        requests = f"{self.namespace}_requests_total"
+        errors = f"{self.namespace}_request_errors_total"
+        size = f"{self.namespace}_response_bytes_total"
+        duration = f"{self.namespace}_request_duration_seconds"
+        sections: Dict[str, List[str]] = {
+            requests: [
+                f"# HELP {requests} Request attempts by endpoint and status.",
+                f"# TYPE {requests} counter",
+            ],
+            errors: [
+                f"# HELP {errors} Request attempts that got no response.",
+                f"# TYPE {errors} counter",
+            ],
+            size: [
+                f"# HELP {size} Response body bytes received.",
+                f"# TYPE {size} counter",
+            ],
+            duration: [
+                f"# HELP {duration} Request phase durations in seconds.",
+                f"# TYPE {duration} histogram",
+            ],
+        }
+        for name, metrics in sorted(self.endpoints.items()):
+            label = f'endpoint="{name}"'
+            for status, count in sorted(metrics.statuses.items()):
+                sections[requests].append(
+                    f'{requests}{{{label},status="{status}"}} {count}'
+                )
+            for error, count in sorted(metrics.errors.items()):
+                sections[errors].append(f'{errors}{{{label},error="{error}"}} {count}')
+            sections[size].append(f"{size}{{{label}}} {metrics.bytes}")
+            for phase, histogram in metrics.histograms.items():
+                labels = f'{label},phase="{phase}"'
+                bounds = [repr(float(bound)) for bound in histogram.buckets] + ["+Inf"]
+                for bound, count in zip(bounds, histogram.cumulative()):
+                    sections[duration].append(
+                        f'{duration}_bucket{{{labels},le="{bound}"}} {count}'
+                    )
+                sections[duration].append(f"{duration}_sum{{{labels}}} {histogram.sum}")
+                sections[duration].append(
+                    f"{duration}_count{{{labels}}} {histogram.count}"
+                )
+        return "\n".join(line for lines in sections.values() for line in lines) + "\n"
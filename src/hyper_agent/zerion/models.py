@@ -0,0 +1,396 @@
+"""Compact typed models for Zerion API resources.
+
+The endpoint clients return raw JSON:API dicts by default. Passing
+``parse=True`` returns these models instead: they use ``__slots__``, intern
+strings that repeat across many records (chain ids, symbols, types) and
+only decode nested structures such as fungible info or transfers when they
+are first accessed.
+"""
+import sys
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+
+def _intern(value: Any) -> Any:
+    """Intern a string so repeated values share one object."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _float(value: Any) -> Optional[float]:
+    """Convert a numeric JSON value (possibly a string) to float."""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _quantity(value: Any) -> Optional[float]:
+    """Read a Zerion quantity, either ``{"float": ...}`` or a plain number."""
+    if isinstance(value, dict):
+        return _float(value.get("float", value.get("numeric")))
+    return _float(value)
+
+
+def _relationship_id(resource: Dict[str, Any], name: str) -> Optional[str]:
+    """Get the id of a JSON:API relationship, e.g. the chain of a position."""
+    data = ((resource.get("relationships") or {}).get(name) or {}).get("data") or {}
+    return _intern(data.get("id"))
+
+
+def parse_timestamp(value: Optional[str]) -> Optional[float]:
+    """Parse an ISO 8601 timestamp into Unix seconds.
+
+    Args:
+        value: Timestamp such as ``2024-01-01T00:00:00Z``
+
+    Returns:
+        Optional[float]: Seconds since the epoch, or None if missing or invalid
+    """
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def normalize_address(address: str) -> str:
+    """Normalize a wallet or contract address for use as a key.
+
+    EVM addresses are hex and case-insensitive, so they are lowercased.
+    Other addresses, e.g. Solana's base58 ones, are case-sensitive and
+    returned unchanged.
+
+    Args:
+        address: The address
+
+    Returns:
+        str: The address to compare and store
+    """
+    return address.lower() if address[:2].lower() == "0x" else address
+
+
+class Model:
+    """Base class for slotted models.
+
+    Subclasses list their public attributes in ``_fields``; private slots
+    hold raw nested JSON that is decoded on first access.
+    """
+
+    __slots__ = ()
+    _fields: Tuple[str, ...] = ()
+
+    def __init__(self, **kwargs: Any):
+        for name in self.__slots__:
+            setattr(self, name, kwargs.get(name))
+
+    def __repr__(self) -> str:
+        values = ", ".join(
+            f"{name}={getattr(self, name)!r}" for name in self._fields[:4]
+        )
+        return f"{type(self).__name__}({values})"
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, n) == getattr(other, n) for n in self._fields)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the public fields as a plain dict."""
+        return {name: getattr(self, name) for name in self._fields}
+
+
+class Implementation(Model):
+    """Deployment of a fungible on one chain."""
+
+    __slots__ = ("chain_id", "address", "decimals")
+    _fields = __slots__
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "Implementation":
+        return cls(
+            chain_id=_intern(data.get("chain_id")),
+            address=_intern(data.get("address")),
+            decimals=data.get("decimals"),
+        )
+
+
+class FungibleInfo(Model):
+    """Token (fungible) metadata."""
+
+    __slots__ = ("id", "name", "symbol", "icon_url", "verified", "_implementations")
+    _fields = ("id", "name", "symbol", "icon_url", "verified")
+
+    @classmethod
+    def from_json(
+        cls,
+        data: Dict[str, Any],
+        fungible_id: Optional[str] = None
+    ) -> "FungibleInfo":
+        """Build from a ``fungible_info`` object or fungible attributes.
+
+        Args:
+            data: Fungible attributes
+            fungible_id: Fungible id, when known from the enclosing resource
+        """
+        info = cls(
+            id=_intern(fungible_id if fungible_id is not None else data.get("id")),
+            name=_intern(data.get("name")),
+            symbol=_intern(data.get("symbol")),
+            icon_url=(data.get("icon") or {}).get("url"),
+            verified=(data.get("flags") or {}).get("verified"),
+        )
+        info._implementations = data.get("implementations") or []
+        return info
+
+    @classmethod
+    def from_resource(cls, resource: Dict[str, Any]) -> "FungibleInfo":
+        """Build from a ``fungibles`` JSON:API resource."""
+        return cls.from_json(resource.get("attributes") or {}, resource.get("id"))
+
+    @property
+    def implementations(self) -> List[Implementation]:
+        """Per-chain deployments, decoded on first access."""
+        if self._implementations and isinstance(self._implementations[0], dict):
+            self._implementations = [
+                Implementation.from_json(item) for item in self._implementations
+            ]
+        return self._implementations
+
+    def address_on(self, chain_id: str) -> Optional[str]:
+        """Get the contract address on a chain, if deployed there."""
+        for implementation in self.implementations:
+            if implementation.chain_id == chain_id:
+                return implementation.address
+        return None
+
+
+class Position(Model):
+    """A wallet position (``wallets/{address}/positions`` item)."""
+
+    __slots__ = (
+        "id", "name", "position_type", "chain_id", "fungible_id", "protocol",
+        "quantity", "value", "price", "updated_at",
+        "_fungible_info", "_changes",
+    )
+    _fields = (
+        "id", "name", "position_type", "chain_id", "fungible_id", "protocol",
+        "quantity", "value", "price", "updated_at",
+    )
+
+    @classmethod
+    def from_json(cls, resource: Dict[str, Any]) -> "Position":
+        attributes = resource.get("attributes") or {}
+        fungible_info = attributes.get("fungible_info") or {}
+        position = cls(
+            id=resource.get("id"),
+            name=_intern(attributes.get("name")),
+            position_type=_intern(attributes.get("position_type")),
+            chain_id=_relationship_id(resource, "chain"),
+            fungible_id=(
+                _relationship_id(resource, "fungible")
+                or _intern(fungible_info.get("id"))
+            ),
+            protocol=_intern(attributes.get("protocol")),
+            quantity=_quantity(attributes.get("quantity", attributes.get("balance"))),
+            value=_float(attributes.get("value")),
+            price=_float(attributes.get("price")),
+            updated_at=attributes.get("updated_at"),
+        )
+        position._fungible_info = fungible_info or {
+            "name": attributes.get("name"),
+            "symbol": attributes.get("symbol"),
+        }
+        position._changes = attributes.get("changes")
+        return position
+
+    @property
+    def symbol(self) -> Optional[str]:
+        """Symbol of the position's token."""
+        return self.fungible_info.symbol
+
+    @property
+    def fungible_info(self) -> FungibleInfo:
+        """Token metadata, decoded on first access."""
+        if not isinstance(self._fungible_info, FungibleInfo):
+            self._fungible_info = FungibleInfo.from_json(
+                self._fungible_info or {}, self.fungible_id
+            )
+        return self._fungible_info
+
+    @property
+    def changes(self) -> Dict[str, Optional[float]]:
+        """Absolute and percent 1-day changes."""
+        return self._changes or {}
+
+
+class Transfer(Model):
+    """A single asset movement inside a transaction."""
+
+    __slots__ = (
+        "direction", "quantity", "value", "price", "sender", "recipient",
+        "_fungible_info",
+    )
+    _fields = ("direction", "quantity", "value", "price", "sender", "recipient")
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "Transfer":
+        transfer = cls(
+            direction=_intern(data.get("direction")),
+            quantity=_quantity(data.get("quantity")),
+            value=_float(data.get("value")),
+            price=_float(data.get("price")),
+            sender=_intern(data.get("sender")),
+            recipient=_intern(data.get("recipient")),
+        )
+        transfer._fungible_info = data.get("fungible_info") or {}
+        return transfer
+
+    @property
+    def fungible_info(self) -> FungibleInfo:
+        """Token metadata, decoded on first access."""
+        if not isinstance(self._fungible_info, FungibleInfo):
+            self._fungible_info = FungibleInfo.from_json(self._fungible_info or {})
+        return self._fungible_info
+
+    @property
+    def symbol(self) -> Optional[str]:
+        """Symbol of the transferred token."""
+        return self.fungible_info.symbol
+
+
+class Transaction(Model):
+    """A wallet transaction (``wallets/{address}/transactions`` item)."""
+
+    __slots__ = (
+        "id", "hash", "operation_type", "status", "chain_id", "mined_at",
+        "mined_at_block", "sent_from", "sent_to",
+        "_timestamp", "_transfers", "_fee",
+    )
+    _fields = (
+        "id", "hash", "operation_type", "status", "chain_id", "mined_at",
+        "mined_at_block", "sent_from", "sent_to",
+    )
+
+    @classmethod
+    def from_json(cls, resource: Dict[str, Any]) -> "Transaction":
+        attributes = resource.get("attributes") or {}
+        transaction = cls(
+            id=resource.get("id"),
+            hash=attributes.get("hash"),
+            operation_type=_intern(
+                attributes.get("operation_type", attributes.get("type"))
+            ),
+            status=_intern(attributes.get("status")),
+            chain_id=_relationship_id(resource, "chain"),
+            mined_at=attributes.get("mined_at", attributes.get("timestamp")),
+            mined_at_block=attributes.get("mined_at_block"),
+            sent_from=_intern(attributes.get("sent_from")),
+            sent_to=_intern(attributes.get("sent_to")),
+        )
+        transaction._transfers = attributes.get("transfers") or []
+        transaction._fee = attributes.get("fee")
+        return transaction
+
+    @property
+    def timestamp(self) -> Optional[float]:
+        """``mined_at`` as Unix seconds, parsed on first access."""
+        if self._timestamp is None:
+            self._timestamp = parse_timestamp(self.mined_at)
+        return self._timestamp
+
+    @property
+    def transfers(self) -> List[Transfer]:
+        """Asset movements, decoded on first access."""
+        if self._transfers and isinstance(self._transfers[0], dict):
+            self._transfers = [Transfer.from_json(item) for item in self._transfers]
+        return self._transfers or []
+
+    @property
+    def fee_value(self) -> Optional[float]:
+        """Fee paid, in the response currency."""
+        return _float((self._fee or {}).get("value"))
+
+
+class Portfolio(Model):
+    """Wallet portfolio summary (``wallets/{address}/portfolio``)."""
+
+    __slots__ = (
+        "id", "total_value", "change_1d_absolute", "change_1d_percent",
+        "by_type", "by_chain",
+    )
+    _fields = __slots__
+
+    @classmethod
+    def from_json(cls, resource: Dict[str, Any]) -> "Portfolio":
+        attributes = resource.get("attributes") or {}
+        changes = attributes.get("changes") or {}
+        total = (attributes.get("total") or {}).get(
+            "positions", attributes.get("total_value")
+        )
+        by_type = attributes.get("positions_distribution_by_type") or {}
+        by_chain = attributes.get("positions_distribution_by_chain") or {}
+        return cls(
+            id=resource.get("id"),
+            total_value=_float(total),
+            change_1d_absolute=_float(
+                changes.get("absolute_1d", attributes.get("total_value_change_24h"))
+            ),
+            change_1d_percent=_float(
+                changes.get(
+                    "percent_1d", attributes.get("total_value_change_24h_percentage")
+                )
+            ),
+            by_type={
+                _intern(k): _float(v)
+                for k, v in by_type.items()
+            },
+            by_chain={
+                _intern(k): _float(v)
+                for k, v in by_chain.items()
+            },
+        )
+
+
+class Page(Model):
+    """One page of a list endpoint with its parsed items."""
+
+    __slots__ = ("items", "next_link")
+    _fields = __slots__
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+
+def parse_list(response: Dict[str, Any], model: type) -> List[Any]:
+    """Parse the ``data`` array of a list response into models.
+
+    Args:
+        response: Decoded JSON:API response
+        model: Model class with a ``from_json`` constructor
+
+    Returns:
+        List of model instances
+    """
+    return [model.from_json(item) for item in response.get("data") or []]
+
+
+def parse_page(response: Dict[str, Any], model: type) -> Page:
+    """Parse a list response and keep its ``links.next`` for pagination.
+
+    Args:
+        response: Decoded JSON:API response
+        model: Model class with a ``from_json`` constructor
+
+    Returns:
+        Page of model instances
+    """
+    return Page(
+        items=parse_list(response, model),
+        next_link=(response.get("links") or {}).get("next"),
+    )
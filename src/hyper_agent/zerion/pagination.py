@@ -0,0 +1,124 @@
+"""Pagination helpers for Zerion list endpoints."""
+import asyncio
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+from .client import ZerionClient
+
+
+def next_page_request(
+    base_url: str,
+    page: Dict[str, Any]
+) -> Optional[Tuple[str, Dict[str, str]]]:
+    """Extract the request for the next page from a JSON:API response.
+
+    Args:
+        base_url: Base URL of the client, used to turn ``links.next`` back
+            into an endpoint path
+        page: Decoded response page
+
+    Returns:
+        Optional[Tuple[str, Dict[str, str]]]: Endpoint path and query
+        parameters of the next page, or None on the last page
+    """
+    link = (page.get("links") or {}).get("next")
+    if not link:
+        return None
+    parsed = urlsplit(link)
+    path = parsed.path
+    base_path = urlsplit(base_url).path.rstrip("/")
+    if base_path and path.startswith(base_path + "/"):
+        path = path[len(base_path):]
+    return path, dict(parse_qsl(parsed.query, keep_blank_values=True))
+
+
+async def iter_pages(
+    client: ZerionClient,
+    endpoint: str,
+    params: Optional[Dict[str, Any]] = None,
+    prefetch: bool = True,
+    use_cache: bool = True
+) -> AsyncIterator[Dict[str, Any]]:
+    """Iterate over the pages of a list endpoint by following ``links.next``.
+
+    With ``prefetch`` enabled the next page is requested as soon as the
+    current one arrives, so the network round trip overlaps with the
+    caller's processing. At most two pages are held in memory.
+
+    Args:
+        client: ZerionClient instance for making API requests
+        endpoint: API endpoint path of the first page
+        params: Query parameters of the first page
+        prefetch: Whether to fetch the next page in the background
+        use_cache: Set to False to bypass the response cache
+
+    Yields:
+        Dict[str, Any]: Decoded response pages
+    """
+    pending: Optional["asyncio.Future[Dict[str, Any]]"] = None
+    page = await client.request("GET", endpoint, params=params, use_cache=use_cache)
+    try:
+        while True:
+            next_request = next_page_request(client.base_url, page)
+            if next_request is not None and prefetch:
+                pending = asyncio.ensure_future(client.request(
+                    "GET", next_request[0], params=next_request[1], use_cache=use_cache
+                ))
+            yield page
+            if next_request is None:
+                return
+            if pending is not None:
+                page, pending = await pending, None
+            else:
+                page = await client.request(
+                    "GET", next_request[0], params=next_request[1], use_cache=use_cache
+                )
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
+async def iter_items(
+    client: ZerionClient,
+    endpoint: str,
+    params: Optional[Dict[str, Any]] = None,
+    max_items: Optional[int] = None,
+    stop: Optional[Callable[[Any], bool]] = None,
+    prefetch: bool = True,
+    use_cache: bool = True,
+    transform: Optional[Callable[[Dict[str, Any]], Any]] = None
+) -> AsyncIterator[Any]:
+    """Iterate over the items of a paginated list endpoint.
+
+    Args:
+        client: ZerionClient instance for making API requests
+        endpoint: API endpoint path of the first page
+        params: Query parameters of the first page
+        max_items: Stop after yielding this many items
+        stop: Predicate called for each item; iteration ends before the
+            first item for which it returns True
+        prefetch: Whether to fetch the next page in the background
+        use_cache: Set to False to bypass the response cache
+        transform: Function applied to each raw item before ``stop`` is
+            checked and the item is yielded, e.g. a model constructor
+
+    Yields:
+        Items from the ``data`` array of each page
+    """
+    if max_items is not None and max_items <= 0:
+        return
+    count = 0
+    pages = iter_pages(client, endpoint, params, prefetch=prefetch, use_cache=use_cache)
+    try:
+        async for page in pages:
+            for item in page.get("data") or []:
+                if transform is not None:
+                    item = transform(item)
+                if stop is not None and stop(item):
+                    return
+                yield item
+                count += 1
+                if max_items is not None and count >= max_items:
+                    return
+    finally:
+        await pages.aclose()
@@ -17,58 +17,78 @@ class ZerionProtocol:
         """
         self.client = client
 
-    async def get_protocol_info(self, protocol_id: str) -> Dict:
+    async def get_protocol_info(self, protocol_id: str, use_cache: bool = True) -> Dict:
         """Get information about a protocol.
 
         Args:
             protocol_id: The protocol ID to get information for
+            use_cache: Set to False to bypass the response cache
 
         Returns:
             Dict containing protocol information
         """
         return await self.client.request(
             "GET",
-            ENDPOINTS["protocol_info"].format(protocol_id=protocol_id)
+            ENDPOINTS["protocol_info"].format(protocol_id=protocol_id),
+            use_cache=use_cache
         )
 
-    async def get_protocol_pools(self, protocol_id: str) -> List[Dict]:
+    async def get_protocol_pools(
+        self,
+        protocol_id: str,
+        use_cache: bool = True
+    ) -> List[Dict]:
         """Get pools for a protocol.
 
         Args:
             protocol_id: The protocol ID to get pools for
+            use_cache: Set to False to bypass the response cache
 
         Returns:
             List of protocol pools
         """
         return await self.client.request(
             "GET",
-            ENDPOINTS["protocol_pools"].format(protocol_id=protocol_id)
+            ENDPOINTS["protocol_pools"].format(protocol_id=protocol_id),
+            use_cache=use_cache
         )
 
-    async def get_protocol_tokens(self, protocol_id: str) -> List[Dict]:
+    async def get_protocol_tokens(
+        self,
+        protocol_id: str,
+        use_cache: bool = True
+    ) -> List[Dict]:
         """Get tokens for a protocol.
 
         Args:
             protocol_id: The protocol ID to get tokens for
+            use_cache: Set to False to bypass the response cache
 
         Returns:
             List of protocol tokens
         """
         return await self.client.request(
             "GET",
-            ENDPOINTS["protocol_tokens"].format(protocol_id=protocol_id)
+            ENDPOINTS["protocol_tokens"].format(protocol_id=protocol_id),
+            use_cache=use_cache
         )
 
-    async def get_protocol_stats(self, protocol_id: str) -> Dict:
+    async def get_protocol_stats(
+        self,
+        protocol_id: str,
+        use_cache: bool = True
+    ) -> Dict:
         """Get statistics for a protocol.
 
         Args:
             protocol_id: The protocol ID to get stats for
+            use_cache: Set to False to bypass the response cache
 
         Returns:
             Dict containing protocol statistics
         """
         return await self.client.request(
             "GET",
-            ENDPOINTS["protocol_stats"].format(protocol_id=protocol_id)
+            ENDPOINTS["protocol_stats"].format(protocol_id=protocol_id),
+            use_cache=use_cache
         )
\ No newline at end of file
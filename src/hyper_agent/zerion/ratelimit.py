@@ -0,0 +1,146 @@
+"""Client-side rate limiting for Zerion API requests."""
+import asyncio
+import time
+from typing import Dict, Optional, Tuple
+
+from .endpoints import ENDPOINT_FAMILIES, endpoint_family
+
+
+class TokenBucket:
+    """Async token bucket.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``.
+    Waiters are served in FIFO order. A bucket may be used from several
+    event loops in turn, e.g. by consecutive ``asyncio.run`` calls.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """Initialize the bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size, defaults to ``max(1, rate)``
+
+        Raises:
+            ValueError: If rate or capacity is not positive.
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.capacity = float(capacity) if capacity is not None else max(1.0, self.rate)
+        if self.capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def tokens(self) -> float:
+        """Number of tokens currently available."""
+        self._refill()
+        return self._tokens
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        if now <= self._updated:
+            return
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for the given number of seconds.
+
+        Args:
+            seconds: Duration of the pause
+        """
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+        self._tokens = 0.0
+        self._updated = max(self._updated, self._blocked_until)
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """Wait until ``tokens`` are available and consume them.
+
+        Args:
+            tokens: Number of tokens to consume
+
+        Raises:
+            ValueError: If more tokens are requested than the bucket can hold.
+        """
+        if tokens > self.capacity:
+            raise ValueError("Cannot acquire more tokens than the bucket capacity")
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            # A lock stays bound to the first loop that waited on it.
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    await asyncio.sleep(self._blocked_until - now)
+                    continue
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+
+
+class RateLimiter:
+    """Rate limiter shared by every request made through a ZerionClient.
+
+    A global bucket paces all requests; optional per-family buckets (keyed by
+    the ENDPOINTS families ``wallet``, ``token`` and ``protocol``) add tighter
+    limits for specific endpoint groups. Share one instance between clients
+    to enforce a single budget across them.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[float] = None,
+        family_limits: Optional[Dict[str, Tuple[float, Optional[float]]]] = None
+    ):
+        """Initialize the rate limiter.
+
+        Args:
+            rate: Requests per second across all endpoints
+            burst: Maximum burst size, defaults to ``max(1, rate)``
+            family_limits: Mapping of endpoint family to ``(rate, burst)``
+
+        Raises:
+            ValueError: If a family is not one of the ENDPOINTS families.
+        """
+        self.bucket = TokenBucket(rate, burst)
+        self.family_buckets: Dict[str, TokenBucket] = {}
+        for family, (family_rate, family_burst) in (family_limits or {}).items():
+            if family not in ENDPOINT_FAMILIES.values():
+                raise ValueError(f"Unknown endpoint family: {family}")
+            self.family_buckets[family] = TokenBucket(family_rate, family_burst)
+
+    async def acquire(self, endpoint: str) -> None:
+        """Wait for permission to send a request to ``endpoint``.
+
+        Args:
+            endpoint: API endpoint path
+        """
+        family = endpoint_family(endpoint)
+        if family in self.family_buckets:
+            await self.family_buckets[family].acquire()
+        await self.bucket.acquire()
+
+    def pause(self, seconds: float, endpoint: Optional[str] = None) -> None:
+        """Hold back all requests, e.g. after the server answered 429.
+
+        Args:
+            seconds: Duration of the pause
+            endpoint: Endpoint that was throttled; only its family bucket is
+                paused when the family has its own limit
+        """
+        family = endpoint_family(endpoint) if endpoint else None
+        if family in self.family_buckets:
+            self.family_buckets[family].pause(seconds)
+        else:
+            self.bucket.pause(seconds)
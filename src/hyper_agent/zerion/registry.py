@@ -0,0 +1,282 @@
+"""Shared token metadata registry.
+
+Every position of a positions response carries its own copy of the token's
+``fungible_info``. Across many wallets the same few hundred tokens repeat
+millions of times, so the registry keeps one FungibleInfo per token id and
+normalizes positions and transfers to reference it, releasing their raw
+metadata dicts::
+
+    wallet = ZerionWallet(client, registry=default_registry)
+    positions = await wallet.get_wallet_balances(address, parse=True)
+    usdc = default_registry.by_address("ethereum", "0xa0b8...")
+
+Tokens seen without usable metadata are fetched lazily through
+``ZerionToken.get_token_info`` by :meth:`TokenRegistry.resolve`, once per
+token however many callers ask concurrently.
+"""
+import asyncio
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from .bulk import run_bulk
+from .constants import DEFAULT_BULK_CONCURRENCY
+from .models import FungibleInfo, Position, Transfer, normalize_address
+
+if TYPE_CHECKING:
+    from .token import ZerionToken
+
+T = TypeVar("T", Position, Transfer)
+
+
+class RegistryStats:
+    """Counters of registry lookups and token info fetches."""
+
+    __slots__ = ("hits", "misses", "fetches")
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.fetches = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        """Return the counters as a plain dict."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+def _is_complete(info: FungibleInfo) -> bool:
+    return info.symbol is not None and bool(info._implementations)
+
+
+def _fills_gap(info: FungibleInfo, data: Dict[str, Any]) -> bool:
+    """Whether raw metadata has fields the shared record lacks."""
+    return bool(
+        (info.symbol is None and data.get("symbol"))
+        or (not info._implementations and data.get("implementations"))
+    )
+
+
+class TokenRegistry:
+    """One shared FungibleInfo per token id, with secondary lookups.
+
+    Records are never replaced once registered, so references handed out
+    stay valid; richer metadata seen later is merged into them in place.
+    """
+
+    def __init__(self, token: Optional["ZerionToken"] = None):
+        """Initialize the registry.
+
+        Args:
+            token: ZerionToken used by :meth:`resolve` to fill gaps
+        """
+        self.token = token
+        self.stats = RegistryStats()
+        self._by_id: Dict[str, FungibleInfo] = {}
+        self._by_symbol: Dict[str, List[FungibleInfo]] = {}
+        self._by_address: Dict[Tuple[str, str], FungibleInfo] = {}
+        self._fetches: Dict[str, "asyncio.Future[FungibleInfo]"] = {}
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __contains__(self, token_id: object) -> bool:
+        return token_id in self._by_id
+
+    def _index(self, info: FungibleInfo) -> None:
+        if info.symbol is not None:
+            entries = self._by_symbol.setdefault(info.symbol.upper(), [])
+            if not any(entry is info for entry in entries):
+                entries.append(info)
+        for implementation in info.implementations:
+            if implementation.chain_id and implementation.address:
+                key = (
+                    implementation.chain_id,
+                    normalize_address(implementation.address),
+                )
+                self._by_address.setdefault(key, info)
+
+    def _merge(self, info: FungibleInfo, other: FungibleInfo) -> None:
+        for name in ("name", "symbol", "icon_url", "verified"):
+            if getattr(info, name) is None:
+                setattr(info, name, getattr(other, name))
+        if not info._implementations:
+            info._implementations = other._implementations
+        self._index(info)
+
+    def add(self, info: FungibleInfo) -> FungibleInfo:
+        """Register token metadata.
+
+        Args:
+            info: Token metadata with an id
+
+        Returns:
+            FungibleInfo: The shared record for the token, which is ``info``
+            itself unless the token was already registered
+
+        Raises:
+            ValueError: If ``info`` has no id.
+        """
+        if info.id is None:
+            raise ValueError("Only tokens with an id can be registered")
+        shared = self._by_id.get(info.id)
+        if shared is None:
+            self._by_id[info.id] = info
+            self._index(info)
+            return info
+        if shared is not info and not _is_complete(shared):
+            self._merge(shared, info)
+        return shared
+
+    def intern(
+        self,
+        data: Optional[Dict[str, Any]],
+        token_id: Optional[str] = None
+    ) -> FungibleInfo:
+        """Get the shared record for raw ``fungible_info`` metadata.
+
+        Metadata of a registered token is only decoded when it can fill
+        gaps in the shared record.
+
+        Args:
+            data: Raw fungible attributes, e.g. a position's ``fungible_info``
+            token_id: Token id, when known from the enclosing resource
+
+        Returns:
+            FungibleInfo: The shared record, or an unregistered one for
+            metadata without an id
+        """
+        data = data or {}
+        token_id = token_id if token_id is not None else data.get("id")
+        shared = self._by_id.get(token_id) if token_id is not None else None
+        if shared is not None:
+            self.stats.hits += 1
+            if _fills_gap(shared, data):
+                self._merge(shared, FungibleInfo.from_json(data, token_id))
+            return shared
+        self.stats.misses += 1
+        info = FungibleInfo.from_json(data, token_id)
+        return self.add(info) if token_id is not None else info
+
+    def normalize(self, item: T) -> T:
+        """Point a position's or transfer's token metadata at the shared record.
+
+        Args:
+            item: A Position or Transfer
+
+        Returns:
+            The same item, for chaining
+        """
+        raw = item._fungible_info
+        if isinstance(raw, FungibleInfo):
+            item._fungible_info = self.add(raw) if raw.id is not None else raw
+        else:
+            item._fungible_info = self.intern(raw, getattr(item, "fungible_id", None))
+        return item
+
+    def normalize_all(self, items: Iterable[T]) -> List[T]:
+        """Normalize many positions or transfers; see :meth:`normalize`."""
+        return [self.normalize(item) for item in items]
+
+    def get(self, token_id: str) -> Optional[FungibleInfo]:
+        """Look up a token by Zerion fungible id."""
+        return self._by_id.get(token_id)
+
+    def by_symbol(self, symbol: str) -> List[FungibleInfo]:
+        """Look up tokens by symbol, case-insensitively.
+
+        Symbols are not unique, so every registered match is returned.
+        """
+        return list(self._by_symbol.get(symbol.upper(), ()))
+
+    def by_address(self, chain_id: str, address: str) -> Optional[FungibleInfo]:
+        """Look up a token by its contract address on a chain.
+
+        EVM addresses match case-insensitively; others, e.g. Solana mints,
+        must match exactly.
+        """
+        return self._by_address.get((chain_id, normalize_address(address)))
+
+    def clear(self) -> None:
+        """Forget all registered tokens."""
+        self._by_id.clear()
+        self._by_symbol.clear()
+        self._by_address.clear()
+
+    async def resolve(
+        self,
+        token_id: str,
+        token: Optional["ZerionToken"] = None
+    ) -> FungibleInfo:
+        """Get a token's complete metadata, fetching it if needed.
+
+        Args:
+            token_id: Zerion fungible id
+            token: ZerionToken to fetch with, defaults to :attr:`token`
+
+        Returns:
+            FungibleInfo: The shared record
+
+        Raises:
+            ValueError: If a fetch is needed and no ZerionToken is available.
+        """
+        shared = self._by_id.get(token_id)
+        if shared is not None and _is_complete(shared):
+            return shared
+        pending = self._fetches.get(token_id)
+        if pending is not None:
+            return await asyncio.shield(pending)
+        token = token if token is not None else self.token
+        if token is None:
+            raise ValueError("A ZerionToken is required to fetch token metadata")
+        future = asyncio.get_running_loop().create_future()
+        self._fetches[token_id] = future
+        try:
+            self.stats.fetches += 1
+            info = await token.get_token_info(token_id, parse=True)
+            if info.id is None:
+                info.id = token_id
+            result = self.add(info)
+            future.set_result(result)
+            return result
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Mark the exception retrieved when no other caller was waiting.
+            future.exception()
+            raise
+        finally:
+            del self._fetches[token_id]
+
+    async def resolve_many(
+        self,
+        token_ids: Iterable[str],
+        token: Optional["ZerionToken"] = None,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY
+    ) -> Dict[str, Union[FungibleInfo, BaseException]]:
+        """Resolve many tokens with bounded concurrency.
+
+        Args:
+            token_ids: Zerion fungible ids; duplicates are resolved once
+            token: ZerionToken to fetch with, defaults to :attr:`token`
+            concurrency: Maximum number of concurrent fetches
+
+        Returns:
+            Shared records keyed by id, or the exception a fetch raised
+        """
+        async def fetch(token_id: str) -> FungibleInfo:
+            return await self.resolve(token_id, token)
+
+        return {
+            result.key: result.value if result.ok else result.error
+            async for result in run_bulk(dict.fromkeys(token_ids), fetch, concurrency)
+        }
+
+
+default_registry = TokenRegistry()
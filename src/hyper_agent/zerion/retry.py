@@ -0,0 +1,169 @@
+"""Retry policy for Zerion API requests."""
+import asyncio
+import logging
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Awaitable, Callable, FrozenSet, Optional, Tuple, Type, TypeVar
+
+import aiohttp
+
+from .exceptions import ZerionAPIError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_RETRY_STATUSES: FrozenSet[int] = frozenset({429, 500, 502, 503, 504})
+DEFAULT_RETRY_METHODS: FrozenSet[str] = frozenset({"GET", "HEAD", "OPTIONS"})
+DEFAULT_RETRY_EXCEPTIONS: Tuple[Type[BaseException], ...] = (
+    aiohttp.ClientConnectionError,
+    aiohttp.ClientPayloadError,
+    asyncio.TimeoutError,
+)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a ``Retry-After`` header value.
+
+    Args:
+        value: Header value, either delay-seconds or an HTTP-date
+
+    Returns:
+        Optional[float]: Seconds to wait, or None if the value is missing or invalid
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryPolicy:
+    """Exponential backoff retry policy with full jitter.
+
+    Failed attempts are retried when the error is a retryable HTTP status
+    (429 and 5xx by default) or a transient transport error. The delay before
+    attempt ``n + 1`` is drawn uniformly from ``[0, min(backoff_max,
+    backoff_base * 2 ** (n - 1))]``; a ``Retry-After`` sent by the server takes
+    precedence when ``respect_retry_after`` is set.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        jitter: bool = True,
+        total_timeout: Optional[float] = 120.0,
+        respect_retry_after: bool = True,
+        max_retry_after: float = 60.0,
+        retry_statuses: FrozenSet[int] = DEFAULT_RETRY_STATUSES,
+        retry_exceptions: Tuple[Type[BaseException], ...] = DEFAULT_RETRY_EXCEPTIONS,
+        retry_methods: FrozenSet[str] = DEFAULT_RETRY_METHODS
+    ):
+        """Initialize the retry policy.
+
+        Args:
+            max_attempts: Total number of attempts, including the first one
+            backoff_base: Base delay in seconds for exponential backoff
+            backoff_max: Upper bound for a single backoff delay
+            jitter: Whether to randomize delays (full jitter)
+            total_timeout: Time budget in seconds across all attempts, None for no budget
+            respect_retry_after: Whether to wait for the server's ``Retry-After``
+            max_retry_after: Upper bound applied to ``Retry-After`` values
+            retry_statuses: HTTP status codes that are retried
+            retry_exceptions: Exception classes that are retried
+            retry_methods: HTTP methods that are safe to retry
+
+        Raises:
+            ValueError: If max_attempts is lower than 1.
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.total_timeout = total_timeout
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_exceptions = tuple(retry_exceptions)
+        self.retry_methods = frozenset(m.upper() for m in retry_methods)
+
+    def is_retryable(self, method: str, exc: BaseException) -> bool:
+        """Check whether a failed attempt may be retried.
+
+        Args:
+            method: HTTP method of the request
+            exc: Exception raised by the attempt
+
+        Returns:
+            bool: True if the request should be retried
+        """
+        if method.upper() not in self.retry_methods:
+            return False
+        if isinstance(exc, ZerionAPIError):
+            return exc.status in self.retry_statuses
+        return isinstance(exc, self.retry_exceptions)
+
+    def get_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Compute the delay before the next attempt.
+
+        Args:
+            attempt: Number of the attempt that just failed, starting at 1
+            retry_after: Delay requested by the server, if any
+
+        Returns:
+            float: Seconds to sleep before retrying
+        """
+        if self.respect_retry_after and retry_after is not None:
+            return min(retry_after, self.max_retry_after)
+        delay = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    async def call(self, method: str, func: Callable[[], Awaitable[T]]) -> T:
+        """Run ``func`` until it succeeds or the policy gives up.
+
+        Args:
+            method: HTTP method of the request, used to decide retryability
+            func: Zero-argument callable returning a fresh awaitable per attempt
+
+        Returns:
+            The result of the first successful attempt
+
+        Raises:
+            Exception: The last error once attempts or time budget are exhausted
+        """
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                return await func()
+            except Exception as exc:
+                if attempt >= self.max_attempts or not self.is_retryable(method, exc):
+                    raise
+                delay = self.get_delay(attempt, getattr(exc, "retry_after", None))
+                if self.total_timeout is not None:
+                    elapsed = time.monotonic() - started
+                    if elapsed + delay > self.total_timeout:
+                        raise
+                logger.debug(
+                    "Retrying %s after %r (attempt %d/%d, sleeping %.2fs)",
+                    method, exc, attempt, self.max_attempts, delay
+                )
+                await asyncio.sleep(delay)
@@ -0,0 +1,329 @@
+"""Append-only store of wallet portfolio snapshots.
+
+Each snapshot is a fixed-width little-endian record of timestamp, wallet
+index, total value and one value per configured chain, plus an ``other``
+column for the remaining chains. Records are appended to a single file and
+read back through a memory map, so range reads over months of snapshots of
+thousands of wallets cost no parsing and, for time ranges, no copy::
+
+    with SnapshotStore("portfolios.snap") as store:
+        store.append(address, await wallet.get_wallet_portfolio(address))
+        records = store.read(start=time.time() - 30 * 86400)
+        history = store.history(address)
+
+Wallet addresses are kept in a ``<path>.wallets`` file, one per line, in
+the order of their wallet index. EVM addresses are matched
+case-insensitively; others, e.g. Solana's, are case-sensitive and kept as
+given. Writing needs only the standard library; reading returns NumPy
+structured arrays and needs the ``analytics`` extra.
+"""
+import json
+import math
+import os
+import struct
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from .columnar import _require_numpy
+from .constants import DEFAULT_SNAPSHOT_CHAINS
+from .models import Portfolio, normalize_address
+
+MAGIC = b"ZSNP"
+VERSION = 1
+_PREFIX = struct.Struct("<4sHI")
+
+Snapshot = Union[Dict[str, Any], Portfolio]
+
+
+def _portfolio(snapshot: Snapshot) -> Portfolio:
+    if isinstance(snapshot, Portfolio):
+        return snapshot
+    if isinstance(snapshot.get("data"), dict):
+        snapshot = snapshot["data"]
+    return Portfolio.from_json(snapshot)
+
+
+class SnapshotStore:
+    """Memory-mapped, append-only portfolio snapshot file.
+
+    Records keep their append order. Time range reads are zero-copy slices
+    while snapshots are appended in timestamp order, and fall back to a
+    filtered copy otherwise. Per-wallet reads use a wallet-to-record index
+    built on first use and kept up to date by later appends.
+    """
+
+    def __init__(self, path: str, chains: Sequence[str] = DEFAULT_SNAPSHOT_CHAINS):
+        """Open or create a store.
+
+        Args:
+            path: Snapshot file path; parent directories are created
+            chains: Chains with their own value column in a new store; an
+                existing store keeps the chains it was created with
+
+        Raises:
+            ValueError: If the file is not a snapshot store.
+        """
+        self.path = path
+        self.wallets_path = path + ".wallets"
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        if os.path.exists(path) and os.path.getsize(path) > 0:
+            self.chains, self._header_size = self._read_header()
+        else:
+            self.chains = tuple(chains)
+            self._header_size = self._write_header()
+        self.columns = self.chains + ("other",)
+        self._chain_index = {chain: i for i, chain in enumerate(self.chains)}
+        self._record = struct.Struct(f"<dId{len(self.columns)}d")
+        self.wallets: List[str] = []
+        if os.path.exists(self.wallets_path):
+            with open(self.wallets_path, encoding="utf-8") as file:
+                self.wallets = [line.rstrip("\n") for line in file if line.strip()]
+        self._wallet_ids = {address: i for i, address in enumerate(self.wallets)}
+        size = os.path.getsize(path) - self._header_size
+        self._count = size // self._record.size
+        self._file = open(path, "r+b")
+        # Drop a partial record left by an interrupted write.
+        self._file.truncate(self._header_size + self._count * self._record.size)
+        self._file.seek(0, os.SEEK_END)
+        self._wallets_file = open(self.wallets_path, "a", encoding="utf-8")
+        self._map: Any = None
+        self._mapped = 0
+        self._last_timestamp: Optional[float] = None
+        self._ordered: Optional[bool] = None if self._count else True
+        self._index: Optional[Tuple[Any, Any, Any]] = None
+        self._pending: Dict[int, List[int]] = {}
+
+    def _write_header(self) -> int:
+        meta = json.dumps({"chains": list(self.chains)}).encode("utf-8")
+        size = _PREFIX.size + len(meta)
+        padding = -size % 8
+        with open(self.path, "wb") as file:
+            file.write(_PREFIX.pack(MAGIC, VERSION, size + padding))
+            file.write(meta + b" " * padding)
+        return size + padding
+
+    def _read_header(self) -> Tuple[Tuple[str, ...], int]:
+        with open(self.path, "rb") as file:
+            magic, version, header_size = _PREFIX.unpack(file.read(_PREFIX.size))
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(
+                    f"{self.path} is not a version {VERSION} snapshot store"
+                )
+            meta = json.loads(file.read(header_size - _PREFIX.size))
+        return tuple(meta["chains"]), header_size
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __enter__(self) -> "SnapshotStore":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    @property
+    def dtype(self) -> Any:
+        """NumPy dtype of one record."""
+        np = _require_numpy()
+        return np.dtype([
+            ("timestamp", "<f8"),
+            ("wallet", "<u4"),
+            ("total", "<f8"),
+            ("chains", "<f8", (len(self.columns),)),
+        ])
+
+    def wallet_id(self, address: str) -> Optional[int]:
+        """Get the wallet index of an address, or None if never stored."""
+        return self._wallet_ids.get(normalize_address(address))
+
+    def _register(self, address: str) -> int:
+        address = normalize_address(address)
+        wallet = self._wallet_ids.get(address)
+        if wallet is None:
+            wallet = self._wallet_ids[address] = len(self.wallets)
+            self.wallets.append(address)
+            # The address must be on disk before any record referencing it.
+            self._wallets_file.write(address + "\n")
+            self._wallets_file.flush()
+        return wallet
+
+    def append(
+        self,
+        address: str,
+        snapshot: Snapshot,
+        timestamp: Optional[float] = None
+    ) -> int:
+        """Append a portfolio snapshot.
+
+        Args:
+            address: The wallet address
+            snapshot: A portfolio response, its ``data`` resource or a
+                Portfolio model
+            timestamp: Unix seconds of the snapshot, defaults to now
+
+        Returns:
+            int: Record number of the snapshot
+        """
+        portfolio = _portfolio(snapshot)
+        timestamp = time.time() if timestamp is None else float(timestamp)
+        wallet = self._register(address)
+        values = [0.0] * len(self.columns)
+        for chain, value in (portfolio.by_chain or {}).items():
+            column = self._chain_index.get(chain, len(self.chains))
+            values[column] += value if value is not None else 0.0
+        total = portfolio.total_value
+        self._file.write(self._record.pack(
+            timestamp, wallet, math.nan if total is None else total, *values
+        ))
+        if self._ordered and self._last_timestamp is not None:
+            self._ordered = timestamp >= self._last_timestamp
+        self._last_timestamp = timestamp
+        if self._index is not None:
+            self._pending.setdefault(wallet, []).append(self._count)
+        self._count += 1
+        return self._count - 1
+
+    def extend(self, snapshots: Iterable[Tuple[str, Snapshot, Optional[float]]]) -> int:
+        """Append many ``(address, snapshot, timestamp)`` tuples.
+
+        Returns:
+            int: Number of snapshots appended
+        """
+        count = 0
+        for address, snapshot, timestamp in snapshots:
+            self.append(address, snapshot, timestamp)
+            count += 1
+        return count
+
+    def flush(self) -> None:
+        """Write buffered records to the file."""
+        self._file.flush()
+
+    def close(self) -> None:
+        """Flush and close the store; arrays read from it stay valid."""
+        if self._file.closed:
+            return
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+        self._wallets_file.close()
+        self._map = None
+
+    def records(self) -> Any:
+        """Get all records as a read-only memory-mapped structured array."""
+        np = _require_numpy()
+        if self._map is None or self._mapped != self._count:
+            self.flush()
+            if self._count == 0:
+                self._map = np.empty(0, dtype=self.dtype)
+            else:
+                self._map = np.memmap(
+                    self.path, dtype=self.dtype, mode="r",
+                    offset=self._header_size, shape=(self._count,)
+                )
+            self._mapped = self._count
+        return self._map
+
+    def _is_ordered(self, timestamps: Any) -> bool:
+        if self._ordered is None:
+            np = _require_numpy()
+            self._ordered = bool(np.all(timestamps[1:] >= timestamps[:-1]))
+            self._last_timestamp = float(timestamps[-1])
+        return self._ordered
+
+    def read(
+        self,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        wallets: Optional[Iterable[str]] = None
+    ) -> Any:
+        """Read snapshots in a time range.
+
+        Args:
+            start: Earliest timestamp to include
+            end: Timestamp to stop before
+            wallets: Only include these addresses
+
+        Returns:
+            Structured array with ``timestamp``, ``wallet``, ``total`` and
+            ``chains`` fields; a view of the memory map unless filtered by
+            wallet or the snapshots are out of timestamp order
+        """
+        np = _require_numpy()
+        records = self.records()
+        if len(records) and (start is not None or end is not None):
+            timestamps = records["timestamp"]
+            if self._is_ordered(timestamps):
+                low = 0 if start is None else np.searchsorted(timestamps, start, "left")
+                high = (
+                    len(records) if end is None
+                    else np.searchsorted(timestamps, end, "left")
+                )
+                records = records[low:high]
+            else:
+                mask = np.ones(len(records), dtype=bool)
+                if start is not None:
+                    mask &= timestamps >= start
+                if end is not None:
+                    mask &= timestamps < end
+                records = records[mask]
+        if wallets is not None:
+            ids = [self.wallet_id(address) for address in wallets]
+            ids = np.array([i for i in ids if i is not None], dtype="<u4")
+            records = records[np.isin(records["wallet"], ids)]
+        return records
+
+    def _record_numbers(self, wallet: int) -> Any:
+        np = _require_numpy()
+        if self._index is None:
+            column = self.records()["wallet"]
+            order = np.argsort(column, kind="stable")
+            counts = np.bincount(column, minlength=len(self.wallets))
+            starts = np.concatenate(([0], np.cumsum(counts)))
+            self._index = (order, starts, len(self.wallets))
+            self._pending = {}
+        order, starts, indexed = self._index
+        numbers = order[starts[wallet]:starts[wallet + 1]] if wallet < indexed else []
+        pending = self._pending.get(wallet)
+        if pending:
+            numbers = np.concatenate((numbers, pending)).astype(np.intp)
+        return numbers
+
+    def history(
+        self,
+        address: str,
+        start: Optional[float] = None,
+        end: Optional[float] = None
+    ) -> Any:
+        """Read one wallet's snapshots in append order.
+
+        Args:
+            address: The wallet address
+            start: Earliest timestamp to include
+            end: Timestamp to stop before
+
+        Returns:
+            Structured array of the wallet's records, empty if unknown
+        """
+        np = _require_numpy()
+        wallet = self.wallet_id(address)
+        if wallet is None:
+            return np.empty(0, dtype=self.dtype)
+        records = self.records()[self._record_numbers(wallet)]
+        if start is not None:
+            records = records[records["timestamp"] >= start]
+        if end is not None:
+            records = records[records["timestamp"] < end]
+        return records
+
+    def chain_values(self, records: Any, chain: str) -> Any:
+        """Get one chain's value column of records from this store.
+
+        Args:
+            records: Structured array returned by :meth:`read` or :meth:`history`
+            chain: A configured chain, or ``other``
+
+        Returns:
+            float64 array of the chain's values
+        """
+        return records["chains"][:, self.columns.index(chain)]
@@ -0,0 +1,185 @@
+"""Persistent SQLite response cache for Zerion API requests."""
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, Callable, Optional, TypeVar
+
+from .cache import CacheBackend
+from .constants import (
+    DEFAULT_SQLITE_CACHE_MAX_BYTES,
+    DEFAULT_SQLITE_CACHE_TOUCH_INTERVAL,
+)
+
+T = TypeVar("T")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_expires_at ON responses (expires_at);
+CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+"""
+
+
+class SQLiteCache(CacheBackend):
+    """Response cache stored in a SQLite database.
+
+    Entries survive process restarts and the file can be shared by several
+    processes: the database runs in WAL mode so readers do not block the
+    writer, and writers wait on each other for up to ``busy_timeout``.
+    Values are stored as zlib-compressed JSON. When the total stored size
+    exceeds ``max_bytes``, expired entries and then the least recently used
+    ones are evicted. Recency is tracked to within ``touch_interval``
+    seconds, so most reads do not write to the database.
+
+    Database calls run in the event loop's default executor.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = DEFAULT_SQLITE_CACHE_MAX_BYTES,
+        compression_level: int = 6,
+        busy_timeout: float = 30.0,
+        evict_interval: int = 100,
+        touch_interval: float = DEFAULT_SQLITE_CACHE_TOUCH_INTERVAL
+    ):
+        """Initialize the cache.
+
+        Args:
+            path: Database file path; ``~`` is expanded and parent
+                directories are created
+            max_bytes: Maximum total size of stored (compressed) values
+            compression_level: zlib level from 0 (none) to 9 (smallest)
+            busy_timeout: Seconds to wait for another process's write lock
+            evict_interval: Number of writes between size checks
+            touch_interval: Seconds after which a read refreshes an entry's
+                last access time; 0 refreshes it on every read
+        """
+        super().__init__()
+        path = os.path.expanduser(path)
+        self.path = path
+        self.max_bytes = max_bytes
+        self.compression_level = compression_level
+        self.evict_interval = evict_interval
+        self.touch_interval = touch_interval
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._conn = sqlite3.connect(
+            path, timeout=busy_timeout, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._locked, func, *args)
+
+    def _locked(self, func: Callable[..., T], *args: Any) -> T:
+        with self._lock:
+            return func(*args)
+
+    def _get(self, key: str) -> Optional[Any]:
+        row = self._conn.execute(
+            "SELECT value, expires_at, accessed_at FROM responses WHERE key = ?",
+            (key,),
+        ).fetchone()
+        now = time.time()
+        if row is None:
+            self.stats.misses += 1
+            return None
+        value, expires_at, accessed_at = row
+        if expires_at <= now:
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return None
+        if now - accessed_at >= self.touch_interval:
+            self._conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+        self.stats.hits += 1
+        return json.loads(zlib.decompress(value))
+
+    def _set(self, key: str, value: Any, ttl: float) -> None:
+        blob = zlib.compress(
+            json.dumps(value, separators=(",", ":")).encode("utf-8"),
+            self.compression_level,
+        )
+        now = time.time()
+        self._conn.execute(
+            "INSERT OR REPLACE INTO responses (key, value, size, expires_at, accessed_at)"
+            " VALUES (?, ?, ?, ?, ?)",
+            (key, blob, len(blob), now + ttl, now),
+        )
+        self._writes += 1
+        if self._writes % self.evict_interval == 0:
+            self._evict()
+
+    def _evict(self) -> None:
+        self._conn.execute("DELETE FROM responses WHERE expires_at <= ?", (time.time(),))
+        (total,) = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        while total > self.max_bytes:
+            rows = self._conn.execute(
+                "SELECT key, size FROM responses ORDER BY accessed_at LIMIT 100"
+            ).fetchall()
+            if not rows:
+                break
+            victims = []
+            for key, size in rows:
+                victims.append((key,))
+                total -= size
+                if total <= self.max_bytes:
+                    break
+            self._conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+            self.stats.evictions += len(victims)
+
+    def _delete(self, key: str) -> None:
+        self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def _clear(self) -> None:
+        self._conn.execute("DELETE FROM responses")
+
+    def _size(self) -> int:
+        (total,) = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        return total
+
+    async def get(self, key: str) -> Optional[Any]:
+        return await self._run(self._get, key)
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        if ttl <= 0:
+            return
+        await self._run(self._set, key, value, ttl)
+
+    async def delete(self, key: str) -> None:
+        await self._run(self._delete, key)
+
+    async def clear(self) -> None:
+        await self._run(self._clear)
+
+    async def evict(self) -> None:
+        """Remove expired entries and enforce ``max_bytes`` now."""
+        await self._run(self._evict)
+
+    async def size(self) -> int:
+        """Total size in bytes of the stored (compressed) values."""
+        return await self._run(self._size)
+
+    async def close(self) -> None:
+        await self._run(self._conn.close)
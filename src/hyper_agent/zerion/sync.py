@@ -0,0 +1,366 @@
+"""Incremental transaction sync with per-wallet checkpoints."""
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+from .bulk import BulkResult, run_bulk
+from .constants import DEFAULT_BULK_CONCURRENCY
+from .models import Transaction, normalize_address, parse_timestamp
+from .wallet import ZerionWallet
+
+T = TypeVar("T")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoints (
+    address TEXT PRIMARY KEY,
+    mined_at REAL NOT NULL,
+    ids TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+"""
+
+
+class Checkpoint:
+    """High-water mark of a wallet's synced transaction history.
+
+    ``mined_at`` is the timestamp of the newest synced transaction and
+    ``ids`` holds the ids of all synced transactions mined at that exact
+    time, so transactions sharing a block are neither skipped nor repeated.
+    """
+
+    __slots__ = ("address", "mined_at", "ids", "updated_at")
+
+    def __init__(
+        self,
+        address: str,
+        mined_at: float,
+        ids: Iterable[str],
+        updated_at: Optional[float] = None
+    ):
+        self.address = address
+        self.mined_at = mined_at
+        self.ids = frozenset(ids)
+        self.updated_at = time.time() if updated_at is None else updated_at
+
+    def __repr__(self) -> str:
+        return (
+            f"Checkpoint(address={self.address!r}, mined_at={self.mined_at!r}, "
+            f"ids={sorted(self.ids)!r})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Checkpoint):
+            return NotImplemented
+        return (self.address, self.mined_at, self.ids) == (
+            other.address, other.mined_at, other.ids
+        )
+
+    def is_seen(self, tx: Dict[str, Any]) -> bool:
+        """Check whether a raw transaction is covered by this checkpoint.
+
+        Args:
+            tx: Transaction resource in Zerion's JSON:API shape
+
+        Returns:
+            bool: True if the transaction is at or before the high-water mark
+        """
+        mined_at = _mined_at(tx)
+        if mined_at is None:
+            return False
+        if mined_at < self.mined_at:
+            return True
+        return mined_at == self.mined_at and tx.get("id") in self.ids
+
+    def is_older(self, tx: Dict[str, Any]) -> bool:
+        """Check whether a raw transaction was mined before the high-water mark.
+
+        Unlike :meth:`is_seen`, transactions mined at the mark itself are not
+        older, because unseen ones may be listed after seen ones.
+
+        Args:
+            tx: Transaction resource in Zerion's JSON:API shape
+
+        Returns:
+            bool: True if the transaction is strictly before the mark
+        """
+        mined_at = _mined_at(tx)
+        return mined_at is not None and mined_at < self.mined_at
+
+
+def _mined_at(tx: Dict[str, Any]) -> Optional[float]:
+    return parse_timestamp((tx.get("attributes") or {}).get("mined_at"))
+
+
+def advance_checkpoint(
+    address: str,
+    checkpoint: Optional[Checkpoint],
+    transactions: List[Dict[str, Any]]
+) -> Optional[Checkpoint]:
+    """Compute the checkpoint after syncing new transactions.
+
+    Args:
+        address: The wallet address
+        checkpoint: Checkpoint before the sync, if any
+        transactions: Newly synced raw transactions
+
+    Returns:
+        Optional[Checkpoint]: The new checkpoint, or the old one if none of
+        the transactions carry a timestamp
+    """
+    latest = None
+    ids = set()
+    for tx in transactions:
+        mined_at = _mined_at(tx)
+        if mined_at is None:
+            continue
+        if latest is None or mined_at > latest:
+            latest, ids = mined_at, {tx.get("id")}
+        elif mined_at == latest:
+            ids.add(tx.get("id"))
+    if latest is None:
+        return checkpoint
+    if checkpoint is not None:
+        if latest < checkpoint.mined_at:
+            return checkpoint
+        if latest == checkpoint.mined_at:
+            ids |= checkpoint.ids
+    return Checkpoint(address, latest, ids)
+
+
+class CheckpointStore:
+    """Interface for checkpoint storage.
+
+    Implement this class to keep checkpoints somewhere else, e.g. in the
+    database the synced transactions are written to.
+    """
+
+    async def get(self, address: str) -> Optional[Checkpoint]:
+        """Get a wallet's checkpoint.
+
+        Args:
+            address: The wallet address
+
+        Returns:
+            Optional[Checkpoint]: The checkpoint, or None if never synced
+        """
+        raise NotImplementedError
+
+    async def set(self, checkpoint: Checkpoint) -> None:
+        """Store a wallet's checkpoint, replacing any previous one.
+
+        Args:
+            checkpoint: Checkpoint to store
+        """
+        raise NotImplementedError
+
+    async def delete(self, address: str) -> None:
+        """Forget a wallet's checkpoint so the next sync starts over.
+
+        Args:
+            address: The wallet address
+        """
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        """Release resources held by the store."""
+
+
+class MemoryCheckpointStore(CheckpointStore):
+    """Checkpoint store kept in process memory."""
+
+    def __init__(self):
+        self._checkpoints: Dict[str, Checkpoint] = {}
+
+    async def get(self, address: str) -> Optional[Checkpoint]:
+        return self._checkpoints.get(normalize_address(address))
+
+    async def set(self, checkpoint: Checkpoint) -> None:
+        self._checkpoints[normalize_address(checkpoint.address)] = checkpoint
+
+    async def delete(self, address: str) -> None:
+        self._checkpoints.pop(normalize_address(address), None)
+
+
+class SQLiteCheckpointStore(CheckpointStore):
+    """Checkpoint store kept in a SQLite database.
+
+    The database runs in WAL mode and may be shared with a
+    :class:`~hyper_agent.zerion.sqlite_cache.SQLiteCache` file. Database
+    calls run in the event loop's default executor.
+    """
+
+    def __init__(self, path: str, busy_timeout: float = 30.0):
+        """Initialize the store.
+
+        Args:
+            path: Database file path; parent directories are created
+            busy_timeout: Seconds to wait for another process's write lock
+        """
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            path, timeout=busy_timeout, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._locked, func, *args)
+
+    def _locked(self, func: Callable[..., T], *args: Any) -> T:
+        with self._lock:
+            return func(*args)
+
+    def _get(self, address: str) -> Optional[Checkpoint]:
+        row = self._conn.execute(
+            "SELECT mined_at, ids, updated_at FROM checkpoints WHERE address = ?",
+            (normalize_address(address),),
+        ).fetchone()
+        if row is None:
+            return None
+        mined_at, ids, updated_at = row
+        return Checkpoint(address, mined_at, json.loads(ids), updated_at)
+
+    def _set(self, checkpoint: Checkpoint) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO checkpoints (address, mined_at, ids, updated_at)"
+            " VALUES (?, ?, ?, ?)",
+            (
+                normalize_address(checkpoint.address),
+                checkpoint.mined_at,
+                json.dumps(sorted(checkpoint.ids)),
+                checkpoint.updated_at,
+            ),
+        )
+
+    def _delete(self, address: str) -> None:
+        self._conn.execute(
+            "DELETE FROM checkpoints WHERE address = ?", (normalize_address(address),)
+        )
+
+    async def get(self, address: str) -> Optional[Checkpoint]:
+        return await self._run(self._get, address)
+
+    async def set(self, checkpoint: Checkpoint) -> None:
+        await self._run(self._set, checkpoint)
+
+    async def delete(self, address: str) -> None:
+        await self._run(self._delete, address)
+
+    async def close(self) -> None:
+        await self._run(self._conn.close)
+
+
+class TransactionSync:
+    """Fetches only the transactions added since a wallet's last sync.
+
+    The transactions endpoint lists newest first, so each sync pages
+    through the history only until it reaches a transaction mined before the
+    wallet's checkpoint, skipping already synced ones mined at the checkpoint
+    itself; refresh cost scales with new activity rather than total
+    history. The checkpoint is advanced only after a sync completes,
+    so a failed sync is simply repeated::
+
+        sync = TransactionSync(wallet, SQLiteCheckpointStore("sync.sqlite"))
+        new_transactions = await sync.sync(address)
+    """
+
+    def __init__(
+        self,
+        wallet: ZerionWallet,
+        store: Optional[CheckpointStore] = None,
+        page_size: Optional[int] = None
+    ):
+        """Initialize the sync.
+
+        Args:
+            wallet: ZerionWallet used to page through transactions
+            store: Where checkpoints are kept; defaults to process memory
+            page_size: Number of transactions requested per page
+        """
+        self.wallet = wallet
+        self.store = store if store is not None else MemoryCheckpointStore()
+        self.page_size = page_size
+
+    async def sync(
+        self,
+        address: str,
+        max_items: Optional[int] = None,
+        parse: bool = False
+    ) -> Union[List[Dict[str, Any]], List[Transaction]]:
+        """Fetch a wallet's new transactions and advance its checkpoint.
+
+        Args:
+            address: The wallet address to sync
+            max_items: Cap on transactions fetched, e.g. to bound the first
+                sync of a large wallet. Syncing stops at the newest
+                ``max_items`` transactions and the checkpoint moves past any
+                older unseen ones.
+            parse: Return Transaction models instead of raw dicts
+
+        Returns:
+            New transactions, newest first
+        """
+        checkpoint = await self.store.get(address)
+        transactions = [
+            tx async for tx in self.wallet.iter_transactions(
+                address,
+                page_size=self.page_size,
+                max_items=max_items,
+                stop=checkpoint.is_older if checkpoint is not None else None,
+                use_cache=False
+            )
+            if checkpoint is None or not checkpoint.is_seen(tx)
+        ]
+        updated = advance_checkpoint(address, checkpoint, transactions)
+        if updated is not None and updated is not checkpoint:
+            await self.store.set(updated)
+        if parse:
+            return [Transaction.from_json(tx) for tx in transactions]
+        return transactions
+
+    def sync_many(
+        self,
+        addresses: Iterable[str],
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        parse: bool = False
+    ) -> AsyncIterator[BulkResult]:
+        """Sync many wallets with bounded concurrency.
+
+        Args:
+            addresses: The wallet addresses to sync
+            concurrency: Maximum number of wallets synced at once
+            parse: Return Transaction models instead of raw dicts
+
+        Returns:
+            Async iterator of BulkResult holding each wallet's new
+            transactions, in completion order
+        """
+        async def fetch(address: str) -> List[Any]:
+            return await self.sync(address, parse=parse)
+
+        return run_bulk(addresses, fetch, concurrency)
+
+    async def reset(self, address: str) -> None:
+        """Forget a wallet's checkpoint so the next sync fetches everything.
+
+        Args:
+            address: The wallet address
+        """
+        await self.store.delete(address)
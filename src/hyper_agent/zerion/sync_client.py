@@ -0,0 +1,211 @@
+"""Blocking facade over the async Zerion clients.
+
+:class:`ZerionSyncClient` runs one event loop in a background thread and
+submits every call to it, so synchronous code such as Flask views and
+notebooks reuses a single ``ZerionClient`` with its session, pooled
+connections, cache and rate limiter instead of paying for a new event loop
+and session per ``asyncio.run`` call::
+
+    with ZerionSyncClient() as zerion:
+        portfolio = zerion.wallet.get_wallet_portfolio(address)
+        for tx in zerion.wallet.iter_transactions(address, max_items=100):
+            ...
+
+The client may be shared between threads; calls from several threads run
+concurrently on the background loop.
+"""
+import asyncio
+import concurrent.futures
+import functools
+import inspect
+import threading
+from typing import Any, Awaitable, Callable, Iterator, Optional, TypeVar
+
+from .client import ZerionClient
+from .constants import require_zerion_api_key
+from .protocol import ZerionProtocol
+from .token import ZerionToken
+from .wallet import ZerionWallet
+
+T = TypeVar("T")
+
+_DONE = object()
+
+
+async def _next_item(iterator: Any) -> Any:
+    try:
+        return await iterator.__anext__()
+    except StopAsyncIteration:
+        return _DONE
+
+
+async def _await(awaitable: Awaitable[T]) -> T:
+    return await awaitable
+
+
+class SyncProxy:
+    """Blocking view of an async endpoint client such as ZerionWallet.
+
+    Coroutine methods block until their result is ready. Methods returning
+    async iterators, e.g. ``iter_transactions`` and ``get_many``, return
+    plain iterators that fetch each item on the background loop. Other
+    attributes are returned unchanged.
+    """
+
+    def __init__(self, runner: "ZerionSyncClient", target: Any):
+        """Initialize the proxy.
+
+        Args:
+            runner: Sync client whose loop runs the calls
+            target: Async endpoint client to wrap
+        """
+        self._runner = runner
+        self._target = target
+
+    def __repr__(self) -> str:
+        return f"SyncProxy({self._target!r})"
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._target, name)
+        if not callable(attribute):
+            return attribute
+
+        @functools.wraps(attribute)
+        def call(*args: Any, **kwargs: Any) -> Any:
+            result = attribute(*args, **kwargs)
+            if inspect.isawaitable(result):
+                return self._runner.run(result)
+            if hasattr(result, "__anext__"):
+                return self._runner.iterate(result)
+            return result
+
+        return call
+
+
+class ZerionSyncClient:
+    """Synchronous Zerion client backed by a persistent background event loop."""
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        *,
+        timeout: Optional[float] = None,
+        **client_options: Any
+    ):
+        """Start the background loop and create the async client.
+
+        Args:
+            api_key: The Zerion API key. If not provided, will be loaded from
+                environment.
+            timeout: Default seconds a call may take before
+                ``concurrent.futures.TimeoutError`` is raised and the call
+                cancelled, or None to wait indefinitely
+            **client_options: Keyword arguments passed to ``ZerionClient``,
+                e.g. ``cache`` or ``rate_limiter``
+
+        Raises:
+            ValueError: If no API key is provided or found in environment.
+        """
+        self.client = ZerionClient(
+            api_key=api_key or require_zerion_api_key(), **client_options
+        )
+        self.timeout = timeout
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._run_loop, name="zerion-sync-client", daemon=True
+        )
+        self._thread.start()
+        self._closed = False
+        self._close_lock = threading.Lock()
+        self.wallet = SyncProxy(self, ZerionWallet(self.client))
+        self.token = SyncProxy(self, ZerionToken(self.client))
+        self.protocol = SyncProxy(self, ZerionProtocol(self.client))
+
+    def _run_loop(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    def __enter__(self) -> "ZerionSyncClient":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    @property
+    def closed(self) -> bool:
+        """Whether :meth:`close` has been called."""
+        return self._closed
+
+    def run(self, awaitable: Awaitable[T], timeout: Optional[float] = None) -> T:
+        """Run an awaitable on the background loop and wait for its result.
+
+        Args:
+            awaitable: Coroutine or other awaitable, e.g. from ``self.client``
+            timeout: Seconds to wait, defaults to :attr:`timeout`
+
+        Returns:
+            The awaitable's result
+
+        Raises:
+            RuntimeError: If the client is closed or called from its own loop.
+            concurrent.futures.TimeoutError: If the call did not finish in time.
+        """
+        if not asyncio.iscoroutine(awaitable):
+            awaitable = _await(awaitable)
+        if self._closed:
+            awaitable.close()
+            raise RuntimeError("ZerionSyncClient is closed")
+        if threading.current_thread() is self._thread:
+            awaitable.close()
+            raise RuntimeError(
+                "ZerionSyncClient cannot be called from its own event loop; "
+                "await the async client instead"
+            )
+        future = asyncio.run_coroutine_threadsafe(awaitable, self._loop)
+        try:
+            return future.result(self.timeout if timeout is None else timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+
+    def iterate(self, iterator: Any) -> Iterator[Any]:
+        """Consume an async iterator from synchronous code.
+
+        Each item is fetched on the background loop. Closing the returned
+        iterator early also closes the async one.
+
+        Args:
+            iterator: Async iterator, e.g. from ``ZerionWallet.iter_transactions``
+
+        Yields:
+            The iterator's items
+        """
+        try:
+            while True:
+                item = self.run(_next_item(iterator))
+                if item is _DONE:
+                    return
+                yield item
+        finally:
+            aclose: Optional[Callable[[], Awaitable[None]]] = getattr(
+                iterator, "aclose", None
+            )
+            if aclose is not None and not self._closed:
+                self.run(aclose())
+
+    def request(self, method: str, endpoint: str, **kwargs: Any) -> Any:
+        """Make an API request; see ``ZerionClient.request``."""
+        return self.run(self.client.request(method, endpoint, **kwargs))
+
+    def close(self) -> None:
+        """Close the async client and stop the background loop."""
+        with self._close_lock:
+            if self._closed:
+                return
+            try:
+                self.run(self.client.close())
+            finally:
+                self._closed = True
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._thread.join()
+                self._loop.close()
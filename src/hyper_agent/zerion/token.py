@@ -1,74 +1,179 @@
 """Token-related functionality for Zerion SDK."""
+import asyncio
+from typing import Any, Dict, Iterable, List, Optional, Union
 
-from typing import Dict, List
-
+from .batching import MicroBatcher
 from .client import ZerionClient
-from .constants import ENDPOINTS
+from .constants import (
+    DEFAULT_PRICE_BATCH_SIZE,
+    DEFAULT_PRICE_BATCH_WINDOW,
+    ENDPOINTS,
+)
+from .models import FungibleInfo, _float
+from .pagination import iter_items
+
+
+def _market_price(resource: Dict[str, Any]) -> Optional[float]:
+    attributes = resource.get("attributes") or {}
+    return _float((attributes.get("market_data") or {}).get("price"))
 
 
 class ZerionToken:
     """Client for interacting with Zerion token endpoints."""
 
-    def __init__(self, client: ZerionClient):
+    def __init__(
+        self,
+        client: ZerionClient,
+        price_batch_window: float = DEFAULT_PRICE_BATCH_WINDOW,
+        price_batch_size: int = DEFAULT_PRICE_BATCH_SIZE
+    ):
         """Initialize the token client.
 
         Args:
             client: ZerionClient instance for making API requests
+            price_batch_window: Seconds :meth:`get_price` waits for other
+                concurrent lookups to join its batch
+            price_batch_size: Most token ids per batched price request
         """
         self.client = client
+        self.price_batch_size = price_batch_size
+        self.price_batcher = MicroBatcher(
+            self.get_token_prices, price_batch_window, price_batch_size
+        )
 
-    async def get_token_info(self, token_id: str) -> Dict:
+    async def get_token_info(
+        self,
+        token_id: str,
+        use_cache: bool = True,
+        parse: bool = False
+    ) -> Union[Dict, FungibleInfo]:
         """Get information about a token.
 
         Args:
             token_id: The token ID to get information for
+            use_cache: Set to False to bypass the response cache
+            parse: Return a FungibleInfo model instead of the raw response
 
         Returns:
             Dict containing token information
         """
-        return await self.client.request(
+        response = await self.client.request(
             "GET",
-            ENDPOINTS["token_info"].format(token_id=token_id)
+            ENDPOINTS["token_info"].format(token_id=token_id),
+            use_cache=use_cache
         )
+        if parse:
+            return FungibleInfo.from_resource(response.get("data") or {})
+        return response
 
-    async def get_token_price(self, token_id: str) -> Dict:
+    async def get_token_price(self, token_id: str, use_cache: bool = True) -> Dict:
         """Get price information for a token.
 
         Args:
             token_id: The token ID to get price for
+            use_cache: Set to False to bypass the response cache
 
         Returns:
             Dict containing token price information
         """
         return await self.client.request(
             "GET",
-            ENDPOINTS["token_price"].format(token_id=token_id)
+            ENDPOINTS["token_price"].format(token_id=token_id),
+            use_cache=use_cache
         )
 
-    async def get_token_holders(self, token_id: str) -> List[Dict]:
+    async def get_token_prices(
+        self,
+        token_ids: Iterable[str],
+        use_cache: bool = True
+    ) -> Dict[str, Optional[float]]:
+        """Get the prices of many tokens with few requests.
+
+        Ids are looked up through the fungibles list endpoint, up to
+        ``price_batch_size`` ids per request, with the batches sent
+        concurrently.
+
+        Args:
+            token_ids: The token IDs to get prices for; duplicates are
+                fetched once
+            use_cache: Set to False to bypass the response cache
+
+        Returns:
+            Dict mapping every requested ID to its price, or None when the
+            token is unknown or has no market price
+        """
+        ids = list(dict.fromkeys(token_ids))
+        prices: Dict[str, Optional[float]] = dict.fromkeys(ids)
+
+        async def fetch(batch: List[str]) -> None:
+            params = {
+                "filter[fungible_ids]": ",".join(batch),
+                "page[size]": len(batch),
+            }
+            async for resource in iter_items(
+                self.client, ENDPOINTS["token_list"], params=params,
+                prefetch=False, use_cache=use_cache
+            ):
+                if resource.get("id") in prices:
+                    prices[resource["id"]] = _market_price(resource)
+
+        size = self.price_batch_size
+        await asyncio.gather(*(
+            fetch(ids[start:start + size]) for start in range(0, len(ids), size)
+        ))
+        return prices
+
+    async def get_price(self, token_id: str) -> Optional[float]:
+        """Get one token's price through the price micro-batcher.
+
+        Concurrent calls made within ``price_batch_window`` of each other
+        share a single :meth:`get_token_prices` request, so valuing many
+        tokens with ``asyncio.gather`` costs one round trip per batch.
+
+        Args:
+            token_id: The token ID to get the price for
+
+        Returns:
+            The token's price, or None when unknown
+        """
+        return await self.price_batcher.get(token_id)
+
+    async def get_token_holders(
+        self,
+        token_id: str,
+        use_cache: bool = True
+    ) -> List[Dict]:
         """Get holders of a token.
 
         Args:
             token_id: The token ID to get holders for
+            use_cache: Set to False to bypass the response cache
 
         Returns:
             List of token holders
         """
         return await self.client.request(
             "GET",
-            ENDPOINTS["token_holders"].format(token_id=token_id)
+            ENDPOINTS["token_holders"].format(token_id=token_id),
+            use_cache=use_cache
         )
 
-    async def get_token_transactions(self, token_id: str) -> List[Dict]:
+    async def get_token_transactions(
+        self,
+        token_id: str,
+        use_cache: bool = True
+    ) -> List[Dict]:
         """Get transactions for a token.
 
         Args:
             token_id: The token ID to get transactions for
+            use_cache: Set to False to bypass the response cache
 
         Returns:
             List of token transactions
         """
         return await self.client.request(
             "GET",
-            ENDPOINTS["token_transactions"].format(token_id=token_id)
+            ENDPOINTS["token_transactions"].format(token_id=token_id),
+            use_cache=use_cache
         )
\ No newline at end of file
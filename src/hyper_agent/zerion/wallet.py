@@ -1,62 +1,100 @@
 """Wallet-related functionality for Zerion SDK."""
+import time
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Union,
+)
 
-from typing import Dict, List, Optional
-
+from .backfill import Window, merge_windows, time_windows, window_params
+from .bulk import BulkResult, run_bulk
 from .client import ZerionClient
-from .constants import ENDPOINTS
+from .constants import DEFAULT_BACKFILL_WINDOWS, DEFAULT_BULK_CONCURRENCY, ENDPOINTS
+from .models import Page, Portfolio, Position, Transaction, parse_list, parse_page
+from .pagination import iter_items
+from .registry import TokenRegistry
 
 
 class ZerionWallet:
     """Client for interacting with Zerion wallet endpoints."""
 
-    def __init__(self, client: ZerionClient):
+    def __init__(self, client: ZerionClient, registry: Optional[TokenRegistry] = None):
         """Initialize the wallet client.
 
         Args:
             client: ZerionClient instance for making API requests
+            registry: Token registry that parsed positions share token
+                metadata through, e.g. ``registry.default_registry``
         """
         self.client = client
+        self.registry = registry
 
-    async def get_wallet_info(self, address: str) -> Dict:
+    async def get_wallet_info(self, address: str, use_cache: bool = True) -> Dict:
         """Get information about a wallet.
 
         Args:
             address: The wallet address to get information for
+            use_cache: Set to False to bypass the response cache
 
         Returns:
             Dict containing wallet information
         """
         return await self.client.request(
             "GET",
-            ENDPOINTS["wallet_info"].format(address=address)
+            ENDPOINTS["wallet_info"].format(address=address),
+            use_cache=use_cache
         )
 
-    async def get_wallet_balances(self, address: str) -> List[Dict]:
+    async def get_wallet_balances(
+        self,
+        address: str,
+        use_cache: bool = True,
+        parse: bool = False
+    ) -> Union[List[Dict], List[Position]]:
         """Get token balances for a wallet.
 
         Args:
             address: The wallet address to get balances for
+            use_cache: Set to False to bypass the response cache
+            parse: Return Position models instead of the raw response
 
         Returns:
             List of token balances
         """
-        return await self.client.request(
+        response = await self.client.request(
             "GET",
-            ENDPOINTS["wallet_balances"].format(address=address)
+            ENDPOINTS["wallet_balances"].format(address=address),
+            use_cache=use_cache
         )
+        if not parse:
+            return response
+        positions = parse_list(response, Position)
+        if self.registry is not None:
+            self.registry.normalize_all(positions)
+        return positions
 
     async def get_wallet_transactions(
         self,
         address: str,
         limit: Optional[int] = None,
-        cursor: Optional[str] = None
-    ) -> Dict:
+        cursor: Optional[str] = None,
+        use_cache: bool = True,
+        parse: bool = False
+    ) -> Union[Dict, Page]:
         """Get transaction history for a wallet.
 
         Args:
             address: The wallet address to get transactions for
             limit: Maximum number of transactions to return
             cursor: Pagination cursor
+            use_cache: Set to False to bypass the response cache
+            parse: Return a Page of Transaction models instead of the raw response
 
         Returns:
             Dict containing transactions and pagination info
@@ -67,36 +105,233 @@ class ZerionWallet:
         if cursor is not None:
             params["cursor"] = cursor
 
-        return await self.client.request(
+        response = await self.client.request(
             "GET",
             ENDPOINTS["wallet_transactions"].format(address=address),
-            params=params
+            params=params,
+            use_cache=use_cache
+        )
+        return parse_page(response, Transaction) if parse else response
+
+    def iter_transactions(
+        self,
+        address: str,
+        page_size: Optional[int] = None,
+        max_items: Optional[int] = None,
+        stop: Optional[Callable[[Any], bool]] = None,
+        prefetch: bool = True,
+        use_cache: bool = True,
+        parse: bool = False,
+        min_mined_at: Optional[float] = None,
+        max_mined_at: Optional[float] = None
+    ) -> AsyncIterator[Union[Dict[str, Any], Transaction]]:
+        """Iterate over a wallet's full transaction history.
+
+        Pages are followed through ``links.next`` and the next page is
+        prefetched while the current one is consumed::
+
+            async for tx in wallet.iter_transactions(address, max_items=1000):
+                ...
+
+        Args:
+            address: The wallet address to get transactions for
+            page_size: Number of transactions requested per page
+            max_items: Stop after this many transactions
+            stop: Predicate called for each transaction; iteration ends before
+                the first one for which it returns True
+            prefetch: Whether to fetch the next page in the background
+            use_cache: Set to False to bypass the response cache
+            parse: Yield Transaction models instead of raw dicts; ``stop``
+                then receives models too
+            min_mined_at: Only include transactions mined at or after this
+                Unix timestamp
+            max_mined_at: Only include transactions mined at or before this
+                Unix timestamp
+
+        Returns:
+            Async iterator of transactions
+        """
+        params = {}
+        if page_size is not None:
+            params["limit"] = page_size
+        params.update(window_params(min_mined_at, max_mined_at))
+        return iter_items(
+            self.client,
+            ENDPOINTS["wallet_transactions"].format(address=address),
+            params=params,
+            max_items=max_items,
+            stop=stop,
+            prefetch=prefetch,
+            use_cache=use_cache,
+            transform=Transaction.from_json if parse else None
+        )
+
+    async def backfill_transactions(
+        self,
+        address: str,
+        start: float,
+        end: Optional[float] = None,
+        windows: int = DEFAULT_BACKFILL_WINDOWS,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        page_size: Optional[int] = None,
+        parse: bool = False
+    ) -> Union[List[Dict[str, Any]], List[Transaction]]:
+        """Fetch a wallet's transaction history with parallel time windows.
+
+        Cursor pagination is sequential, so a long history takes one round
+        trip per page. Backfill splits ``[start, end]`` into ``windows``
+        ranges filtered by mined_at, pages through up to ``concurrency`` of
+        them at once and merges the results. Responses bypass the cache.
+
+        Args:
+            address: The wallet address to backfill
+            start: Oldest mined_at to include, as a Unix timestamp
+            end: Newest mined_at to include; defaults to now
+            windows: Number of time windows; use more for busy wallets
+            concurrency: Maximum number of windows fetched at once
+            page_size: Number of transactions requested per page
+            parse: Return Transaction models instead of raw dicts
+
+        Returns:
+            Transactions ordered newest first, without duplicates
+
+        Raises:
+            ZerionAPIError: If any window fails after retries.
+        """
+        async def fetch(window: Window) -> List[Dict[str, Any]]:
+            return [
+                tx async for tx in self.iter_transactions(
+                    address,
+                    page_size=page_size,
+                    prefetch=False,
+                    use_cache=False,
+                    min_mined_at=window[0],
+                    max_mined_at=window[1]
+                )
+            ]
+
+        if end is None:
+            end = time.time()
+        results = {}
+        async for result in run_bulk(
+            time_windows(start, end, windows), fetch, concurrency
+        ):
+            if not result.ok:
+                raise result.error
+            results[result.key] = result.value
+        transactions = merge_windows(
+            results[window] for window in sorted(results, reverse=True)
         )
+        if parse:
+            return [Transaction.from_json(tx) for tx in transactions]
+        return transactions
 
-    async def get_wallet_protocols(self, address: str) -> List[Dict]:
+    async def get_wallet_protocols(
+        self,
+        address: str,
+        use_cache: bool = True
+    ) -> List[Dict]:
         """Get protocols used by a wallet.
 
         Args:
             address: The wallet address to get protocols for
+            use_cache: Set to False to bypass the response cache
 
         Returns:
             List of protocols used by the wallet
         """
         return await self.client.request(
             "GET",
-            ENDPOINTS["wallet_protocols"].format(address=address)
+            ENDPOINTS["wallet_protocols"].format(address=address),
+            use_cache=use_cache
         )
 
-    async def get_wallet_portfolio(self, address: str) -> Dict:
+    async def get_wallet_portfolio(
+        self,
+        address: str,
+        use_cache: bool = True,
+        parse: bool = False
+    ) -> Union[Dict, Portfolio]:
         """Get portfolio information for a wallet.
 
         Args:
             address: The wallet address to get portfolio for
+            use_cache: Set to False to bypass the response cache
+            parse: Return a Portfolio model instead of the raw response
 
         Returns:
             Dict containing portfolio information
         """
-        return await self.client.request(
+        response = await self.client.request(
             "GET",
-            ENDPOINTS["wallet_portfolio"].format(address=address)
-        )
\ No newline at end of file
+            ENDPOINTS["wallet_portfolio"].format(address=address),
+            use_cache=use_cache
+        )
+        return Portfolio.from_json(response.get("data") or {}) if parse else response
+
+    def get_many(
+        self,
+        addresses: Iterable[str],
+        fetch: Callable[[str], Awaitable[Any]],
+        concurrency: int = DEFAULT_BULK_CONCURRENCY
+    ) -> AsyncIterator[BulkResult]:
+        """Call ``fetch`` for many wallets with bounded concurrency.
+
+        Results are yielded as they complete; a failing address yields a
+        result carrying its error instead of aborting the batch::
+
+            async for result in wallet.get_many(addresses, wallet.get_wallet_info):
+                if result.ok:
+                    ...
+
+        Args:
+            addresses: The wallet addresses to fetch
+            fetch: Coroutine function taking one address
+            concurrency: Maximum number of wallets fetched at once
+
+        Returns:
+            Async iterator of BulkResult, keyed by address
+        """
+        return run_bulk(addresses, fetch, concurrency)
+
+    def get_many_portfolios(
+        self,
+        addresses: Iterable[str],
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        parse: bool = False
+    ) -> AsyncIterator[BulkResult]:
+        """Get portfolio information for many wallets.
+
+        Args:
+            addresses: The wallet addresses to get portfolios for
+            concurrency: Maximum number of wallets fetched at once
+            parse: Return Portfolio models instead of raw responses
+
+        Returns:
+            Async iterator of BulkResult, in completion order
+        """
+        async def fetch(address: str) -> Union[Dict, Portfolio]:
+            return await self.get_wallet_portfolio(address, parse=parse)
+
+        return self.get_many(addresses, fetch, concurrency)
+
+    def get_many_balances(
+        self,
+        addresses: Iterable[str],
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        parse: bool = False
+    ) -> AsyncIterator[BulkResult]:
+        """Get token balances for many wallets.
+
+        Args:
+            addresses: The wallet addresses to get balances for
+            concurrency: Maximum number of wallets fetched at once
+            parse: Return Position models instead of raw responses
+
+        Returns:
+            Async iterator of BulkResult, in completion order
+        """
+        async def fetch(address: str) -> Union[List[Dict], List[Position]]:
+            return await self.get_wallet_balances(address, parse=parse)
+
+        return self.get_many(addresses, fetch, concurrency)
@@ -0,0 +1,353 @@
+"""Long-running wallet watcher with adaptive per-wallet polling intervals.
+
+Each watched wallet's positions are polled on its own interval. A poll that
+finds changed holdings resets the interval to ``min_interval``; each poll
+that finds nothing new stretches it by ``backoff`` up to ``max_interval``.
+Active wallets are therefore polled often and dormant ones rarely, and a
+request budget caps the total rate. When the watchlist needs more requests
+than the budget allows, the wallets that are most overdue are polled first::
+
+    watcher = Watcher(ZerionWallet(client), addresses, budget=5.0)
+    async for event in watcher.events():
+        if event.kind == "changed":
+            ...
+"""
+import asyncio
+import heapq
+import time
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
+
+from .constants import (
+    DEFAULT_BULK_CONCURRENCY,
+    DEFAULT_WATCH_BACKOFF,
+    DEFAULT_WATCH_MAX_INTERVAL,
+    DEFAULT_WATCH_MIN_INTERVAL,
+)
+from .diff import PositionDiff, diff_holdings
+from .models import _quantity
+from .ratelimit import TokenBucket
+from .wallet import ZerionWallet
+
+Holdings = Dict[str, Optional[float]]
+
+
+def holdings(positions: Dict[str, Any]) -> Holdings:
+    """Reduce a positions response to position id and quantity.
+
+    Values move with prices on every poll, so only quantities are compared
+    to detect wallet activity.
+
+    Args:
+        positions: Response of the wallet positions endpoint
+
+    Returns:
+        Holdings: Quantity keyed by position id
+    """
+    result = {}
+    for resource in positions.get("data") or []:
+        attributes = resource.get("attributes") or {}
+        result[resource.get("id")] = _quantity(
+            attributes.get("quantity", attributes.get("balance"))
+        )
+    return result
+
+
+class WatchPolicy:
+    """How polling intervals adapt to wallet activity."""
+
+    __slots__ = ("min_interval", "max_interval", "backoff")
+
+    def __init__(
+        self,
+        min_interval: float = DEFAULT_WATCH_MIN_INTERVAL,
+        max_interval: float = DEFAULT_WATCH_MAX_INTERVAL,
+        backoff: float = DEFAULT_WATCH_BACKOFF
+    ):
+        """Initialize the policy.
+
+        Args:
+            min_interval: Seconds between polls of a wallet that just changed
+            max_interval: Upper bound in seconds of a dormant wallet's interval
+            backoff: Factor applied to the interval after a poll without changes
+
+        Raises:
+            ValueError: If the intervals are not positive and ordered, or
+                backoff is below 1.
+        """
+        if min_interval <= 0 or max_interval < min_interval:
+            raise ValueError("intervals must satisfy 0 < min_interval <= max_interval")
+        if backoff < 1:
+            raise ValueError("backoff must be at least 1")
+        self.min_interval = float(min_interval)
+        self.max_interval = float(max_interval)
+        self.backoff = float(backoff)
+
+    def next_interval(self, interval: float, changed: bool) -> float:
+        """Interval until the next poll of a wallet.
+
+        Args:
+            interval: The wallet's current interval
+            changed: Whether the last poll found changed holdings
+
+        Returns:
+            float: The new interval in seconds
+        """
+        if changed:
+            return self.min_interval
+        return min(self.max_interval, interval * self.backoff)
+
+
+class WalletState:
+    """Polling state of one watched wallet."""
+
+    __slots__ = ("address", "interval", "due", "holdings", "polls", "changes", "errors")
+
+    def __init__(self, address: str, interval: float, due: float):
+        self.address = address
+        self.interval = interval
+        self.due = due
+        self.holdings: Optional[Holdings] = None
+        self.polls = 0
+        self.changes = 0
+        self.errors = 0
+
+    def __repr__(self) -> str:
+        return (
+            f"WalletState(address={self.address!r}, interval={self.interval!r}, "
+            f"polls={self.polls!r}, changes={self.changes!r})"
+        )
+
+
+class WatchEvent:
+    """Outcome of a poll worth reporting.
+
+    ``kind`` is ``initial`` for a wallet's first successful poll, ``changed``
+    when its holdings differ from the previous poll and ``error`` when the
+    poll failed. ``data`` is the raw positions response and ``changes`` the
+    position changes of a ``changed`` event.
+    """
+
+    __slots__ = (
+        "address", "kind", "data", "previous", "current", "changes", "error",
+        "interval",
+    )
+
+    def __init__(
+        self,
+        address: str,
+        kind: str,
+        data: Optional[Dict[str, Any]] = None,
+        previous: Optional[Holdings] = None,
+        current: Optional[Holdings] = None,
+        changes: Optional[PositionDiff] = None,
+        error: Optional[BaseException] = None,
+        interval: Optional[float] = None
+    ):
+        self.address = address
+        self.kind = kind
+        self.data = data
+        self.previous = previous
+        self.current = current
+        self.changes = changes
+        self.error = error
+        self.interval = interval
+
+    def __repr__(self) -> str:
+        return f"WatchEvent(address={self.address!r}, kind={self.kind!r})"
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the event as a JSON-serializable dict, without ``data``."""
+        record: Dict[str, Any] = {
+            "address": self.address,
+            "kind": self.kind,
+            "interval": self.interval,
+        }
+        if self.error is not None:
+            record["error"] = str(self.error)
+            record["status"] = getattr(self.error, "status", None)
+        else:
+            record["holdings"] = self.current
+            if self.previous is not None:
+                record["previous"] = self.previous
+            if self.changes is not None:
+                record["changes"] = self.changes.as_dict()
+        return record
+
+
+class Watcher:
+    """Polls a watchlist of wallets through one ZerionWallet."""
+
+    def __init__(
+        self,
+        wallet: ZerionWallet,
+        addresses: Iterable[str] = (),
+        policy: Optional[WatchPolicy] = None,
+        budget: Optional[float] = None,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        emit_initial: bool = True
+    ):
+        """Initialize the watcher.
+
+        Args:
+            wallet: ZerionWallet used to fetch positions
+            addresses: Wallets to watch; more can be added with :meth:`add`
+            policy: Polling interval policy, defaults to ``WatchPolicy()``
+            budget: Maximum polls per second across the watchlist, or None
+                for no limit beyond the client's own rate limiter
+            concurrency: Maximum number of polls in flight
+            emit_initial: Emit an ``initial`` event for each wallet's first poll
+
+        Raises:
+            ValueError: If concurrency is lower than 1.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.wallet = wallet
+        self.policy = policy if policy is not None else WatchPolicy()
+        self.budget = TokenBucket(budget) if budget else None
+        self.concurrency = concurrency
+        self.emit_initial = emit_initial
+        self.wallets: Dict[str, WalletState] = {}
+        self._schedule: List[Tuple[float, int, str]] = []
+        self._sequence = 0
+        self._wakeup: Optional[asyncio.Event] = None
+        for address in addresses:
+            self.add(address)
+
+    def add(self, address: str) -> None:
+        """Start watching a wallet; it is polled as soon as possible.
+
+        Args:
+            address: The wallet address
+        """
+        if address in self.wallets:
+            return
+        state = WalletState(address, self.policy.min_interval, time.monotonic())
+        self.wallets[address] = state
+        self._push(state)
+
+    def remove(self, address: str) -> None:
+        """Stop watching a wallet.
+
+        Args:
+            address: The wallet address
+        """
+        self.wallets.pop(address, None)
+
+    def _push(self, state: WalletState) -> None:
+        self._sequence += 1
+        heapq.heappush(self._schedule, (state.due, self._sequence, state.address))
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def _pop_due(self) -> Tuple[Optional[WalletState], float]:
+        """Pop the next due wallet, or return the seconds until one is due."""
+        while self._schedule:
+            due, _, address = self._schedule[0]
+            state = self.wallets.get(address)
+            if state is None or state.due != due:
+                # Removed wallet or superseded schedule entry.
+                heapq.heappop(self._schedule)
+                continue
+            delay = due - time.monotonic()
+            if delay > 0:
+                return None, delay
+            heapq.heappop(self._schedule)
+            return state, 0.0
+        return None, self.policy.max_interval
+
+    async def poll(self, state: WalletState) -> Optional[WatchEvent]:
+        """Poll one wallet and reschedule it.
+
+        Args:
+            state: The wallet's polling state
+
+        Returns:
+            Optional[WatchEvent]: The event to report, or None if nothing changed
+        """
+        state.polls += 1
+        try:
+            data = await self.wallet.get_wallet_balances(state.address, use_cache=False)
+            current = holdings(data)
+        except Exception as exc:
+            state.errors += 1
+            state.interval = self.policy.next_interval(state.interval, False)
+            event = WatchEvent(
+                state.address, "error", error=exc, interval=state.interval
+            )
+        else:
+            previous = state.holdings
+            changes = diff_holdings(previous, current) if previous is not None else None
+            changed = bool(changes)
+            state.holdings = current
+            state.changes += changed
+            state.interval = self.policy.next_interval(state.interval, changed)
+            event = None
+            if changed:
+                event = WatchEvent(
+                    state.address, "changed", data, previous, current, changes,
+                    interval=state.interval
+                )
+            elif previous is None and self.emit_initial:
+                event = WatchEvent(
+                    state.address, "initial", data, None, current,
+                    interval=state.interval
+                )
+        if self.wallets.get(state.address) is state:
+            state.due = time.monotonic() + state.interval
+            self._push(state)
+        return event
+
+    async def events(self) -> AsyncIterator[WatchEvent]:
+        """Watch the wallets until the iterator is closed.
+
+        Yields:
+            WatchEvent: Initial, changed and error events, in completion order
+        """
+        self._wakeup = asyncio.Event()
+        queue: "asyncio.Queue[WatchEvent]" = asyncio.Queue()
+        slots = asyncio.Semaphore(self.concurrency)
+        polls = set()
+
+        async def run_poll(state: WalletState) -> None:
+            try:
+                event = await self.poll(state)
+                if event is not None:
+                    queue.put_nowait(event)
+            finally:
+                slots.release()
+
+        async def schedule() -> None:
+            while True:
+                state, delay = self._pop_due()
+                if state is None:
+                    self._wakeup.clear()
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), delay)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+                await slots.acquire()
+                if self.budget is not None:
+                    await self.budget.acquire()
+                task = asyncio.ensure_future(run_poll(state))
+                polls.add(task)
+                task.add_done_callback(polls.discard)
+
+        scheduler = asyncio.ensure_future(schedule())
+        try:
+            while True:
+                getter = asyncio.ensure_future(queue.get())
+                await asyncio.wait(
+                    [getter, scheduler], return_when=asyncio.FIRST_COMPLETED
+                )
+                if not getter.done():
+                    getter.cancel()
+                    scheduler.result()
+                yield getter.result()
+        finally:
+            tasks = [scheduler, *polls]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self._wakeup = None
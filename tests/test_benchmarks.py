@@ -0,0 +1,50 @@
+"""Smoke tests for the benchmark suite and its stand-in server."""
+import json
+import os
+
+import pytest
+
+from benchmarks.run import compare, main, percentile, run_benchmarks
+from benchmarks.server import ServerConfig
+from hyper_agent.zerion.constants import API_BASE_URL_ENV_VAR
+
+
+def test_percentile():
+    """Test nearest-rank percentiles."""
+    values = list(range(1, 101))
+    assert percentile(values, 0.5) == 50
+    assert percentile(values, 0.99) == 99
+    assert percentile([], 0.5) == 0.0
+
+
+@pytest.mark.asyncio
+async def test_run_benchmarks_reports_every_scenario(monkeypatch):
+    """Test all scenarios complete, including retried 429 responses."""
+    monkeypatch.delenv(API_BASE_URL_ENV_VAR, raising=False)
+    results = await run_benchmarks(
+        ServerConfig(items=5, pages=3, rate_limit_every=7),
+        requests=5,
+        wallets=10,
+        concurrency=4,
+    )
+    assert set(results) == {"single", "bulk", "pagination", "sync"}
+    assert results["single"]["operations"] == 5
+    assert results["sync"]["operations"] == 5
+    assert results["bulk"]["operations"] == 10
+    assert results["pagination"]["operations"] == 15
+    assert sum(result["throttled"] for result in results.values()) > 0
+    assert all(result["ops_per_sec"] > 0 for result in results.values())
+    assert all(result["peak_memory_bytes"] > 0 for result in results.values())
+    assert API_BASE_URL_ENV_VAR not in os.environ
+
+
+def test_main_writes_results_and_compares(tmp_path, capsys):
+    """Test the command line writes a JSON report that can be compared."""
+    output = tmp_path / "bench.json"
+    args = ["--scenario", "single", "--requests", "3", "--output", str(output)]
+    assert main(args) == 0
+    report = json.loads(output.read_text())
+    assert report["results"]["single"]["operations"] == 3
+    assert compare(report, report)[0].startswith("single.ops_per_sec")
+    assert main(args + ["--compare", str(output)]) == 0
+    assert "single.latency_p99_ms" in capsys.readouterr().err
@@ -0,0 +1,121 @@
+"""Tests for vectorized Zerion portfolio analytics."""
+import math
+
+import pytest
+
+from hyper_agent.zerion.analytics import allocation, concentration, pnl
+from hyper_agent.zerion.columnar import PositionColumns, TransferColumns
+
+pytest.importorskip("numpy")
+
+
+def make_position(fungible_id, value, chain="ethereum", protocol=None, quantity=1.0):
+    """Build a positions resource in Zerion's JSON:API shape."""
+    return {
+        "type": "positions",
+        "id": f"{fungible_id}-{chain}-{protocol}",
+        "attributes": {
+            "protocol": protocol,
+            "quantity": {"float": quantity},
+            "value": value,
+            "fungible_info": {"symbol": fungible_id.upper()},
+        },
+        "relationships": {
+            "chain": {"data": {"type": "chains", "id": chain}},
+            "fungible": {"data": {"type": "fungibles", "id": fungible_id}},
+        },
+    }
+
+
+def make_tx(tx_id, *transfers):
+    """Build a transactions resource from (direction, id, quantity, value)."""
+    return {
+        "type": "transactions",
+        "id": tx_id,
+        "attributes": {
+            "mined_at": "2024-01-01T00:00:00Z",
+            "transfers": [
+                {
+                    "direction": direction,
+                    "quantity": {"float": quantity},
+                    "value": value,
+                    "fungible_info": {"id": fungible_id},
+                }
+                for direction, fungible_id, quantity, value in transfers
+            ],
+        },
+    }
+
+
+@pytest.fixture
+def positions():
+    """Positions of two wallets."""
+    columns = PositionColumns()
+    columns.extend([
+        make_position("eth", 600.0),
+        make_position("usdc", 300.0, chain="base", protocol="Aave", quantity=300.0),
+        make_position("usdc", 100.0, quantity=100.0),
+    ], wallet="0xa")
+    columns.extend([make_position("eth", 50.0, chain="base")], wallet="0xb")
+    return columns
+
+
+def test_allocation_by_chain(positions):
+    """Test values are summed per wallet and chain."""
+    breakdown = allocation(positions, by="chain_id")
+    assert breakdown.wallets == ["0xa", "0xb"]
+    assert breakdown.groups == ["ethereum", "base"]
+    assert breakdown.values.tolist() == [[700.0, 300.0], [0.0, 50.0]]
+    assert breakdown.totals.tolist() == [1000.0, 50.0]
+    assert breakdown.shares.tolist() == [[0.7, 0.3], [0.0, 1.0]]
+    assert breakdown.for_wallet("0xb") == {"base": 50.0}
+    with pytest.raises(KeyError):
+        breakdown.for_wallet("0xc")
+
+
+def test_allocation_keeps_missing_group(positions):
+    """Test positions without a protocol are grouped under None."""
+    breakdown = allocation(positions, by="protocol")
+    assert breakdown.for_wallet("0xa") == {None: 700.0, "Aave": 300.0}
+    with pytest.raises(ValueError):
+        allocation(positions, by="value")
+
+
+def test_concentration_and_top(positions):
+    """Test HHI and top-N exposures are computed per wallet."""
+    wallets, hhi = concentration(positions)
+    assert wallets == ["0xa", "0xb"]
+    assert hhi == pytest.approx([0.6 ** 2 + 0.4 ** 2, 1.0])
+    groups, shares = allocation(positions, by="fungible_id").top(1)
+    assert groups.tolist() == [["eth"], ["eth"]]
+    assert shares.tolist() == [[0.6], [1.0]]
+    groups, shares = allocation(positions, by="fungible_id").top(5)
+    assert groups.tolist() == [["eth", "usdc"], ["eth", "usdc"]]
+    assert shares.tolist() == [[0.6, 0.4], [1.0, 0.0]]
+
+
+def test_pnl(positions):
+    """Test average-cost realized and unrealized PnL."""
+    transfers = TransferColumns()
+    transfers.extend([
+        make_tx("1", ("in", "eth", 1.0, 100.0)),
+        make_tx("2", ("in", "eth", 1.0, 300.0)),
+        make_tx("3", ("out", "eth", 1.0, 500.0), ("in", "usdc", 400.0, 400.0)),
+        make_tx("4", ("in", "pepe", 10.0, None)),
+        make_tx("5", ("out", "eth", 1.0, None)),
+    ], wallet="0xa")
+    result = pnl(positions, transfers)
+    eth = result.assets.index("eth")
+    usdc = result.assets.index("usdc")
+    pepe = result.assets.index("pepe")
+    assert result.wallets[0] == "0xa"
+    assert result.cost_basis[0, eth] == 200.0
+    assert result.realized[0, eth] == 300.0
+    assert result.unrealized[0, eth] == 400.0
+    assert result.unrealized[0, usdc] == 0.0
+    assert math.isnan(result.cost_basis[0, pepe])
+    totals = result.totals()
+    assert totals["realized"][0] == 300.0
+    assert totals["total"][0] == 700.0
+    assert math.isnan(result.unrealized[1, eth])
+    assert totals["total"][1] == 0.0
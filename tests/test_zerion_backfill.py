@@ -0,0 +1,97 @@
+"""Tests for time-window-sharded transaction backfill."""
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from hyper_agent.zerion.backfill import merge_windows, time_windows, window_params
+from hyper_agent.zerion.client import ZerionClient
+from hyper_agent.zerion.wallet import ZerionWallet
+
+PAGE_SIZE = 4
+HISTORY = 40
+
+
+def make_tx(second):
+    """Build a minimal transactions resource mined at the given second."""
+    return {
+        "type": "transactions",
+        "id": f"tx-{second}",
+        "attributes": {"mined_at": f"1970-01-01T00:00:{second:02d}Z"},
+    }
+
+
+@pytest.fixture
+async def history_server(aiohttp_client):
+    """Serve a newest-first history honouring the mined_at filters."""
+    history = [make_tx(second) for second in reversed(range(HISTORY))]
+    state = {"active": 0, "peak": 0, "windows": set()}
+
+    async def handler(request):
+        low = int(request.query.get("filter[min_mined_at]", "0")) / 1000
+        high = int(request.query.get("filter[max_mined_at]", "1e12")) / 1000
+        offset = int(request.query.get("page[after]", "0"))
+        state["windows"].add((low, high))
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(0.01)
+        state["active"] -= 1
+        matching = [
+            tx for tx in history
+            if low <= int(tx["id"].split("-")[1]) <= high
+        ]
+        body = {"data": matching[offset:offset + PAGE_SIZE], "links": {}}
+        if offset + PAGE_SIZE < len(matching):
+            body["links"]["next"] = str(
+                request.url.update_query({"page[after]": str(offset + PAGE_SIZE)})
+            )
+        return web.json_response(body)
+
+    app = web.Application()
+    app.router.add_get("/v1/wallets/{address}/transactions", handler)
+    server = await aiohttp_client(app)
+    return server, state
+
+
+def test_time_windows():
+    """Test windows cover the range contiguously, newest first."""
+    assert time_windows(0, 30, 3) == [(20, 30), (10, 20), (0, 10)]
+    with pytest.raises(ValueError):
+        time_windows(0, 10, 0)
+    with pytest.raises(ValueError):
+        time_windows(10, 0, 1)
+
+
+def test_merge_windows_deduplicates_boundaries():
+    """Test boundary transactions returned by two windows are kept once."""
+    newer = [make_tx(3), make_tx(2)]
+    older = [make_tx(2), make_tx(1)]
+    merged = merge_windows([newer, older])
+    assert [tx["id"] for tx in merged] == ["tx-3", "tx-2", "tx-1"]
+
+
+def test_window_params():
+    """Test filters are sent in milliseconds and omitted when unset."""
+    assert window_params(1.5, 2) == {
+        "filter[min_mined_at]": 1500,
+        "filter[max_mined_at]": 2000,
+    }
+    assert window_params() == {}
+
+
+@pytest.mark.asyncio
+async def test_backfill_fetches_windows_concurrently(history_server, zerion_api_key):
+    """Test backfill returns the full ordered history using parallel windows."""
+    server, state = history_server
+    async with ZerionClient(api_key=zerion_api_key) as client:
+        client.base_url = str(server.make_url("/v1"))
+        wallet = ZerionWallet(client)
+        transactions = await wallet.backfill_transactions(
+            "0x1", start=0, end=HISTORY - 1, windows=6, concurrency=3,
+            page_size=PAGE_SIZE, parse=True
+        )
+    assert [tx.id for tx in transactions] == [
+        f"tx-{second}" for second in reversed(range(HISTORY))
+    ]
+    assert len(state["windows"]) == 6
+    assert 1 < state["peak"] <= 3
@@ -0,0 +1,58 @@
+"""Tests for micro-batching of concurrent lookups."""
+import asyncio
+
+import pytest
+
+from hyper_agent.zerion.batching import MicroBatcher
+
+
+class FetchMany:
+    """Records batches and returns each key doubled."""
+
+    def __init__(self, fail=False):
+        self.batches = []
+        self.fail = fail
+
+    async def __call__(self, keys):
+        self.batches.append(keys)
+        await asyncio.sleep(0)
+        if self.fail:
+            raise RuntimeError("boom")
+        return {key: key * 2 for key in keys if key != "missing"}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_a_batch():
+    """Test calls within the window are fetched together."""
+    fetch = FetchMany()
+    batcher = MicroBatcher(fetch, window=0.01, max_batch=10)
+    results = await asyncio.gather(*(
+        batcher.get(key) for key in ["a", "b", "a", "missing"]
+    ))
+    assert results == ["aa", "bb", "aa", None]
+    assert fetch.batches == [["a", "b", "missing"]]
+    assert batcher.batches == 1
+
+
+@pytest.mark.asyncio
+async def test_full_batch_is_sent_early():
+    """Test reaching max_batch flushes without waiting for the window."""
+    fetch = FetchMany()
+    batcher = MicroBatcher(fetch, window=10.0, max_batch=2)
+    results = await asyncio.wait_for(
+        asyncio.gather(*(batcher.get(key) for key in "abcd")), timeout=1.0
+    )
+    assert results == ["aa", "bb", "cc", "dd"]
+    assert fetch.batches == [["a", "b"], ["c", "d"]]
+
+
+@pytest.mark.asyncio
+async def test_errors_reach_every_caller():
+    """Test a failed batch raises in each waiting caller."""
+    batcher = MicroBatcher(FetchMany(fail=True), window=0.0, max_batch=10)
+    results = await asyncio.gather(
+        batcher.get("a"), batcher.get("b"), return_exceptions=True
+    )
+    assert all(isinstance(result, RuntimeError) for result in results)
+    with pytest.raises(ValueError):
+        MicroBatcher(FetchMany(), window=0.0, max_batch=0)
@@ -0,0 +1,106 @@
+"""Tests for Zerion bulk wallet fetching."""
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from hyper_agent.zerion.bulk import run_bulk
+from hyper_agent.zerion.client import ZerionClient
+from hyper_agent.zerion.retry import RetryPolicy
+from hyper_agent.zerion.wallet import ZerionWallet
+
+
+@pytest.mark.asyncio
+async def test_run_bulk_bounds_concurrency():
+    """Test no more than `concurrency` calls run at once."""
+    active = 0
+    peak = 0
+
+    async def fetch(key):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return key.upper()
+
+    keys = [f"k{i}" for i in range(20)]
+    results = [result async for result in run_bulk(keys, fetch, concurrency=3)]
+    assert peak == 3
+    assert sorted(result.key for result in results) == sorted(keys)
+    assert all(result.ok and result.value == result.key.upper() for result in results)
+
+
+@pytest.mark.asyncio
+async def test_run_bulk_yields_as_completed():
+    """Test fast results are yielded before slow ones."""
+    async def fetch(key):
+        await asyncio.sleep(0.05 if key == "slow" else 0)
+        return key
+
+    order = [result.key async for result in run_bulk(["slow", "fast"], fetch, concurrency=2)]
+    assert order == ["fast", "slow"]
+
+
+@pytest.mark.asyncio
+async def test_run_bulk_collects_errors():
+    """Test per-key errors are reported without failing the batch."""
+    async def fetch(key):
+        if key == "bad":
+            raise ValueError("boom")
+        return key
+
+    results = {r.key: r async for r in run_bulk(["a", "bad", "b"], fetch)}
+    assert results["a"].ok and results["b"].ok
+    assert not results["bad"].ok
+    assert isinstance(results["bad"].error, ValueError)
+
+
+@pytest.mark.asyncio
+async def test_run_bulk_early_exit_cancels_workers():
+    """Test leaving the iterator early stops outstanding work."""
+    started = []
+
+    async def fetch(key):
+        started.append(key)
+        await asyncio.sleep(0.01)
+        return key
+
+    results = run_bulk((f"k{i}" for i in range(100)), fetch, concurrency=2)
+    async for _ in results:
+        break
+    await results.aclose()
+    assert len(started) < 10
+
+
+@pytest.mark.asyncio
+async def test_run_bulk_invalid_concurrency():
+    """Test concurrency must be positive."""
+    with pytest.raises(ValueError, match="concurrency must be at least 1"):
+        async for _ in run_bulk(["a"], asyncio.sleep, concurrency=0):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_get_many_portfolios(aiohttp_client, zerion_api_key):
+    """Test bulk portfolio fetch against a local server."""
+    async def handler(request):
+        address = request.match_info["address"]
+        if address == "0xbad":
+            return web.json_response({"error": "Not found"}, status=404)
+        return web.json_response({"data": {"id": address}})
+
+    app = web.Application()
+    app.router.add_get("/wallets/{address}/portfolio", handler)
+    server = await aiohttp_client(app)
+
+    addresses = ["0x1", "0x2", "0xbad", "0x3"]
+    async with ZerionClient(
+        api_key=zerion_api_key, retry_policy=RetryPolicy(max_attempts=1)
+    ) as client:
+        client.base_url = str(server.make_url(""))
+        wallet = ZerionWallet(client)
+        results = {r.key: r async for r in wallet.get_many_portfolios(addresses, concurrency=2)}
+    assert set(results) == set(addresses)
+    assert results["0x2"].value == {"data": {"id": "0x2"}}
+    assert results["0xbad"].error.status == 404
@@ -0,0 +1,154 @@
+"""Tests for the Zerion response cache."""
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from hyper_agent.zerion.cache import CachePolicy, MemoryCache, make_cache_key
+from hyper_agent.zerion.client import ZerionClient
+from hyper_agent.zerion.endpoints import endpoint_name
+from hyper_agent.zerion.token import ZerionToken
+
+
+def test_make_cache_key():
+    """Test cache keys are independent of parameter order."""
+    assert make_cache_key("get", "/tokens/eth") == "GET /tokens/eth"
+    assert make_cache_key("GET", "/w", {"b": 2, "a": 1}) == make_cache_key(
+        "GET", "/w", {"a": 1, "b": 2}
+    )
+    assert make_cache_key("GET", "/w", {"a": 1}) != make_cache_key("GET", "/w", {"a": 2})
+
+
+def test_endpoint_name():
+    """Test endpoint paths resolve to their ENDPOINTS names."""
+    assert endpoint_name("/tokens/eth") == "token_info"
+    assert endpoint_name("/tokens/eth/price") == "token_price"
+    assert endpoint_name("/wallets/0x1/positions") == "wallet_balances"
+    assert endpoint_name("/protocols/aave/stats") == "protocol_stats"
+    assert endpoint_name("/unknown/path") is None
+
+
+def test_cache_policy():
+    """Test per-endpoint TTLs and non-GET requests."""
+    policy = CachePolicy(ttls={"token_price": 5})
+    assert policy.ttl_for("GET", "/tokens/eth/price") == 5
+    assert policy.ttl_for("GET", "/tokens/eth") is None
+    assert policy.ttl_for("POST", "/tokens/eth/price") is None
+    assert CachePolicy(ttls={}, default_ttl=7).ttl_for("GET", "/anything") == 7
+    assert CachePolicy().ttl_for("GET", "/protocols/aave") >= 3600
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_lru_eviction():
+    """Test the least recently used entry is evicted when full."""
+    cache = MemoryCache(max_size=2)
+    await cache.set("a", 1, 60)
+    await cache.set("b", 2, 60)
+    assert await cache.get("a") == 1
+    await cache.set("c", 3, 60)
+    assert await cache.get("b") is None
+    assert await cache.get("a") == 1
+    assert await cache.get("c") == 3
+    assert len(cache) == 2
+    assert cache.stats.evictions == 1
+    assert cache.stats.hits == 3
+    assert cache.stats.misses == 1
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_ttl():
+    """Test entries expire after their TTL."""
+    cache = MemoryCache()
+    await cache.set("a", 1, 0.05)
+    assert await cache.get("a") == 1
+    await asyncio.sleep(0.06)
+    assert await cache.get("a") is None
+    assert cache.stats.expirations == 1
+
+    await cache.set("b", 2, 0)
+    assert await cache.get("b") is None
+
+
+@pytest.mark.asyncio
+async def test_client_serves_from_cache(aiohttp_client, zerion_api_key):
+    """Test repeated calls hit the cache and bypass skips it."""
+    calls = []
+
+    async def handler(request):
+        calls.append(request)
+        return web.json_response({"data": {"price": len(calls)}})
+
+    app = web.Application()
+    app.router.add_get("/tokens/{token_id}/price", handler)
+    server = await aiohttp_client(app)
+
+    cache = MemoryCache()
+    async with ZerionClient(api_key=zerion_api_key, cache=cache) as client:
+        client.base_url = str(server.make_url(""))
+        token = ZerionToken(client)
+        first = await token.get_token_price("eth")
+        second = await token.get_token_price("eth")
+        assert first == second == {"data": {"price": 1}}
+        assert len(calls) == 1
+
+        fresh = await token.get_token_price("eth", use_cache=False)
+        assert fresh == {"data": {"price": 2}}
+        assert await token.get_token_price("eth") == {"data": {"price": 1}}
+        assert len(calls) == 2
+    assert cache.stats.hits == 2
+    assert cache.stats.misses == 1
+
+
+@pytest.mark.asyncio
+async def test_client_revalidates_with_etag(aiohttp_client, zerion_api_key):
+    """Test stale entries are revalidated and reused on 304."""
+    calls = []
+    version = {"etag": '"v1"'}
+
+    async def handler(request):
+        calls.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == version["etag"]:
+            return web.Response(status=304, headers={"ETag": version["etag"]})
+        return web.json_response(
+            {"data": {"version": version["etag"]}},
+            headers={
+                "ETag": version["etag"],
+                "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT",
+            },
+        )
+
+    app = web.Application()
+    app.router.add_get("/protocols/{protocol_id}", handler)
+    server = await aiohttp_client(app)
+
+    cache = MemoryCache()
+    policy = CachePolicy(ttls={"protocol_info": 0.05})
+    async with ZerionClient(
+        api_key=zerion_api_key, cache=cache, cache_policy=policy
+    ) as client:
+        client.base_url = str(server.make_url(""))
+        first = await client.request("GET", "/protocols/aave")
+        assert await client.request("GET", "/protocols/aave") == first
+        assert calls == [None]
+
+        await asyncio.sleep(0.06)
+        assert await client.request("GET", "/protocols/aave") == first
+        assert calls == [None, '"v1"']
+        assert cache.stats.revalidations == 1
+        assert await client.request("GET", "/protocols/aave") == first
+        assert len(calls) == 2
+
+        version["etag"] = '"v2"'
+        await asyncio.sleep(0.06)
+        updated = await client.request("GET", "/protocols/aave")
+        assert updated == {"data": {"version": '"v2"'}}
+        assert calls[-1] == '"v1"'
+
+
+def test_cache_policy_revalidates():
+    """Test revalidation applies to GETs of the configured endpoints."""
+    policy = CachePolicy()
+    assert policy.revalidates("GET", "/tokens/eth")
+    assert not policy.revalidates("GET", "/tokens/eth/price")
+    assert not policy.revalidates("POST", "/tokens/eth")
+    assert not CachePolicy(revalidate=()).revalidates("GET", "/tokens/eth")
@@ -0,0 +1,125 @@
+"""Tests for the Zerion command-line interface."""
+import asyncio
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from hyper_agent.zerion import cli as cli_module
+from hyper_agent.zerion.client import ZerionClient
+from hyper_agent.zerion.exceptions import ZerionAPIError
+from hyper_agent.zerion.sqlite_cache import SQLiteCache
+
+
+@pytest.fixture
+def fake_request(monkeypatch, zerion_api_key):
+    """Replace network requests with canned wallet portfolios."""
+    calls = []
+
+    async def request(self, method, endpoint, params=None, data=None, use_cache=True):
+        calls.append(endpoint)
+        if "0xbad" in endpoint:
+            raise ZerionAPIError("API request failed: not found", status=404)
+        return {"data": {"endpoint": endpoint}}
+
+    monkeypatch.setattr(ZerionClient, "request", request)
+    return calls
+
+
+def test_wallet_portfolio_single(fake_request):
+    """Test a single address prints the response."""
+    result = CliRunner().invoke(cli_module.cli, ["wallet", "portfolio", "0x1"])
+    assert result.exit_code == 0
+    assert "/wallets/0x1/portfolio" in result.output
+
+
+def test_wallet_portfolio_batch_from_stdin(fake_request):
+    """Test batch mode streams one NDJSON line per address."""
+    result = CliRunner().invoke(
+        cli_module.cli,
+        ["wallet", "portfolio", "--from-file", "-", "--concurrency", "2"],
+        input="0x1\n# comment\n\n0x2\n0x3\n",
+    )
+    assert result.exit_code == 0
+    records = [json.loads(line) for line in result.output.splitlines()]
+    assert sorted(record["address"] for record in records) == ["0x1", "0x2", "0x3"]
+    assert all(record["data"]["data"]["endpoint"].endswith("/portfolio") for record in records)
+    assert len(fake_request) == 3
+
+
+def test_wallet_batch_reports_errors(fake_request, tmp_path):
+    """Test failed addresses are reported and set a non-zero exit code."""
+    path = tmp_path / "addresses.txt"
+    path.write_text("0x1\n0xbad\n")
+    result = CliRunner().invoke(
+        cli_module.cli, ["wallet", "balances", "--from-file", str(path)]
+    )
+    assert result.exit_code == 1
+    records = {
+        record["address"]: record
+        for record in map(json.loads, result.output.splitlines())
+    }
+    assert "data" in records["0x1"]
+    assert records["0xbad"]["status"] == 404
+
+
+def test_wallet_requires_address_or_file(fake_request):
+    """Test exactly one of ADDRESS and --from-file is required."""
+    result = CliRunner().invoke(cli_module.cli, ["wallet", "info"])
+    assert result.exit_code == 2
+    assert "Provide either ADDRESS or --from-file" in result.output
+
+
+def test_cache_option_builds_sqlite_cache(tmp_path, zerion_api_key):
+    """Test --cache configures a persistent cache the client closes."""
+    path = str(tmp_path / "cache.sqlite")
+    with click.Context(cli_module.cli, obj={"cache_path": path}):
+        client = cli_module.make_client()
+    cache = client.cache
+    assert isinstance(cache, SQLiteCache)
+    assert cache.path == path
+    asyncio.run(client.close())
+    assert client.cache is None
+    with pytest.raises(sqlite3.ProgrammingError):
+        cache._conn.execute("SELECT 1")
+
+
+def test_cli_import_is_lazy():
+    """Test importing the CLI does not load aiohttp, asyncio or dotenv."""
+    code = (
+        "import sys, hyper_agent.zerion.cli; "
+        "print(sorted(m for m in ('aiohttp', 'asyncio', 'dotenv') if m in sys.modules))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    ).stdout
+    assert output.strip() == "[]"
+
+
+def test_watch_prints_events(monkeypatch, zerion_api_key):
+    """Test watch mode prints NDJSON events until --max-events."""
+    async def request(self, method, endpoint, params=None, data=None, use_cache=True):
+        assert not use_cache
+        return {"data": [{"id": "eth", "attributes": {"quantity": {"float": 1}}}]}
+
+    monkeypatch.setattr(ZerionClient, "request", request)
+    result = CliRunner().invoke(
+        cli_module.cli,
+        ["watch", "0x1", "--from-file", "-", "--max-events", "2"],
+        input="0x2\n",
+    )
+    assert result.exit_code == 0, result.output
+    records = [json.loads(line) for line in result.output.splitlines()]
+    assert sorted(record["address"] for record in records) == ["0x1", "0x2"]
+    assert {record["kind"] for record in records} == {"initial"}
+    assert records[0]["holdings"] == {"eth": 1.0}
+    assert CliRunner().invoke(cli_module.cli, ["watch"]).exit_code == 2
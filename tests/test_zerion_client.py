@@ -1,6 +1,9 @@
 """Tests for the Zerion client base functionality."""
+import asyncio
 import pytest
 import base64
+import threading
+import aiohttp
 from aiohttp import web
 from hyper_agent.zerion.client import ZerionClient
 from hyper_agent.zerion.constants import API_BASE_URL_ENV_VAR
@@ -53,6 +56,7 @@ async def test_client_request(aiohttp_client, zerion_api_key: str):
     zerion_client.base_url = str(client.make_url(""))
     response = await zerion_client._request("GET", "/test")
     assert response == {"status": "success"}
+    await zerion_client.close()
 
 @pytest.mark.asyncio
 async def test_client_error_handling(aiohttp_client, zerion_api_key: str):
@@ -68,6 +72,7 @@ async def test_client_error_handling(aiohttp_client, zerion_api_key: str):
     zerion_client.base_url = str(client.make_url(""))
     with pytest.raises(ValueError, match="API request failed: {'error': 'Not found'}"):
         await zerion_client._request("GET", "/test")
+    await zerion_client.close()
 
 @pytest.mark.asyncio
 async def test_client_rate_limit_handling(aiohttp_client, zerion_api_key: str):
@@ -86,4 +91,176 @@ async def test_client_rate_limit_handling(aiohttp_client, zerion_api_key: str):
     zerion_client = ZerionClient(api_key=zerion_api_key)
     zerion_client.base_url = str(client.make_url(""))
     with pytest.raises(Exception, match="Rate limit exceeded. Retry after 5 seconds"):
-        await zerion_client._request("GET", "/test")
\ No newline at end of file
+        await zerion_client._request("GET", "/test")
+    await zerion_client.close()
+
+@pytest.mark.asyncio
+async def test_client_reuses_session(aiohttp_client, zerion_api_key: str):
+    """Test client keeps one pooled session across requests."""
+    async def handler(request):
+        return web.json_response({"status": "success"})
+
+    app = web.Application()
+    app.router.add_get("/test", handler)
+    client = await aiohttp_client(app)
+
+    zerion_client = ZerionClient(api_key=zerion_api_key, pool_size=10, dns_cache_ttl=60)
+    zerion_client.base_url = str(client.make_url(""))
+    await zerion_client._request("GET", "/test")
+    session = zerion_client._session
+    await zerion_client._request("GET", "/test")
+    assert zerion_client._session is session
+    assert session.connector.limit == 10
+    await zerion_client.close()
+    assert session.closed
+    assert zerion_client.closed
+
+@pytest.mark.asyncio
+async def test_client_context_manager(aiohttp_client, zerion_api_key: str):
+    """Test client closes its session when used as a context manager."""
+    async def handler(request):
+        return web.json_response({"status": "success"})
+
+    app = web.Application()
+    app.router.add_get("/test", handler)
+    client = await aiohttp_client(app)
+
+    async with ZerionClient(api_key=zerion_api_key) as zerion_client:
+        zerion_client.base_url = str(client.make_url(""))
+        assert not zerion_client.closed
+        assert await zerion_client.request("GET", "/test") == {"status": "success"}
+    assert zerion_client.closed
+
+@pytest.mark.asyncio
+async def test_client_external_session_not_closed(aiohttp_client, zerion_api_key: str):
+    """Test client leaves an externally provided session open."""
+    async def handler(request):
+        return web.json_response({"status": "success"})
+
+    app = web.Application()
+    app.router.add_get("/test", handler)
+    client = await aiohttp_client(app)
+
+    async with aiohttp.ClientSession() as session:
+        async with ZerionClient(api_key=zerion_api_key, session=session) as zerion_client:
+            zerion_client.base_url = str(client.make_url(""))
+            await zerion_client.request("GET", "/test")
+            assert zerion_client._session is session
+        assert not session.closed
+
+@pytest.fixture
+def threaded_server():
+    """URL of a test server running on its own event loop thread."""
+    async def handler(request):
+        return web.json_response({"status": "success"})
+
+    app = web.Application()
+    app.router.add_get("/test", handler)
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    runner = web.AppRunner(app)
+    asyncio.run_coroutine_threadsafe(runner.setup(), loop).result(5)
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    asyncio.run_coroutine_threadsafe(site.start(), loop).result(5)
+    yield f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+    asyncio.run_coroutine_threadsafe(runner.cleanup(), loop).result(5)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+def test_client_reused_across_event_loops(threaded_server, zerion_api_key: str):
+    """Test one client serves consecutive asyncio.run calls."""
+    zerion_client = ZerionClient(api_key=zerion_api_key)
+    zerion_client.base_url = threaded_server
+
+    async def fetch():
+        result = await zerion_client.request("GET", "/test")
+        return result, zerion_client._session
+
+    first, first_session = asyncio.run(fetch())
+    second, second_session = asyncio.run(fetch())
+    assert first == second == {"status": "success"}
+    assert second_session is not first_session
+    assert first_session.closed
+    asyncio.run(zerion_client.close())
+    assert second_session.closed
+
+def test_client_external_session_from_other_loop(threaded_server, zerion_api_key: str):
+    """Test a caller's session used from another loop fails clearly."""
+    async def first_run():
+        async with aiohttp.ClientSession() as session:
+            zerion_client = ZerionClient(api_key=zerion_api_key, session=session)
+            zerion_client.base_url = threaded_server
+            await zerion_client.request("GET", "/test")
+            return zerion_client
+
+    zerion_client = asyncio.run(first_run())
+    with pytest.raises(RuntimeError, match="another event loop"):
+        asyncio.run(zerion_client.request("GET", "/test"))
+
+@pytest.mark.asyncio
+async def test_client_coalesces_identical_requests(aiohttp_client, zerion_api_key: str):
+    """Test concurrent identical GETs share one in-flight request."""
+    calls = []
+
+    async def handler(request):
+        calls.append(request.query_string)
+        await asyncio.sleep(0.05)
+        return web.json_response({"status": "success"})
+
+    app = web.Application()
+    app.router.add_get("/test", handler)
+    client = await aiohttp_client(app)
+
+    async with ZerionClient(api_key=zerion_api_key) as zerion_client:
+        zerion_client.base_url = str(client.make_url(""))
+        results = await asyncio.gather(
+            *(zerion_client.request("GET", "/test") for _ in range(5)),
+            zerion_client.request("GET", "/test", params={"page": 2})
+        )
+        assert all(result == {"status": "success"} for result in results)
+        assert results[0] is results[4]
+        assert sorted(calls) == ["", "page=2"]
+        assert zerion_client._inflight == {}
+
+@pytest.mark.asyncio
+async def test_client_coalescing_survives_cancelled_caller(aiohttp_client, zerion_api_key: str):
+    """Test cancelling one waiter does not cancel the shared request."""
+    calls = []
+
+    async def handler(request):
+        calls.append(request)
+        await asyncio.sleep(0.05)
+        return web.json_response({"status": "success"})
+
+    app = web.Application()
+    app.router.add_get("/test", handler)
+    client = await aiohttp_client(app)
+
+    async with ZerionClient(api_key=zerion_api_key) as zerion_client:
+        zerion_client.base_url = str(client.make_url(""))
+        first = asyncio.ensure_future(zerion_client.request("GET", "/test"))
+        second = asyncio.ensure_future(zerion_client.request("GET", "/test"))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        assert await second == {"status": "success"}
+        assert len(calls) == 1
+
+@pytest.mark.asyncio
+async def test_client_coalescing_disabled(aiohttp_client, zerion_api_key: str):
+    """Test coalescing can be turned off."""
+    calls = []
+
+    async def handler(request):
+        calls.append(request)
+        return web.json_response({"status": "success"})
+
+    app = web.Application()
+    app.router.add_get("/test", handler)
+    client = await aiohttp_client(app)
+
+    async with ZerionClient(api_key=zerion_api_key, coalesce_requests=False) as zerion_client:
+        zerion_client.base_url = str(client.make_url(""))
+        await asyncio.gather(*(zerion_client.request("GET", "/test") for _ in range(3)))
+    assert len(calls) == 3
@@ -0,0 +1,118 @@
+"""Tests for columnar export of Zerion records."""
+import csv
+import io
+
+import pytest
+
+from hyper_agent.zerion.columnar import (
+    NULL_TIMESTAMP,
+    PositionColumns,
+    TransactionColumns,
+)
+from hyper_agent.zerion.models import Position
+
+np = pytest.importorskip("numpy")
+
+
+def make_position(position_id="a", symbol="ETH"):
+    """Build a positions resource in Zerion's JSON:API shape."""
+    return {
+        "type": "positions",
+        "id": position_id,
+        "attributes": {
+            "quantity": {"float": 1.0},
+            "value": 3000.0,
+            "price": 3000.0,
+            "changes": {"percent_1d": 1.0},
+            "fungible_info": {"symbol": symbol},
+        },
+        "relationships": {"chain": {"data": {"type": "chains", "id": "ethereum"}}},
+    }
+
+
+def make_tx(tx_id, chain="ethereum", mined_at="2024-01-01T00:00:00Z"):
+    """Build a transactions resource with one transfer in each direction."""
+    return {
+        "type": "transactions",
+        "id": tx_id,
+        "attributes": {
+            "operation_type": "trade",
+            "hash": f"0x{tx_id}",
+            "mined_at_block": 7,
+            "mined_at": mined_at,
+            "status": "confirmed",
+            "fee": {"value": 0.5},
+            "transfers": [
+                {"direction": "in", "value": 10.0},
+                {"direction": "out", "value": 4.0},
+                {"direction": "out", "value": None},
+            ],
+        },
+        "relationships": {"chain": {"data": {"type": "chains", "id": chain}}},
+    }
+
+
+async def stream(items):
+    """Yield items from an async iterator."""
+    for item in items:
+        yield item
+
+
+@pytest.mark.asyncio
+async def test_transaction_columns():
+    """Test transactions become typed arrays while streaming."""
+    columns = TransactionColumns()
+    await columns.aextend(stream([
+        make_tx("a"),
+        make_tx("b", chain="base", mined_at=None),
+        make_tx("c"),
+    ]))
+    arrays = columns.to_arrays()
+    assert len(columns) == 3
+    assert arrays["mined_at"].dtype == np.int64
+    assert arrays["mined_at"][0] == 1704067200
+    assert arrays["mined_at"][1] == NULL_TIMESTAMP
+    assert np.isnat(arrays["mined_at"].view("datetime64[s]")[1])
+    assert arrays["value_in"].tolist() == [10.0, 10.0, 10.0]
+    assert arrays["value_out"].tolist() == [4.0, 4.0, 4.0]
+    assert arrays["chain_id"].dtype == np.int32
+    assert arrays["chain_id"].tolist() == [0, 1, 0]
+    assert columns.categories()["chain_id"] == ["ethereum", "base"]
+    assert arrays["hash"].tolist() == ["0xa", "0xb", "0xc"]
+
+
+def test_position_columns_accept_models_and_missing_values():
+    """Test models are accepted and missing values become NaN and -1."""
+    columns = PositionColumns()
+    columns.append(Position.from_json(make_position()))
+    columns.extend([{"type": "positions", "id": "empty", "attributes": {}}])
+    arrays = columns.to_arrays()
+    assert arrays["value"][0] == 3000.0
+    assert np.isnan(arrays["value"][1])
+    assert arrays["symbol"].tolist() == [0, -1]
+    assert arrays["change_1d_percent"][0] == 1.0
+
+
+def test_npz_round_trip(tmp_path):
+    """Test the .npz archive holds arrays and category lists."""
+    columns = PositionColumns()
+    columns.extend([make_position(), make_position("b", symbol="USDC")])
+    path = tmp_path / "positions.npz"
+    columns.to_npz(str(path))
+    with np.load(str(path)) as archive:
+        assert archive["value"].tolist() == [3000.0, 3000.0]
+        assert archive["symbol_categories"].tolist() == ["ETH", "USDC"]
+        assert archive["symbol"].tolist() == [0, 1]
+
+
+def test_csv_export():
+    """Test CSV rows decode categories and leave missing values empty."""
+    columns = TransactionColumns()
+    columns.extend([make_tx("a"), make_tx("b", mined_at=None)])
+    buffer = io.StringIO()
+    columns.to_csv(buffer)
+    rows = list(csv.DictReader(io.StringIO(buffer.getvalue())))
+    assert rows[0]["chain_id"] == "ethereum"
+    assert rows[0]["mined_at"] == "1704067200"
+    assert rows[1]["mined_at"] == ""
+    assert rows[0]["fee"] == "0.5"
@@ -0,0 +1,162 @@
+"""Tests for Zerion response decoding."""
+import asyncio
+import concurrent.futures
+import gc
+import json
+import threading
+import time
+
+import pytest
+from aiohttp import web
+
+from hyper_agent.zerion.client import ZerionClient
+from hyper_agent.zerion.decoding import ResponseDecoder, decode_sliced, get_loads
+
+
+def test_get_loads():
+    """Test decoders are resolved by name."""
+    body = b'{"a": [1, 2]}'
+    assert get_loads("json")(body) == {"a": [1, 2]}
+    assert get_loads("auto")(body) == {"a": [1, 2]}
+    with pytest.raises(ValueError, match="Unknown JSON decoder"):
+        get_loads("yaml")
+
+
+def test_get_loads_orjson():
+    """Test the orjson decoder when installed."""
+    pytest.importorskip("orjson")
+    assert get_loads("orjson")(b'{"a": 1}') == {"a": 1}
+
+
+@pytest.mark.asyncio
+async def test_decoder_slices_large_bodies():
+    """Test only bodies above the threshold bypass loads and decode in slices."""
+    calls = []
+
+    def loads(body):
+        calls.append(body)
+        return json.loads(body)
+
+    decoder = ResponseDecoder(loads=loads, offload_threshold=100)
+    assert await decoder.decode(b'{"small": true}') == {"small": True}
+    large = json.dumps({"data": [{"id": "x" * 10}] * 20, "links": {}}).encode()
+    assert await decoder.decode(large) == json.loads(large)
+    assert calls == [b'{"small": true}']
+
+    never = ResponseDecoder(loads=loads, offload_threshold=None)
+    await never.decode(large)
+    assert calls[-1] == large
+
+
+@pytest.mark.asyncio
+async def test_decoder_offloads_to_executor():
+    """Test large bodies are decoded with loads in an explicit executor."""
+    threads = []
+
+    def loads(body):
+        threads.append(threading.get_ident())
+        return json.loads(body)
+
+    with concurrent.futures.ThreadPoolExecutor(1) as executor:
+        decoder = ResponseDecoder(loads=loads, offload_threshold=1, executor=executor)
+        assert await decoder.decode(b"[1, 2]") == [1, 2]
+    assert threads[0] != threading.get_ident()
+
+
+@pytest.mark.parametrize("body", [
+    b' {"data": [1, {"a": [2]}, "x"], "meta": null, "links": {"next": "u"}} ',
+    b"[]", b"{}", b'[{}, [], ""]', b'"text"', b"12.5",
+])
+@pytest.mark.asyncio
+async def test_decode_sliced_matches_json(body):
+    """Test the sliced decoder agrees with json.loads."""
+    assert await decode_sliced(body, slice_time=0) == json.loads(body)
+
+
+@pytest.mark.parametrize("body", [b'{"a": 1,}', b"[1 2]", b'{"a" 1}', b"[1] x", b""])
+@pytest.mark.asyncio
+async def test_decode_sliced_rejects_invalid_json(body):
+    """Test malformed bodies raise JSONDecodeError like json.loads."""
+    with pytest.raises(json.JSONDecodeError):
+        await decode_sliced(body)
+
+
+@pytest.mark.asyncio
+async def test_decoder_keeps_loop_responsive():
+    """Test the loop keeps ticking while a large page is decoded."""
+    transaction = {
+        "type": "transactions",
+        "id": "0x" + "a" * 64,
+        "attributes": {
+            "mined_at": "2024-01-01T00:00:00Z",
+            "transfers": [{"symbol": "ETH", "quantity": {"float": 1.5}}] * 3,
+        },
+    }
+    body = json.dumps({"data": [transaction] * 20000}).encode()
+    gaps = []
+    done = asyncio.Event()
+
+    async def tick():
+        last = time.perf_counter()
+        while not done.is_set():
+            await asyncio.sleep(0)
+            now = time.perf_counter()
+            gaps.append(now - last)
+            last = now
+
+    # Collector passes over the growing result pause any decoder alike.
+    gc.disable()
+    try:
+        started = time.perf_counter()
+        expected = json.loads(body)
+        blocking = time.perf_counter() - started
+        ticker = asyncio.ensure_future(tick())
+        await asyncio.sleep(0)
+        decoded = await ResponseDecoder(offload_threshold=1).decode(body)
+        done.set()
+        await ticker
+    finally:
+        gc.enable()
+    assert decoded == expected
+    assert len(gaps) > 10
+    assert max(gaps) < blocking / 2
+
+
+@pytest.mark.asyncio
+async def test_client_uses_decoder(aiohttp_client, zerion_api_key):
+    """Test the client decodes bodies with its configured decoder."""
+    bodies = []
+
+    def loads(body):
+        bodies.append(body)
+        return json.loads(body)
+
+    async def handler(request):
+        return web.json_response({"status": "success"})
+
+    app = web.Application()
+    app.router.add_get("/test", handler)
+    server = await aiohttp_client(app)
+
+    async with ZerionClient(
+        api_key=zerion_api_key, decoder=ResponseDecoder(loads=loads)
+    ) as client:
+        client.base_url = str(server.make_url(""))
+        assert await client.request("GET", "/test") == {"status": "success"}
+    assert bodies == [b'{"status": "success"}']
+
+
+@pytest.mark.asyncio
+async def test_client_non_json_error_body(aiohttp_client, zerion_api_key):
+    """Test non-JSON error bodies are reported as text."""
+    async def handler(request):
+        return web.Response(status=400, text="<html>bad request</html>")
+
+    app = web.Application()
+    app.router.add_get("/test", handler)
+    server = await aiohttp_client(app)
+
+    async with ZerionClient(api_key=zerion_api_key) as client:
+        client.base_url = str(server.make_url(""))
+        with pytest.raises(ValueError, match="API request failed: <html>bad request</html>"):
+            await client.request("GET", "/test")
@@ -0,0 +1,95 @@
+"""Tests for the Zerion position diff engine."""
+from hyper_agent.zerion.diff import (
+    PositionChange,
+    diff_holdings,
+    diff_many,
+    diff_positions,
+    index_positions,
+)
+from hyper_agent.zerion.models import Position
+
+
+def make_position(fungible_id, quantity, chain="ethereum", position_id=True):
+    """Build a positions resource in Zerion's JSON:API shape."""
+    return {
+        "type": "positions",
+        "id": f"{fungible_id}-{chain}" if position_id else None,
+        "attributes": {"quantity": {"float": quantity}, "position_type": "wallet"},
+        "relationships": {
+            "chain": {"data": {"type": "chains", "id": chain}},
+            "fungible": {"data": {"type": "fungibles", "id": fungible_id}},
+        },
+    }
+
+
+def test_diff_positions_kinds():
+    """Test opened, closed, increased and decreased positions are reported."""
+    before = {"data": [
+        make_position("eth", 1.0),
+        make_position("usdc", 100.0),
+        make_position("pepe", 5.0),
+        make_position("dai", 7.0),
+    ]}
+    after = {"data": [
+        make_position("eth", 2.5),
+        make_position("usdc", 40.0),
+        make_position("dai", 7.0),
+        make_position("wbtc", 0.1),
+    ]}
+    diff = diff_positions(before, after)
+    assert diff.increased == [PositionChange("eth-ethereum", "increased", 1.0, 2.5)]
+    assert diff.decreased == [PositionChange("usdc-ethereum", "decreased", 100.0, 40.0)]
+    assert diff.opened == [PositionChange("wbtc-ethereum", "opened", 0.0, 0.1)]
+    assert diff.closed == [PositionChange("pepe-ethereum", "closed", 5.0, 0.0)]
+    assert len(diff) == 4
+    assert diff.increased[0].delta == 1.5
+    assert diff.closed[0].position.fungible_id == "pepe"
+    assert diff.opened[0].current.quantity == 0.1
+    assert not diff_positions(after, after)
+
+
+def test_diff_falls_back_to_composite_key():
+    """Test positions without an id are matched by fungible, chain and protocol."""
+    before = [make_position("eth", 1.0, position_id=False)]
+    after = [
+        Position.from_json(make_position("eth", 1.0, position_id=False)),
+        Position.from_json(make_position("eth", 2.0, "base", position_id=False)),
+    ]
+    diff = diff_positions(before, after)
+    assert [change.key for change in diff] == [("eth", "base", None, "wallet")]
+    assert diff.as_dict()[0]["key"] == ["eth", "base", None, "wallet"]
+
+
+def test_diff_accepts_index_and_tolerance():
+    """Test a kept index can be reused and small changes ignored."""
+    index = index_positions([make_position("eth", 1.0)])
+    after = [make_position("eth", 1.0000001), make_position("dust", 1e-9)]
+    assert not diff_positions(index, after, tolerance=1e-6)
+    assert diff_positions(index, after).increased[0].key == "eth-ethereum"
+
+
+def test_diff_holdings_treats_zero_as_absent():
+    """Test zero and missing quantities count as no position."""
+    diff = diff_holdings({"a": 0.0, "b": None, "c": 2.0}, {"a": 1.0, "c": 0.0})
+    assert [(change.key, change.kind) for change in diff] == [
+        ("a", "opened"), ("c", "closed"),
+    ]
+
+
+def test_diff_many():
+    """Test wallets are diffed in one call, including one-sided wallets."""
+    before = {
+        "0x1": [make_position("eth", 1.0)],
+        "0x2": [make_position("eth", 1.0)],
+        "0x3": [make_position("usdc", 5.0)],
+    }
+    after = {
+        "0x1": [make_position("eth", 1.0)],
+        "0x2": [make_position("eth", 3.0)],
+        "0x4": [make_position("dai", 2.0)],
+    }
+    diffs = diff_many(before, after)
+    assert sorted(diffs) == ["0x2", "0x3", "0x4"]
+    assert diffs["0x2"].increased[0].delta == 2.0
+    assert diffs["0x3"].closed[0].key == "usdc-ethereum"
+    assert diffs["0x4"].opened[0].key == "dai-ethereum"
@@ -0,0 +1,137 @@
+"""Tests for Zerion request instrumentation."""
+import io
+import json
+
+import pytest
+from aiohttp import web
+
+from hyper_agent.zerion.client import ZerionClient
+from hyper_agent.zerion.exceptions import ZerionAPIError
+from hyper_agent.zerion.instrumentation import Histogram, Instrumentation
+from hyper_agent.zerion.retry import RetryPolicy
+from hyper_agent.zerion.wallet import ZerionWallet
+
+
+@pytest.fixture
+async def server(aiohttp_client):
+    """Serve a portfolio, and a 404 for wallet 0xmissing."""
+    async def portfolio(request):
+        if request.match_info["address"] == "0xmissing":
+            return web.json_response({"errors": []}, status=404)
+        return web.json_response({"data": {"id": request.match_info["address"]}})
+
+    app = web.Application()
+    app.router.add_get("/v1/wallets/{address}/portfolio", portfolio)
+    return await aiohttp_client(app)
+
+
+def test_histogram_buckets():
+    """Test values land in the first bucket whose bound is not exceeded."""
+    histogram = Histogram((0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 5.0):
+        histogram.observe(value)
+    assert histogram.counts == [2, 1, 1]
+    assert histogram.cumulative() == [2, 3, 4]
+    assert histogram.count == 4
+    assert histogram.sum == pytest.approx(5.65)
+
+
+@pytest.mark.asyncio
+async def test_client_records_requests(server, zerion_api_key):
+    """Test statuses, bytes, timings and hooks are recorded per endpoint."""
+    instrumentation = Instrumentation()
+    records = []
+    instrumentation.add_hook(records.append)
+    async with ZerionClient(
+        api_key=zerion_api_key,
+        instrumentation=instrumentation,
+        retry_policy=RetryPolicy(max_attempts=1),
+    ) as client:
+        client.base_url = str(server.make_url("/v1"))
+        wallet = ZerionWallet(client)
+        await wallet.get_wallet_portfolio("0x1")
+        await wallet.get_wallet_portfolio("0x2")
+        with pytest.raises(ZerionAPIError):
+            await wallet.get_wallet_portfolio("0xmissing")
+
+    metrics = instrumentation.endpoints["wallet_portfolio"]
+    assert metrics.statuses == {200: 2, 404: 1}
+    assert metrics.requests == 3
+    assert metrics.bytes == sum(record.bytes for record in records)
+    assert metrics.histograms["total"].count == 3
+    assert metrics.histograms["ttfb"].count == 3
+    assert metrics.histograms["connect"].count == 1
+    assert [record.status for record in records] == [200, 200, 404]
+    assert records[0].connect is not None
+    assert records[1].connect is None
+    assert records[0].ttfb <= records[0].total
+
+
+@pytest.mark.asyncio
+async def test_failing_hook_does_not_change_results(server, zerion_api_key, caplog):
+    """Test a broken hook is logged while responses and errors pass through."""
+    def broken(record):
+        raise RuntimeError("exporter down")
+
+    instrumentation = Instrumentation()
+    records = []
+    instrumentation.add_hook(broken)
+    instrumentation.add_hook(records.append)
+    async with ZerionClient(
+        api_key=zerion_api_key,
+        instrumentation=instrumentation,
+        retry_policy=RetryPolicy(max_attempts=1),
+    ) as client:
+        client.base_url = str(server.make_url("/v1"))
+        wallet = ZerionWallet(client)
+        assert await wallet.get_wallet_portfolio("0x1") == {"data": {"id": "0x1"}}
+        with pytest.raises(ZerionAPIError):
+            await wallet.get_wallet_portfolio("0xmissing")
+    assert [record.status for record in records] == [200, 404]
+    failures = [r for r in caplog.records if r.name.endswith("instrumentation")]
+    assert len(failures) == 2
+    assert all(str(r.exc_info[1]) == "exporter down" for r in failures)
+
+
+@pytest.mark.asyncio
+async def test_connection_errors_are_counted(zerion_api_key):
+    """Test requests without a response are counted by error type."""
+    instrumentation = Instrumentation()
+    async with ZerionClient(
+        api_key=zerion_api_key,
+        instrumentation=instrumentation,
+        retry_policy=RetryPolicy(max_attempts=1),
+    ) as client:
+        client.base_url = "http://127.0.0.1:1/v1"
+        with pytest.raises(Exception):
+            await client.request("GET", "/tokens/eth/price")
+    metrics = instrumentation.endpoints["token_price"]
+    assert not metrics.statuses
+    assert sum(metrics.errors.values()) == 1
+
+
+@pytest.mark.asyncio
+async def test_exporters(server, zerion_api_key):
+    """Test metrics render as Prometheus text and JSON."""
+    instrumentation = Instrumentation(buckets=(0.5, 5.0))
+    async with ZerionClient(
+        api_key=zerion_api_key, instrumentation=instrumentation
+    ) as client:
+        client.base_url = str(server.make_url("/v1"))
+        await ZerionWallet(client).get_wallet_portfolio("0x1")
+
+    text = instrumentation.to_prometheus()
+    assert 'zerion_requests_total{endpoint="wallet_portfolio",status="200"} 1' in text
+    assert "# TYPE zerion_request_duration_seconds histogram" in text
+    assert (
+        'zerion_request_duration_seconds_bucket{endpoint="wallet_portfolio",'
+        'phase="total",le="+Inf"} 1'
+    ) in text
+
+    buffer = io.StringIO()
+    instrumentation.dump_json(buffer)
+    dumped = json.loads(buffer.getvalue())
+    assert dumped["wallet_portfolio"]["statuses"] == {"200": 1}
+    assert dumped["wallet_portfolio"]["histograms"]["total"]["buckets"] == [0.5, 5.0]
+    instrumentation.reset()
+    assert instrumentation.to_dict() == {}
@@ -0,0 +1,194 @@
+"""Tests for the Zerion typed models."""
+import json
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from hyper_agent.zerion.client import ZerionClient
+from hyper_agent.zerion.models import (
+    FungibleInfo,
+    Page,
+    Portfolio,
+    Position,
+    Transaction,
+    parse_list,
+    parse_page,
+    parse_timestamp,
+)
+from hyper_agent.zerion.token import ZerionToken
+from hyper_agent.zerion.wallet import ZerionWallet
+
+
+def make_position(position_id="0x1-eth", chain="ethereum", symbol="ETH", value=3000.0):
+    """Build a positions resource in Zerion's JSON:API shape."""
+    return {
+        "type": "positions",
+        "id": position_id,
+        "attributes": {
+            "name": "Asset",
+            "position_type": "wallet",
+            "protocol": None,
+            "quantity": {"int": "1000000000000000000", "decimals": 18, "float": 1.0},
+            "value": value,
+            "price": value,
+            "changes": {"absolute_1d": 30.0, "percent_1d": 1.0},
+            "fungible_info": {
+                "name": "Ethereum",
+                "symbol": symbol,
+                "icon": {"url": "https://example.com/eth.png"},
+                "flags": {"verified": True},
+                "implementations": [
+                    {"chain_id": chain, "address": None, "decimals": 18}
+                ],
+            },
+        },
+        "relationships": {
+            "chain": {"data": {"type": "chains", "id": chain}},
+            "fungible": {"data": {"type": "fungibles", "id": "eth"}},
+        },
+    }
+
+
+@pytest.fixture
+def transaction_resource():
+    """A transactions resource in Zerion's JSON:API shape."""
+    return {
+        "type": "transactions",
+        "id": "tx-1",
+        "attributes": {
+            "operation_type": "trade",
+            "hash": "0xabc",
+            "mined_at_block": 100,
+            "mined_at": "2024-01-01T00:00:00Z",
+            "sent_from": "0x1",
+            "sent_to": "0x2",
+            "status": "confirmed",
+            "fee": {"value": 1.5},
+            "transfers": [
+                {
+                    "direction": "out",
+                    "quantity": {"float": 2.0},
+                    "value": 6000.0,
+                    "price": 3000.0,
+                    "sender": "0x1",
+                    "recipient": "0x2",
+                    "fungible_info": {"name": "Ethereum", "symbol": "ETH"},
+                }
+            ],
+        },
+        "relationships": {"chain": {"data": {"type": "chains", "id": "ethereum"}}},
+    }
+
+
+def test_position_from_json():
+    """Test positions expose flat fields and lazily decoded token info."""
+    position = Position.from_json(make_position())
+    assert position.chain_id == "ethereum"
+    assert position.fungible_id == "eth"
+    assert position.quantity == 1.0
+    assert position.value == 3000.0
+    assert position.changes["percent_1d"] == 1.0
+    assert isinstance(position._fungible_info, dict)
+    assert position.symbol == "ETH"
+    assert isinstance(position._fungible_info, FungibleInfo)
+    assert position.fungible_info.address_on("ethereum") is None
+    assert position.fungible_info.implementations[0].decimals == 18
+    assert not hasattr(position, "__dict__")
+
+
+def test_position_interns_repeated_strings():
+    """Test repeated strings share a single object across records."""
+    chain = "".join(["ether", "eum"])
+    first = Position.from_json(make_position("a", chain=chain))
+    second = Position.from_json(make_position("b", chain="".join(["ethe", "reum"])))
+    assert first.chain_id is second.chain_id
+    assert first.chain_id is sys.intern("ethereum")
+
+
+def test_transaction_from_json(transaction_resource):
+    """Test transactions decode transfers and timestamps on access."""
+    transaction = Transaction.from_json(transaction_resource)
+    assert transaction.operation_type == "trade"
+    assert transaction.chain_id == "ethereum"
+    assert transaction.timestamp == 1704067200.0
+    assert transaction.fee_value == 1.5
+    assert transaction.transfers[0].direction == "out"
+    assert transaction.transfers[0].quantity == 2.0
+    assert transaction.transfers[0].symbol == "ETH"
+
+
+def test_portfolio_from_json():
+    """Test portfolio totals and distributions are parsed."""
+    portfolio = Portfolio.from_json({
+        "type": "portfolio",
+        "id": "0x1",
+        "attributes": {
+            "positions_distribution_by_type": {"wallet": 100.0, "staked": 50.0},
+            "positions_distribution_by_chain": {"ethereum": 150.0},
+            "total": {"positions": 150.0},
+            "changes": {"absolute_1d": 5.0, "percent_1d": 3.4},
+        },
+    })
+    assert portfolio.total_value == 150.0
+    assert portfolio.by_type == {"wallet": 100.0, "staked": 50.0}
+    assert portfolio.by_chain == {"ethereum": 150.0}
+    assert portfolio.change_1d_percent == 3.4
+
+
+def test_parse_page(transaction_resource):
+    """Test list responses parse into pages that keep the next link."""
+    page = parse_page(
+        {"data": [transaction_resource], "links": {"next": "https://x/next"}},
+        Transaction,
+    )
+    assert isinstance(page, Page)
+    assert len(page) == 1
+    assert [tx.hash for tx in page] == ["0xabc"]
+    assert page.next_link == "https://x/next"
+    assert parse_list({}, Position) == []
+
+
+def test_model_equality_and_dict():
+    """Test models compare by public fields and convert to dicts."""
+    assert Position.from_json(make_position()) == Position.from_json(make_position())
+    assert Position.from_json(make_position()).as_dict()["chain_id"] == "ethereum"
+    assert "Position(id='0x1-eth'" in repr(Position.from_json(make_position()))
+
+
+def test_parse_timestamp():
+    """Test ISO timestamps are converted and invalid values ignored."""
+    assert parse_timestamp("1970-01-01T00:00:10Z") == 10.0
+    assert parse_timestamp("not a date") is None
+    assert parse_timestamp(None) is None
+
+
+@pytest.mark.asyncio
+async def test_wallet_balances_parse(zerion_api_key):
+    """Test parse=True returns Position models."""
+    wallet = ZerionWallet(ZerionClient(api_key=zerion_api_key))
+    with patch("aiohttp.ClientSession.request") as mock_request:
+        mock_request.return_value.__aenter__.return_value.read.return_value = json.dumps({
+            "data": [make_position(), make_position("0x1-usdc", symbol="USDC")]
+        }).encode()
+        mock_request.return_value.__aenter__.return_value.status = 200
+
+        positions = await wallet.get_wallet_balances("0x1", parse=True)
+        assert [position.symbol for position in positions] == ["ETH", "USDC"]
+    await wallet.client.close()
+
+
+@pytest.mark.asyncio
+async def test_token_info_parse(zerion_api_key):
+    """Test parse=True returns a FungibleInfo model."""
+    token = ZerionToken(ZerionClient(api_key=zerion_api_key))
+    with patch("aiohttp.ClientSession.request") as mock_request:
+        mock_request.return_value.__aenter__.return_value.read.return_value = json.dumps({
+            "data": {"type": "fungibles", "id": "eth", "attributes": {"symbol": "ETH"}}
+        }).encode()
+        mock_request.return_value.__aenter__.return_value.status = 200
+
+        info = await token.get_token_info("eth", parse=True)
+        assert info.id == "eth"
+        assert info.symbol == "ETH"
+    await token.client.close()
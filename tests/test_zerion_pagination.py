@@ -0,0 +1,124 @@
+"""Tests for Zerion pagination helpers."""
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from hyper_agent.zerion.client import ZerionClient
+from hyper_agent.zerion.pagination import next_page_request
+from hyper_agent.zerion.wallet import ZerionWallet
+
+PAGES = 3
+PAGE_SIZE = 4
+
+
+def test_next_page_request():
+    """Test next links are split into endpoint path and params."""
+    page = {
+        "links": {
+            "next": "https://api.zerion.io/v1/wallets/0x1/transactions/?page%5Bafter%5D=abc&currency=usd"
+        }
+    }
+    endpoint, params = next_page_request("https://api.zerion.io/v1", page)
+    assert endpoint == "/wallets/0x1/transactions/"
+    assert params == {"page[after]": "abc", "currency": "usd"}
+    assert next_page_request("https://api.zerion.io/v1", {"links": {}}) is None
+    assert next_page_request("https://api.zerion.io/v1", {}) is None
+
+
+@pytest.fixture
+async def wallet_server(aiohttp_client):
+    """Serve a paginated transaction history under /v1."""
+    requests = []
+
+    async def handler(request):
+        page = int(request.query.get("page[after]", "0"))
+        requests.append(page)
+        await asyncio.sleep(0.01)
+        body = {
+            "data": [
+                {"id": f"tx-{page}-{i}", "type": "transactions"}
+                for i in range(PAGE_SIZE)
+            ],
+            "links": {"self": str(request.url)},
+        }
+        if page + 1 < PAGES:
+            body["links"]["next"] = str(
+                request.url.with_query({"page[after]": str(page + 1)})
+            )
+        return web.json_response(body)
+
+    app = web.Application()
+    app.router.add_get("/v1/wallets/{address}/transactions", handler)
+    server = await aiohttp_client(app)
+    return server, requests
+
+
+@pytest.mark.asyncio
+async def test_iter_transactions_follows_links(wallet_server, zerion_api_key):
+    """Test every page is followed until links.next is missing."""
+    server, requests = wallet_server
+    async with ZerionClient(api_key=zerion_api_key) as client:
+        client.base_url = str(server.make_url("/v1"))
+        wallet = ZerionWallet(client)
+        ids = [tx["id"] async for tx in wallet.iter_transactions("0x1", page_size=PAGE_SIZE)]
+    assert len(ids) == PAGES * PAGE_SIZE
+    assert ids[0] == "tx-0-0"
+    assert ids[-1] == f"tx-{PAGES - 1}-{PAGE_SIZE - 1}"
+    assert requests == list(range(PAGES))
+
+
+@pytest.mark.asyncio
+async def test_iter_transactions_max_items(wallet_server, zerion_api_key):
+    """Test iteration stops after max_items without fetching extra pages."""
+    server, requests = wallet_server
+    async with ZerionClient(api_key=zerion_api_key) as client:
+        client.base_url = str(server.make_url("/v1"))
+        wallet = ZerionWallet(client)
+        txs = [tx async for tx in wallet.iter_transactions("0x1", max_items=2, prefetch=False)]
+    assert [tx["id"] for tx in txs] == ["tx-0-0", "tx-0-1"]
+    assert requests == [0]
+
+
+@pytest.mark.asyncio
+async def test_iter_transactions_stop_predicate(wallet_server, zerion_api_key):
+    """Test the stop predicate ends iteration before the matching item."""
+    server, _ = wallet_server
+    async with ZerionClient(api_key=zerion_api_key) as client:
+        client.base_url = str(server.make_url("/v1"))
+        wallet = ZerionWallet(client)
+        txs = [
+            tx async for tx in wallet.iter_transactions(
+                "0x1", stop=lambda tx: tx["id"] == "tx-1-2"
+            )
+        ]
+    assert len(txs) == PAGE_SIZE + 2
+
+
+@pytest.mark.asyncio
+async def test_iter_transactions_prefetches(wallet_server, zerion_api_key):
+    """Test the next page is requested while the current one is consumed."""
+    server, requests = wallet_server
+    async with ZerionClient(api_key=zerion_api_key) as client:
+        client.base_url = str(server.make_url("/v1"))
+        wallet = ZerionWallet(client)
+        iterator = wallet.iter_transactions("0x1")
+        await iterator.__anext__()
+        await asyncio.sleep(0.05)
+        assert requests == [0, 1]
+        await iterator.aclose()
+
+
+@pytest.mark.asyncio
+async def test_iter_transactions_parse(wallet_server, zerion_api_key):
+    """Test parse=True yields Transaction models to the caller and predicate."""
+    server, _ = wallet_server
+    async with ZerionClient(api_key=zerion_api_key) as client:
+        client.base_url = str(server.make_url("/v1"))
+        wallet = ZerionWallet(client)
+        txs = [
+            tx async for tx in wallet.iter_transactions(
+                "0x1", parse=True, stop=lambda tx: tx.id == "tx-0-2"
+            )
+        ]
+    assert [tx.id for tx in txs] == ["tx-0-0", "tx-0-1"]
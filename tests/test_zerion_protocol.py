@@ -1,4 +1,5 @@
 """Tests for the Zerion protocol functionality."""
+import json
 import pytest
 from unittest.mock import patch
 
@@ -9,10 +10,11 @@ from hyper_agent.config import require_env_var
 
 
 @pytest.fixture
-def protocol_client(zerion_api_key):
-    """Create a ZerionProtocol instance."""
+async def protocol_client(zerion_api_key):
+    """Create a ZerionProtocol instance, closing its client afterwards."""
     client = ZerionClient(api_key=zerion_api_key)
-    return ZerionProtocol(client)
+    yield ZerionProtocol(client)
+    await client.close()
 
 
 @pytest.fixture
@@ -90,7 +92,7 @@ def mock_protocol_stats():
 async def test_get_protocol_info(protocol_client, mock_protocol_info):
     """Test getting protocol information."""
     with patch("aiohttp.ClientSession.request") as mock_request:
-        mock_request.return_value.__aenter__.return_value.json.return_value = mock_protocol_info
+        mock_request.return_value.__aenter__.return_value.read.return_value = json.dumps(mock_protocol_info).encode()
         mock_request.return_value.__aenter__.return_value.status = 200
 
         protocol_info = await protocol_client.get_protocol_info("uniswap-v3")
@@ -103,7 +105,7 @@ async def test_get_protocol_info(protocol_client, mock_protocol_info):
 async def test_get_protocol_pools(protocol_client, mock_protocol_pools):
     """Test getting protocol pools."""
     with patch("aiohttp.ClientSession.request") as mock_request:
-        mock_request.return_value.__aenter__.return_value.json.return_value = mock_protocol_pools
+        mock_request.return_value.__aenter__.return_value.read.return_value = json.dumps(mock_protocol_pools).encode()
         mock_request.return_value.__aenter__.return_value.status = 200
 
         pools = await protocol_client.get_protocol_pools("uniswap-v3")
@@ -117,7 +119,7 @@ async def test_get_protocol_pools(protocol_client, mock_protocol_pools):
 async def test_get_protocol_tokens(protocol_client, mock_protocol_tokens):
     """Test getting protocol tokens."""
     with patch("aiohttp.ClientSession.request") as mock_request:
-        mock_request.return_value.__aenter__.return_value.json.return_value = mock_protocol_tokens
+        mock_request.return_value.__aenter__.return_value.read.return_value = json.dumps(mock_protocol_tokens).encode()
         mock_request.return_value.__aenter__.return_value.status = 200
 
         tokens = await protocol_client.get_protocol_tokens("uniswap-v3")
@@ -131,7 +133,7 @@ async def test_get_protocol_tokens(protocol_client, mock_protocol_tokens):
 async def test_get_protocol_stats(protocol_client, mock_protocol_stats):
     """Test getting protocol statistics."""
     with patch("aiohttp.ClientSession.request") as mock_request:
-        mock_request.return_value.__aenter__.return_value.json.return_value = mock_protocol_stats
+        mock_request.return_value.__aenter__.return_value.read.return_value = json.dumps(mock_protocol_stats).encode()
         mock_request.return_value.__aenter__.return_value.status = 200
 
         stats = await protocol_client.get_protocol_stats("uniswap-v3")
@@ -0,0 +1,115 @@
+"""Tests for the Zerion rate limiter."""
+import asyncio
+import time
+
+import pytest
+from aiohttp import web
+
+from hyper_agent.zerion.client import ZerionClient
+from hyper_agent.zerion.ratelimit import RateLimiter, TokenBucket, endpoint_family
+from hyper_agent.zerion.retry import RetryPolicy
+
+
+def test_endpoint_family():
+    """Test endpoint paths map to their ENDPOINTS family."""
+    assert endpoint_family("/wallets/0x123/positions") == "wallet"
+    assert endpoint_family("/tokens/eth/price") == "token"
+    assert endpoint_family("/protocols/uniswap") == "protocol"
+    assert endpoint_family("/unknown") is None
+
+
+def test_invalid_limits():
+    """Test invalid rates and families are rejected."""
+    with pytest.raises(ValueError, match="rate must be positive"):
+        TokenBucket(0)
+    with pytest.raises(ValueError, match="Unknown endpoint family"):
+        RateLimiter(10, family_limits={"nft": (1, 1)})
+
+
+@pytest.mark.asyncio
+async def test_bucket_allows_burst_then_paces():
+    """Test the bucket serves a burst immediately and then paces requests."""
+    bucket = TokenBucket(rate=50, capacity=5)
+    started = time.monotonic()
+    for _ in range(5):
+        await bucket.acquire()
+    assert time.monotonic() - started < 0.05
+
+    started = time.monotonic()
+    for _ in range(5):
+        await bucket.acquire()
+    assert time.monotonic() - started >= 0.08
+
+
+@pytest.mark.asyncio
+async def test_bucket_pause():
+    """Test a paused bucket holds back all waiters."""
+    bucket = TokenBucket(rate=1000, capacity=10)
+    bucket.pause(0.1)
+    assert bucket.tokens == 0.0
+    started = time.monotonic()
+    await bucket.acquire()
+    assert time.monotonic() - started >= 0.09
+
+
+def test_limiter_reused_across_event_loops():
+    """Test contended acquires work in consecutive asyncio.run calls."""
+    limiter = RateLimiter(50, 1)
+
+    async def burst():
+        await asyncio.gather(*(limiter.acquire("/wallets/0x1") for _ in range(3)))
+
+    asyncio.run(burst())
+    asyncio.run(burst())
+
+
+@pytest.mark.asyncio
+async def test_family_limits():
+    """Test family buckets limit only their own endpoints."""
+    limiter = RateLimiter(1000, burst=100, family_limits={"token": (20, 1)})
+    started = time.monotonic()
+    await asyncio.gather(*(limiter.acquire("/wallets/0x1") for _ in range(10)))
+    assert time.monotonic() - started < 0.05
+
+    started = time.monotonic()
+    await asyncio.gather(*(limiter.acquire("/tokens/eth") for _ in range(3)))
+    assert time.monotonic() - started >= 0.09
+
+
+@pytest.mark.asyncio
+async def test_client_uses_rate_limiter(aiohttp_client, zerion_api_key):
+    """Test client requests wait on the limiter and 429 pauses it."""
+    calls = []
+
+    async def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            return web.Response(status=429, headers={"Retry-After": "0.05"})
+        return web.json_response({"status": "success"})
+
+    app = web.Application()
+    app.router.add_get("/wallets/0x1", handler)
+    server = await aiohttp_client(app)
+
+    limiter = RateLimiter(1000, burst=10)
+    async with ZerionClient(
+        api_key=zerion_api_key,
+        rate_limiter=limiter,
+        retry_policy=RetryPolicy(max_attempts=2)
+    ) as client:
+        client.base_url = str(server.make_url(""))
+        assert await client.request("GET", "/wallets/0x1") == {"status": "success"}
+    assert len(calls) == 2
+    assert limiter.bucket.tokens < 10
+
+
+def test_rate_limiter_from_env(monkeypatch, zerion_api_key):
+    """Test the client builds a limiter from environment variables."""
+    monkeypatch.setenv("ZERION_RATE_LIMIT", "5")
+    monkeypatch.setenv("ZERION_RATE_LIMIT_BURST", "2")
+    client = ZerionClient(api_key=zerion_api_key)
+    assert client.rate_limiter.bucket.rate == 5.0
+    assert client.rate_limiter.bucket.capacity == 2.0
+
+    monkeypatch.delenv("ZERION_RATE_LIMIT")
+    assert ZerionClient(api_key=zerion_api_key).rate_limiter is None
@@ -0,0 +1,141 @@
+"""Tests for the shared Zerion token metadata registry."""
+import asyncio
+
+import pytest
+
+from hyper_agent.zerion.models import FungibleInfo, Position, Transaction
+from hyper_agent.zerion.registry import TokenRegistry
+from hyper_agent.zerion.wallet import ZerionWallet
+
+USDC = {
+    "id": "usdc",
+    "name": "USD Coin",
+    "symbol": "USDC",
+    "implementations": [
+        {"chain_id": "ethereum", "address": "0xA0b8", "decimals": 6},
+        {"chain_id": "base", "address": "0x8335", "decimals": 6},
+    ],
+}
+
+
+def make_position(fungible_id, fungible_info):
+    """Build a positions resource carrying its own token metadata."""
+    return {
+        "type": "positions",
+        "id": f"{fungible_id}-position",
+        "attributes": {"quantity": {"float": 1.0}, "fungible_info": fungible_info},
+        "relationships": {
+            "fungible": {"data": {"type": "fungibles", "id": fungible_id}},
+        },
+    }
+
+
+class FakeToken:
+    """Answers token info requests after a short delay."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def get_token_info(self, token_id, use_cache=True, parse=False):
+        self.calls.append(token_id)
+        await asyncio.sleep(0.01)
+        if token_id == "missing":
+            raise LookupError(token_id)
+        return FungibleInfo.from_resource({
+            "id": token_id,
+            "attributes": {**USDC, "symbol": token_id.upper()},
+        })
+
+
+def test_positions_share_one_record():
+    """Test positions of the same token reference one FungibleInfo."""
+    registry = TokenRegistry()
+    positions = registry.normalize_all(
+        Position.from_json(make_position("usdc", dict(USDC))) for _ in range(3)
+    )
+    infos = {id(position.fungible_info) for position in positions}
+    assert len(infos) == 1
+    assert positions[0].symbol == "USDC"
+    assert registry.stats.as_dict() == {"hits": 2, "misses": 1, "fetches": 0}
+    assert registry.get("usdc") is positions[0].fungible_info
+    assert registry.by_symbol("usdc") == [positions[0].fungible_info]
+    assert registry.by_address("base", "0x8335") is positions[0].fungible_info
+    assert registry.by_address("ethereum", "0xa0b8").id == "usdc"
+    assert "usdc" in registry and len(registry) == 1
+
+
+def test_gaps_are_merged_in_place():
+    """Test richer metadata seen later completes the shared record."""
+    registry = TokenRegistry()
+    sparse = registry.normalize(Position.from_json(make_position("usdc", {})))
+    info = sparse.fungible_info
+    assert info.symbol is None
+    registry.normalize(Position.from_json(make_position("usdc", dict(USDC))))
+    assert info.symbol == "USDC"
+    assert registry.by_address("ethereum", "0xA0B8") is info
+
+
+def test_solana_mints_match_case_sensitively():
+    """Test mints differing only in case resolve to their own tokens."""
+    registry = TokenRegistry()
+    upper = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
+    for token_id, address in (("usdc-sol", upper), ("other", upper.lower())):
+        registry.add(FungibleInfo.from_json({
+            "id": token_id,
+            "symbol": token_id.upper(),
+            "implementations": [{"chain_id": "solana", "address": address}],
+        }))
+    assert registry.by_address("solana", upper).id == "usdc-sol"
+    assert registry.by_address("solana", upper.lower()).id == "other"
+    assert registry.by_address("solana", upper.upper()) is None
+
+
+def test_transfers_are_normalized():
+    """Test transfer metadata is shared by fungible id."""
+    registry = TokenRegistry()
+    transaction = Transaction.from_json({
+        "id": "tx",
+        "attributes": {
+            "transfers": [
+                {"direction": "in", "fungible_info": dict(USDC)},
+                {"direction": "out", "fungible_info": dict(USDC)},
+            ]
+        },
+    })
+    first, second = registry.normalize_all(transaction.transfers)
+    assert first.fungible_info is second.fungible_info is registry.get("usdc")
+
+
+@pytest.mark.asyncio
+async def test_resolve_fetches_once():
+    """Test concurrent resolves of a missing token share one fetch."""
+    token = FakeToken()
+    registry = TokenRegistry(token)
+    results = await asyncio.gather(*(registry.resolve("weth") for _ in range(5)))
+    assert token.calls == ["weth"]
+    assert all(result is results[0] for result in results)
+    assert await registry.resolve("weth") is results[0]
+    assert registry.stats.fetches == 1
+
+    resolved = await registry.resolve_many(["weth", "dai", "dai", "missing"])
+    assert resolved["dai"].symbol == "DAI"
+    assert isinstance(resolved["missing"], LookupError)
+    assert token.calls == ["weth", "dai", "missing"]
+    with pytest.raises(ValueError):
+        await TokenRegistry().resolve("dai")
+
+
+@pytest.mark.asyncio
+async def test_wallet_normalizes_parsed_positions():
+    """Test ZerionWallet routes parsed positions through its registry."""
+    class Client:
+        async def request(self, method, endpoint, params=None, data=None,
+                          use_cache=True):
+            return {"data": [make_position("usdc", dict(USDC))]}
+
+    registry = TokenRegistry()
+    wallet = ZerionWallet(Client(), registry=registry)
+    first = await wallet.get_wallet_balances("0x1", parse=True)
+    second = await wallet.get_wallet_balances("0x2", parse=True)
+    assert first[0].fungible_info is second[0].fungible_info
+    assert isinstance((await wallet.get_wallet_balances("0x1"))["data"], list)
@@ -0,0 +1,135 @@
+"""Tests for the Zerion retry policy."""
+import pytest
+from aiohttp import web
+
+from hyper_agent.zerion.client import ZerionClient
+from hyper_agent.zerion.exceptions import ZerionAPIError, ZerionRateLimitError
+from hyper_agent.zerion.retry import RetryPolicy, parse_retry_after
+
+
+async def _make_client(aiohttp_client, zerion_api_key, handler, retry_policy):
+    """Create a ZerionClient pointed at a local test server."""
+    app = web.Application()
+    app.router.add_route("*", "/test", handler)
+    server = await aiohttp_client(app)
+    zerion_client = ZerionClient(api_key=zerion_api_key, retry_policy=retry_policy)
+    zerion_client.base_url = str(server.make_url(""))
+    return zerion_client
+
+
+def test_parse_retry_after():
+    """Test Retry-After parsing for seconds, dates and invalid values."""
+    assert parse_retry_after("5") == 5.0
+    assert parse_retry_after("1.5") == 1.5
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+def test_get_delay():
+    """Test backoff delays grow exponentially and honor Retry-After."""
+    policy = RetryPolicy(backoff_base=1.0, backoff_max=5.0, jitter=False, max_retry_after=10.0)
+    assert policy.get_delay(1) == 1.0
+    assert policy.get_delay(2) == 2.0
+    assert policy.get_delay(4) == 5.0
+    assert policy.get_delay(1, retry_after=3.0) == 3.0
+    assert policy.get_delay(1, retry_after=100.0) == 10.0
+
+    jittered = RetryPolicy(backoff_base=1.0, backoff_max=5.0)
+    assert all(0 <= jittered.get_delay(3) <= 4.0 for _ in range(50))
+
+
+def test_invalid_max_attempts():
+    """Test a policy needs at least one attempt."""
+    with pytest.raises(ValueError, match="max_attempts must be at least 1"):
+        RetryPolicy(max_attempts=0)
+
+
+@pytest.mark.asyncio
+async def test_retries_transient_errors(aiohttp_client, zerion_api_key):
+    """Test 5xx and 429 responses are retried until success."""
+    calls = []
+
+    async def handler(request):
+        calls.append(request)
+        if len(calls) == 1:
+            return web.Response(status=503, text="unavailable")
+        if len(calls) == 2:
+            return web.Response(status=429, headers={"Retry-After": "0"})
+        return web.json_response({"status": "success"})
+
+    policy = RetryPolicy(max_attempts=3, backoff_base=0.01)
+    client = await _make_client(aiohttp_client, zerion_api_key, handler, policy)
+    async with client:
+        assert await client.request("GET", "/test") == {"status": "success"}
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_gives_up_after_max_attempts(aiohttp_client, zerion_api_key):
+    """Test the last error is raised once attempts are exhausted."""
+    calls = []
+
+    async def handler(request):
+        calls.append(request)
+        return web.Response(status=429, headers={"Retry-After": "0"})
+
+    policy = RetryPolicy(max_attempts=2, backoff_base=0.01)
+    client = await _make_client(aiohttp_client, zerion_api_key, handler, policy)
+    async with client:
+        with pytest.raises(ZerionRateLimitError) as exc_info:
+            await client.request("GET", "/test")
+    assert exc_info.value.status == 429
+    assert exc_info.value.retry_after == 0.0
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_does_not_retry_client_errors(aiohttp_client, zerion_api_key):
+    """Test non-retryable statuses fail on the first attempt."""
+    calls = []
+
+    async def handler(request):
+        calls.append(request)
+        return web.json_response({"error": "Not found"}, status=404)
+
+    client = await _make_client(aiohttp_client, zerion_api_key, handler, RetryPolicy())
+    async with client:
+        with pytest.raises(ZerionAPIError, match="API request failed"):
+            await client.request("GET", "/test")
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_does_not_retry_unsafe_methods(aiohttp_client, zerion_api_key):
+    """Test non-idempotent methods are not retried."""
+    calls = []
+
+    async def handler(request):
+        calls.append(request)
+        return web.Response(status=503, text="unavailable")
+
+    policy = RetryPolicy(max_attempts=3, backoff_base=0.01)
+    client = await _make_client(aiohttp_client, zerion_api_key, handler, policy)
+    async with client:
+        with pytest.raises(ZerionAPIError) as exc_info:
+            await client.request("POST", "/test", data={"a": 1})
+    assert exc_info.value.data == "unavailable"
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_total_timeout_budget(aiohttp_client, zerion_api_key):
+    """Test retries stop when the next delay would exceed the time budget."""
+    calls = []
+
+    async def handler(request):
+        calls.append(request)
+        return web.Response(status=429, headers={"Retry-After": "30"})
+
+    policy = RetryPolicy(max_attempts=5, total_timeout=1.0)
+    client = await _make_client(aiohttp_client, zerion_api_key, handler, policy)
+    async with client:
+        with pytest.raises(ZerionRateLimitError):
+            await client.request("GET", "/test")
+    assert len(calls) == 1
@@ -0,0 +1,117 @@
+"""Tests for the memory-mapped Zerion portfolio snapshot store."""
+import math
+
+import pytest
+
+from hyper_agent.zerion.models import Portfolio
+from hyper_agent.zerion.snapshots import SnapshotStore
+
+np = pytest.importorskip("numpy")
+
+
+def make_portfolio(total, **by_chain):
+    """Build a portfolio response in Zerion's JSON:API shape."""
+    return {
+        "data": {
+            "type": "portfolio",
+            "id": "0x",
+            "attributes": {
+                "total": {"positions": total},
+                "positions_distribution_by_chain": by_chain,
+            },
+        }
+    }
+
+
+def test_append_and_read(tmp_path):
+    """Test records round-trip and chains outside the columns go to other."""
+    path = str(tmp_path / "snapshots" / "portfolio.snap")
+    with SnapshotStore(path, chains=("ethereum", "base")) as store:
+        assert store.append("0xA", make_portfolio(100.0, ethereum=60, base=30,
+                                                   polygon=10), 1.0) == 0
+        store.append("0xb", make_portfolio(5.0, solana=5), 2.0)
+        store.append("0xa", Portfolio.from_json({"attributes": {}}), 3.0)
+        records = store.read()
+        assert len(store) == 3
+        assert records["timestamp"].tolist() == [1.0, 2.0, 3.0]
+        assert records["wallet"].tolist() == [0, 1, 0]
+        assert records["chains"][0].tolist() == [60.0, 30.0, 10.0]
+        assert store.chain_values(records, "other").tolist() == [10.0, 5.0, 0.0]
+        assert math.isnan(records["total"][2])
+        assert store.wallets == ["0xa", "0xb"]
+
+    reopened = SnapshotStore(path, chains=("ignored",))
+    assert reopened.chains == ("ethereum", "base")
+    assert len(reopened) == 3
+    assert reopened.history("0xA")["total"][0] == 100.0
+    reopened.close()
+
+
+def test_time_range_is_a_view(tmp_path):
+    """Test ordered time ranges are slices of the memory map."""
+    store = SnapshotStore(str(tmp_path / "p.snap"))
+    for i in range(10):
+        store.append(f"0x{i % 3}", make_portfolio(float(i)), float(i))
+    records = store.read(start=2, end=5)
+    assert records["total"].tolist() == [2.0, 3.0, 4.0]
+    assert np.shares_memory(records, store.records())
+    assert store.read(start=4, wallets=["0x1", "0xmissing"])["total"].tolist() == [
+        4.0, 7.0,
+    ]
+
+    store.append("0x0", make_portfolio(-1.0), 0.5)
+    assert store.read(end=1)["total"].tolist() == [0.0, -1.0]
+    store.close()
+
+
+def test_history_index_tracks_appends(tmp_path):
+    """Test per-wallet reads use the index and see later appends."""
+    store = SnapshotStore(str(tmp_path / "p.snap"))
+    for i in range(6):
+        store.append(f"0x{i % 2}", make_portfolio(float(i)), float(i))
+    assert store.history("0x1")["total"].tolist() == [1.0, 3.0, 5.0]
+    store.append("0x1", make_portfolio(6.0), 6.0)
+    store.append("0x2", make_portfolio(7.0), 7.0)
+    assert store.history("0x1")["total"].tolist() == [1.0, 3.0, 5.0, 6.0]
+    assert store.history("0x1", start=3, end=6)["total"].tolist() == [3.0, 5.0]
+    assert store.history("0x2")["total"].tolist() == [7.0]
+    assert len(store.history("0x9")) == 0
+    store.close()
+
+
+def test_non_evm_addresses_keep_case(tmp_path):
+    """Test case-sensitive Solana addresses stay distinct wallets."""
+    path = str(tmp_path / "p.snap")
+    upper = "7xKXtg2CW87d97TXJSDpbD5jBkheTqA83TZRuJosgAsU"
+    lower = upper.lower()
+    with SnapshotStore(path) as store:
+        store.append(upper, make_portfolio(1.0), 1.0)
+        store.append(lower, make_portfolio(2.0), 2.0)
+        store.append("0xABC", make_portfolio(3.0), 3.0)
+    reopened = SnapshotStore(path)
+    assert reopened.wallets == [upper, lower, "0xabc"]
+    assert reopened.history(upper)["total"].tolist() == [1.0]
+    assert reopened.history(lower)["total"].tolist() == [2.0]
+    assert reopened.history("0xAbc")["total"].tolist() == [3.0]
+    reopened.close()
+
+
+def test_partial_record_is_dropped(tmp_path):
+    """Test a torn trailing write is discarded on open."""
+    path = str(tmp_path / "p.snap")
+    with SnapshotStore(path) as store:
+        store.append("0x1", make_portfolio(1.0), 1.0)
+    with open(path, "ab") as file:
+        file.write(b"\x00" * 7)
+    with SnapshotStore(path) as store:
+        assert len(store) == 1
+        store.append("0x1", make_portfolio(2.0), 2.0)
+        assert store.read()["total"].tolist() == [1.0, 2.0]
+
+
+def test_rejects_foreign_file(tmp_path):
+    """Test opening a file that is not a store fails."""
+    path = tmp_path / "p.snap"
+    path.write_bytes(b"not a snapshot store")
+    with pytest.raises(ValueError):
+        SnapshotStore(str(path))
@@ -0,0 +1,121 @@
+"""Tests for the persistent SQLite response cache."""
+import asyncio
+
+import pytest
+from aiohttp import web
+
+from hyper_agent.zerion.client import ZerionClient
+from hyper_agent.zerion.sqlite_cache import SQLiteCache
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    """Path of a fresh cache database."""
+    return str(tmp_path / "cache" / "zerion.sqlite")
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cache_roundtrip(cache_path):
+    """Test values are stored compressed and read back."""
+    cache = SQLiteCache(cache_path)
+    value = {"data": [{"id": i, "symbol": "ETH"} for i in range(100)]}
+    await cache.set("GET /a", value, 60)
+    assert await cache.get("GET /a") == value
+    assert await cache.get("GET /missing") is None
+    assert 0 < await cache.size() < len(str(value))
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+
+    await cache.delete("GET /a")
+    assert await cache.get("GET /a") is None
+    await cache.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cache_persists_across_instances(cache_path):
+    """Test entries survive reopening the database, as across processes."""
+    first = SQLiteCache(cache_path)
+    second = SQLiteCache(cache_path)
+    await first.set("GET /a", {"a": 1}, 60)
+    assert await second.get("GET /a") == {"a": 1}
+    await first.close()
+    await second.close()
+
+    reopened = SQLiteCache(cache_path)
+    assert await reopened.get("GET /a") == {"a": 1}
+    journal_mode = reopened._conn.execute("PRAGMA journal_mode").fetchone()[0]
+    assert journal_mode == "wal"
+    await reopened.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cache_expands_home(monkeypatch, tmp_path):
+    """Test a ``~`` path is created under the home directory."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    cache = SQLiteCache("~/.cache/zerion.sqlite")
+    assert cache.path == str(tmp_path / ".cache" / "zerion.sqlite")
+    assert (tmp_path / ".cache" / "zerion.sqlite").exists()
+    await cache.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cache_ttl(cache_path):
+    """Test expired entries are not returned."""
+    cache = SQLiteCache(cache_path)
+    await cache.set("GET /a", {"a": 1}, 0.05)
+    await asyncio.sleep(0.06)
+    assert await cache.get("GET /a") is None
+    assert cache.stats.expirations == 1
+    await cache.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cache_size_cap(cache_path):
+    """Test least recently used entries are evicted over max_bytes."""
+    cache = SQLiteCache(cache_path, max_bytes=1, compression_level=0, evict_interval=1000)
+    await cache.set("GET /old", {"payload": "x" * 50}, 60)
+    await cache.set("GET /new", {"payload": "y" * 50}, 60)
+    cache.max_bytes = await cache.size() - 1
+    await cache.evict()
+    assert await cache.get("GET /old") is None
+    assert await cache.get("GET /new") == {"payload": "y" * 50}
+    assert cache.stats.evictions == 1
+    await cache.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cache_reads_touch_sparingly(cache_path):
+    """Test hits only rewrite the access time once it is stale."""
+    cache = SQLiteCache(cache_path, touch_interval=60)
+    await cache.set("GET /a", {"a": 1}, 60)
+    writes = cache._conn.total_changes
+    for _ in range(3):
+        assert await cache.get("GET /a") == {"a": 1}
+    assert cache._conn.total_changes == writes
+
+    cache.touch_interval = 0
+    assert await cache.get("GET /a") == {"a": 1}
+    assert cache._conn.total_changes == writes + 1
+    await cache.close()
+
+
+@pytest.mark.asyncio
+async def test_client_cache_from_env(monkeypatch, cache_path, aiohttp_client, zerion_api_key):
+    """Test ZERION_CACHE_PATH enables a persistent cache shared across clients."""
+    calls = []
+
+    async def handler(request):
+        calls.append(request)
+        return web.json_response({"data": {"id": "eth"}})
+
+    app = web.Application()
+    app.router.add_get("/tokens/{token_id}", handler)
+    server = await aiohttp_client(app)
+    monkeypatch.setenv("ZERION_CACHE_PATH", cache_path)
+
+    for _ in range(2):
+        async with ZerionClient(api_key=zerion_api_key) as client:
+            assert isinstance(client.cache, SQLiteCache)
+            client.base_url = str(server.make_url(""))
+            assert await client.request("GET", "/tokens/eth") == {"data": {"id": "eth"}}
+    assert len(calls) == 1
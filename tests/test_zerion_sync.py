@@ -0,0 +1,158 @@
+"""Tests for incremental Zerion transaction sync."""
+import pytest
+from aiohttp import web
+
+from hyper_agent.zerion.client import ZerionClient
+from hyper_agent.zerion.sync import (
+    Checkpoint,
+    MemoryCheckpointStore,
+    SQLiteCheckpointStore,
+    TransactionSync,
+    advance_checkpoint,
+)
+from hyper_agent.zerion.wallet import ZerionWallet
+
+PAGE_SIZE = 3
+
+
+def make_tx(tx_id, second):
+    """Build a minimal transactions resource mined at the given second."""
+    return {
+        "type": "transactions",
+        "id": tx_id,
+        "attributes": {"mined_at": f"2024-01-01T00:00:{second:02d}Z"},
+    }
+
+
+@pytest.fixture
+async def history_server(aiohttp_client):
+    """Serve a mutable, newest-first transaction history under /v1."""
+    history = []
+    requests = []
+
+    async def handler(request):
+        offset = int(request.query.get("page[after]", "0"))
+        requests.append(offset)
+        body = {"data": history[offset:offset + PAGE_SIZE], "links": {}}
+        if offset + PAGE_SIZE < len(history):
+            body["links"]["next"] = str(
+                request.url.with_query({"page[after]": str(offset + PAGE_SIZE)})
+            )
+        return web.json_response(body)
+
+    app = web.Application()
+    app.router.add_get("/v1/wallets/{address}/transactions", handler)
+    server = await aiohttp_client(app)
+    return server, history, requests
+
+
+def test_advance_checkpoint_keeps_ties():
+    """Test transactions sharing the newest timestamp are all recorded."""
+    checkpoint = advance_checkpoint(
+        "0x1", None, [make_tx("c", 5), make_tx("b", 5), make_tx("a", 1)]
+    )
+    assert checkpoint.mined_at == 1704067205.0
+    assert checkpoint.ids == {"b", "c"}
+    merged = advance_checkpoint("0x1", checkpoint, [make_tx("d", 5)])
+    assert merged.ids == {"b", "c", "d"}
+    assert advance_checkpoint("0x1", checkpoint, []) is checkpoint
+    assert checkpoint.is_seen(make_tx("b", 5))
+    assert checkpoint.is_seen(make_tx("z", 4))
+    assert not checkpoint.is_seen(make_tx("d", 5))
+    assert not checkpoint.is_seen(make_tx("e", 6))
+    assert checkpoint.is_older(make_tx("z", 4))
+    assert not checkpoint.is_older(make_tx("d", 5))
+
+
+@pytest.mark.asyncio
+async def test_sync_returns_only_new_transactions(history_server, zerion_api_key):
+    """Test later syncs stop paging once they reach older transactions."""
+    server, history, requests = history_server
+    history.extend(make_tx(f"tx-{i}", i) for i in range(10, 0, -1))
+    async with ZerionClient(api_key=zerion_api_key) as client:
+        client.base_url = str(server.make_url("/v1"))
+        sync = TransactionSync(ZerionWallet(client))
+
+        first = await sync.sync("0x1")
+        assert len(first) == 10
+        assert (await sync.store.get("0x1")).ids == {"tx-10"}
+
+        requests.clear()
+        history[:0] = [make_tx("tx-12", 12), make_tx("tx-11", 11)]
+        second = await sync.sync("0x1", parse=True)
+        assert [tx.id for tx in second] == ["tx-12", "tx-11"]
+        # tx-10 shares the checkpoint's timestamp, so paging continues to tx-9.
+        assert requests == [0, PAGE_SIZE]
+
+        assert await sync.sync("0x1") == []
+        await sync.reset("0x1")
+        assert len(await sync.sync("0x1")) == 12
+
+
+@pytest.mark.asyncio
+async def test_sync_finds_new_transaction_listed_after_seen_tie(
+    history_server, zerion_api_key
+):
+    """Test a new transaction sharing the checkpoint's timestamp is not skipped."""
+    server, history, _ = history_server
+    history.extend([make_tx("a", 10), make_tx("old", 5)])
+    async with ZerionClient(api_key=zerion_api_key) as client:
+        client.base_url = str(server.make_url("/v1"))
+        sync = TransactionSync(ZerionWallet(client))
+        assert [tx["id"] for tx in await sync.sync("0x1")] == ["a", "old"]
+
+        history.insert(1, make_tx("b", 10))
+        assert [tx["id"] for tx in await sync.sync("0x1")] == ["b"]
+        assert (await sync.store.get("0x1")).ids == {"a", "b"}
+        assert await sync.sync("0x1") == []
+
+
+@pytest.mark.asyncio
+async def test_sync_many(history_server, zerion_api_key):
+    """Test wallets are synced in bulk with independent checkpoints."""
+    server, history, _ = history_server
+    history.extend([make_tx("tx-2", 2), make_tx("tx-1", 1)])
+    async with ZerionClient(api_key=zerion_api_key) as client:
+        client.base_url = str(server.make_url("/v1"))
+        sync = TransactionSync(ZerionWallet(client), MemoryCheckpointStore())
+        results = {r.key: r async for r in sync.sync_many(["0x1", "0x2"])}
+    assert all(result.ok for result in results.values())
+    assert [len(result.value) for result in results.values()] == [2, 2]
+    assert (await sync.store.get("0x2")).mined_at == 1704067202.0
+
+
+@pytest.mark.asyncio
+async def test_sqlite_checkpoint_store(tmp_path):
+    """Test checkpoints persist across store instances."""
+    path = str(tmp_path / "sync.sqlite")
+    store = SQLiteCheckpointStore(path)
+    await store.set(Checkpoint("0xABC", 10.0, ["a", "b"]))
+    await store.close()
+
+    store = SQLiteCheckpointStore(path)
+    assert await store.get("0xabc") == Checkpoint("0xabc", 10.0, ["b", "a"])
+    await store.delete("0xabc")
+    assert await store.get("0xabc") is None
+    await store.close()
+
+
+@pytest.mark.parametrize("make_store", [
+    lambda path: MemoryCheckpointStore(),
+    lambda path: SQLiteCheckpointStore(path),
+])
+@pytest.mark.asyncio
+async def test_checkpoints_of_case_sensitive_addresses(tmp_path, make_store):
+    """Test Solana wallets differing only in case keep separate checkpoints."""
+    store = make_store(str(tmp_path / "sync.sqlite"))
+    upper = "7xKXtg2CW87d97TXJSDpbD5jBkheTqA83TZRuJosgAsU"
+    lower = upper.lower()
+    await store.set(Checkpoint(upper, 10.0, ["a"]))
+    await store.set(Checkpoint(lower, 20.0, ["b"]))
+    assert (await store.get(upper)).mined_at == 10.0
+    assert (await store.get(lower)).mined_at == 20.0
+    await store.delete(upper)
+    assert await store.get(upper) is None
+    assert await store.get(lower) is not None
+    await store.set(Checkpoint("0xABC", 30.0, ["c"]))
+    assert (await store.get("0xabc")).mined_at == 30.0
+    await store.close()
@@ -0,0 +1,90 @@
+"""Tests for the synchronous Zerion client facade."""
+import concurrent.futures
+import threading
+
+import pytest
+from aiohttp import web
+
+from hyper_agent.zerion.sync_client import ZerionSyncClient
+
+PAGE_SIZE = 2
+
+
+@pytest.fixture
+def zerion(zerion_api_key):
+    """Sync client talking to a server hosted on its own background loop."""
+    requests = []
+
+    async def portfolio(request):
+        requests.append(request.match_info["address"])
+        return web.json_response({"data": {"id": request.match_info["address"]}})
+
+    async def transactions(request):
+        offset = int(request.query.get("page[after]", "0"))
+        body = {"data": [{"id": str(i)} for i in range(offset, offset + PAGE_SIZE)]}
+        if offset < 4:
+            body["links"] = {"next": str(
+                request.url.with_query({"page[after]": str(offset + PAGE_SIZE)})
+            )}
+        return web.json_response(body)
+
+    app = web.Application()
+    app.router.add_get("/wallets/{address}/portfolio", portfolio)
+    app.router.add_get("/wallets/{address}/transactions", transactions)
+    client = ZerionSyncClient(api_key=zerion_api_key, timeout=10)
+    runner = web.AppRunner(app)
+    client.run(runner.setup())
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    client.run(site.start())
+    port = site._server.sockets[0].getsockname()[1]
+    client.client.base_url = f"http://127.0.0.1:{port}"
+    client.requests = requests
+    client.stop_server = runner.cleanup
+    yield client
+    if not client.closed:
+        client.run(runner.cleanup())
+        client.close()
+
+
+def test_calls_reuse_one_session(zerion):
+    """Test blocking calls share the background loop's session."""
+    first = zerion.wallet.get_wallet_portfolio("0x1")
+    session = zerion.client._session
+    second = zerion.wallet.get_wallet_portfolio("0x2")
+    assert (first, second) == ({"data": {"id": "0x1"}}, {"data": {"id": "0x2"}})
+    assert zerion.client._session is session
+    assert zerion.request("GET", "/wallets/0x3/portfolio") == {"data": {"id": "0x3"}}
+    assert zerion.wallet.client is zerion.client
+
+
+def test_async_iterators_become_iterators(zerion):
+    """Test paginated methods are consumed as plain iterators."""
+    ids = [tx["id"] for tx in zerion.wallet.iter_transactions("0x1")]
+    assert ids == ["0", "1", "2", "3", "4", "5"]
+    partial = zerion.wallet.iter_transactions("0x1", max_items=3)
+    assert next(partial)["id"] == "0"
+    partial.close()
+    fetch = zerion.wallet._target.get_wallet_portfolio
+    results = list(zerion.wallet.get_many(["0x1", "0x2"], fetch))
+    assert sorted(result.key for result in results) == ["0x1", "0x2"]
+
+
+def test_thread_safe(zerion):
+    """Test calls from many threads run concurrently on one loop."""
+    addresses = [f"0x{i}" for i in range(40)]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(zerion.wallet.get_wallet_portfolio, addresses))
+    assert [result["data"]["id"] for result in results] == addresses
+    assert sorted(zerion.requests) == sorted(addresses)
+    assert threading.active_count() >= 2
+
+
+def test_close(zerion):
+    """Test a closed client rejects calls and stops its thread."""
+    zerion.run(zerion.stop_server())
+    zerion.close()
+    zerion.close()
+    assert zerion.closed
+    assert not zerion._thread.is_alive()
+    with pytest.raises(RuntimeError):
+        zerion.wallet.get_wallet_portfolio("0x1")
@@ -1,5 +1,8 @@
 """Tests for the Zerion token functionality."""
+import asyncio
+import json
 import pytest
+from aiohttp import web
 from unittest.mock import patch
 
 from hyper_agent.zerion.token import ZerionToken
@@ -9,10 +12,11 @@ from hyper_agent.config import require_env_var
 
 
 @pytest.fixture
-def token_client(zerion_api_key):
-    """Create a ZerionToken instance."""
+async def token_client(zerion_api_key):
+    """Create a ZerionToken instance, closing its client afterwards."""
     client = ZerionClient(api_key=zerion_api_key)
-    return ZerionToken(client)
+    yield ZerionToken(client)
+    await client.close()
 
 
 @pytest.fixture
@@ -86,7 +90,7 @@ def mock_token_transactions():
 async def test_get_token_info(token_client, mock_token_info, sample_token_address):
     """Test getting token information."""
     with patch("aiohttp.ClientSession.request") as mock_request:
-        mock_request.return_value.__aenter__.return_value.json.return_value = mock_token_info
+        mock_request.return_value.__aenter__.return_value.read.return_value = json.dumps(mock_token_info).encode()
         mock_request.return_value.__aenter__.return_value.status = 200
 
         token_info = await token_client.get_token_info(sample_token_address)
@@ -99,7 +103,7 @@ async def test_get_token_info(token_client, mock_token_info, sample_token_addres
 async def test_get_token_price(token_client, mock_token_price, sample_token_address):
     """Test getting token price."""
     with patch("aiohttp.ClientSession.request") as mock_request:
-        mock_request.return_value.__aenter__.return_value.json.return_value = mock_token_price
+        mock_request.return_value.__aenter__.return_value.read.return_value = json.dumps(mock_token_price).encode()
         mock_request.return_value.__aenter__.return_value.status = 200
 
         price_info = await token_client.get_token_price(sample_token_address)
@@ -112,7 +116,7 @@ async def test_get_token_price(token_client, mock_token_price, sample_token_addr
 async def test_get_token_holders(token_client, mock_token_holders, sample_token_address):
     """Test getting token holders."""
     with patch("aiohttp.ClientSession.request") as mock_request:
-        mock_request.return_value.__aenter__.return_value.json.return_value = mock_token_holders
+        mock_request.return_value.__aenter__.return_value.read.return_value = json.dumps(mock_token_holders).encode()
         mock_request.return_value.__aenter__.return_value.status = 200
 
         holders = await token_client.get_token_holders(sample_token_address)
@@ -125,10 +129,43 @@ async def test_get_token_holders(token_client, mock_token_holders, sample_token_
 async def test_get_token_transactions(token_client, mock_token_transactions, sample_token_address):
     """Test getting token transactions."""
     with patch("aiohttp.ClientSession.request") as mock_request:
-        mock_request.return_value.__aenter__.return_value.json.return_value = mock_token_transactions
+        mock_request.return_value.__aenter__.return_value.read.return_value = json.dumps(mock_token_transactions).encode()
         mock_request.return_value.__aenter__.return_value.status = 200
 
         transactions = await token_client.get_token_transactions(sample_token_address)
         assert len(transactions["data"]) == 1
         assert transactions["data"][0]["type"] == "transaction"
-        assert transactions["data"][0]["attributes"]["value"] == "10.5"
\ No newline at end of file
+        assert transactions["data"][0]["attributes"]["value"] == "10.5"
+
+
+@pytest.mark.asyncio
+async def test_get_token_prices_batches(aiohttp_client, zerion_api_key):
+    """Test many prices are fetched per request, also via get_price."""
+    requests = []
+
+    async def handler(request):
+        ids = request.query["filter[fungible_ids]"].split(",")
+        requests.append(ids)
+        return web.json_response({"data": [
+            {"type": "fungibles", "id": token_id,
+             "attributes": {"market_data": {"price": float(len(token_id))}}}
+            for token_id in ids if token_id != "unknown"
+        ]})
+
+    app = web.Application()
+    app.router.add_get("/fungibles/", handler)
+    server = await aiohttp_client(app)
+    async with ZerionClient(api_key=zerion_api_key) as client:
+        client.base_url = str(server.make_url(""))
+        token = ZerionToken(client, price_batch_size=2)
+        prices = await token.get_token_prices(["a", "bb", "a", "ccc", "unknown"])
+        assert prices == {"a": 1.0, "bb": 2.0, "ccc": 3.0, "unknown": None}
+        assert sorted(requests) == [["a", "bb"], ["ccc", "unknown"]]
+
+        requests.clear()
+        token = ZerionToken(client, price_batch_size=10)
+        results = await asyncio.gather(
+            token.get_price("dddd"), token.get_price("e"), token.get_price("dddd")
+        )
+        assert results == [4.0, 1.0, 4.0]
+        assert requests == [["dddd", "e"]]
@@ -1,5 +1,6 @@
 """Tests for ZerionWallet class."""
 
+import json
 import pytest
 from unittest.mock import patch
 
@@ -120,16 +121,17 @@ def mock_protocols_response():
     }
 
 @pytest.fixture
-def wallet_client(zerion_api_key):
-    """Create a ZerionWallet instance."""
+async def wallet_client(zerion_api_key):
+    """Create a ZerionWallet instance, closing its client afterwards."""
     client = ZerionClient(api_key=zerion_api_key)
-    return ZerionWallet(client)
+    yield ZerionWallet(client)
+    await client.close()
 
 @pytest.mark.asyncio
 async def test_get_wallet_info(wallet_client, mock_wallet_response):
     """Test getting wallet info."""
     with patch("aiohttp.ClientSession.request") as mock_request:
-        mock_request.return_value.__aenter__.return_value.json.return_value = mock_wallet_response
+        mock_request.return_value.__aenter__.return_value.read.return_value = json.dumps(mock_wallet_response).encode()
         mock_request.return_value.__aenter__.return_value.status = 200
 
         info = await wallet_client.get_wallet_info("0x123")
@@ -139,7 +141,7 @@ async def test_get_wallet_info(wallet_client, mock_wallet_response):
 async def test_get_wallet_balances(wallet_client, mock_assets_response):
     """Test getting wallet balances."""
     with patch("aiohttp.ClientSession.request") as mock_request:
-        mock_request.return_value.__aenter__.return_value.json.return_value = mock_assets_response
+        mock_request.return_value.__aenter__.return_value.read.return_value = json.dumps(mock_assets_response).encode()
         mock_request.return_value.__aenter__.return_value.status = 200
 
         balances = await wallet_client.get_wallet_balances("0x123")
@@ -150,7 +152,7 @@ async def test_get_wallet_balances(wallet_client, mock_assets_response):
 async def test_get_wallet_transactions(wallet_client, mock_transactions_response):
     """Test getting wallet transactions."""
     with patch("aiohttp.ClientSession.request") as mock_request:
-        mock_request.return_value.__aenter__.return_value.json.return_value = mock_transactions_response
+        mock_request.return_value.__aenter__.return_value.read.return_value = json.dumps(mock_transactions_response).encode()
         mock_request.return_value.__aenter__.return_value.status = 200
 
         transactions = await wallet_client.get_wallet_transactions("0x123")
@@ -161,7 +163,7 @@ async def test_get_wallet_transactions(wallet_client, mock_transactions_response
 async def test_get_wallet_protocols(wallet_client, mock_protocols_response):
     """Test getting wallet protocols."""
     with patch("aiohttp.ClientSession.request") as mock_request:
-        mock_request.return_value.__aenter__.return_value.json.return_value = mock_protocols_response
+        mock_request.return_value.__aenter__.return_value.read.return_value = json.dumps(mock_protocols_response).encode()
         mock_request.return_value.__aenter__.return_value.status = 200
 
         protocols = await wallet_client.get_wallet_protocols("0x123")
@@ -172,7 +174,7 @@ async def test_get_wallet_protocols(wallet_client, mock_protocols_response):
 async def test_get_wallet_portfolio(wallet_client, mock_portfolio_response):
     """Test getting wallet portfolio."""
     with patch("aiohttp.ClientSession.request") as mock_request:
-        mock_request.return_value.__aenter__.return_value.json.return_value = mock_portfolio_response
+        mock_request.return_value.__aenter__.return_value.read.return_value = json.dumps(mock_portfolio_response).encode()
         mock_request.return_value.__aenter__.return_value.status = 200
 
         portfolio = await wallet_client.get_wallet_portfolio("0x123")
@@ -0,0 +1,120 @@
+"""Tests for the adaptive Zerion wallet watcher."""
+import pytest
+
+from hyper_agent.zerion.exceptions import ZerionAPIError
+from hyper_agent.zerion.watch import Watcher, WatchPolicy, holdings
+
+
+def make_positions(**quantities):
+    """Build a positions response from position id and quantity."""
+    return {
+        "data": [
+            {"type": "positions", "id": position_id,
+             "attributes": {"quantity": {"float": quantity}, "value": 1.0}}
+            for position_id, quantity in quantities.items()
+        ]
+    }
+
+
+class FakeWallet:
+    """Serves scripted positions responses per address."""
+
+    def __init__(self, responses):
+        self.responses = responses
+        self.calls = []
+
+    async def get_wallet_balances(self, address, use_cache=True, parse=False):
+        self.calls.append(address)
+        script = self.responses[address]
+        response = script.pop(0) if len(script) > 1 else script[0]
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+def test_holdings_ignores_values():
+    """Test holdings keep quantities only."""
+    positions = make_positions(eth=1.5, usdc=10)
+    positions["data"][0]["attributes"]["value"] = 9999.0
+    assert holdings(positions) == {"eth": 1.5, "usdc": 10.0}
+
+
+def test_policy_intervals():
+    """Test intervals reset on change and back off up to the maximum."""
+    policy = WatchPolicy(min_interval=10, max_interval=35, backoff=2)
+    assert policy.next_interval(10, False) == 20
+    assert policy.next_interval(20, False) == 35
+    assert policy.next_interval(35, True) == 10
+    with pytest.raises(ValueError):
+        WatchPolicy(min_interval=5, max_interval=1)
+    with pytest.raises(ValueError):
+        WatchPolicy(backoff=0.5)
+
+
+@pytest.mark.asyncio
+async def test_poll_adapts_interval():
+    """Test a wallet's interval grows while dormant and resets on change."""
+    wallet = FakeWallet({"0x1": [
+        make_positions(eth=1), make_positions(eth=1), make_positions(eth=2),
+    ]})
+    watcher = Watcher(wallet, ["0x1"], WatchPolicy(1, 100, 3))
+    state = watcher.wallets["0x1"]
+
+    event = await watcher.poll(state)
+    assert event.kind == "initial" and event.current == {"eth": 1.0}
+    assert state.interval == 3
+    assert await watcher.poll(state) is None
+    assert state.interval == 9
+    event = await watcher.poll(state)
+    assert event.kind == "changed"
+    assert (event.previous, event.current) == ({"eth": 1.0}, {"eth": 2.0})
+    assert [change.kind for change in event.changes] == ["increased"]
+    assert event.as_dict()["changes"][0]["delta"] == 1.0
+    assert state.interval == 1
+    assert (state.polls, state.changes) == (3, 1)
+
+
+@pytest.mark.asyncio
+async def test_events_polls_hot_wallets_more_often():
+    """Test active wallets are polled more often than dormant ones."""
+    hot = [make_positions(eth=i) for i in range(100)]
+    wallet = FakeWallet({
+        "0xhot": hot,
+        "0xcold": [make_positions(eth=1)],
+        "0xbad": [ZerionAPIError("API request failed: boom", status=500)],
+    })
+    watcher = Watcher(
+        wallet, ["0xhot", "0xcold", "0xbad"],
+        WatchPolicy(min_interval=0.01, max_interval=1.0, backoff=4),
+        concurrency=2,
+    )
+    kinds = {}
+    events = watcher.events()
+    async for event in events:
+        kinds.setdefault(event.address, []).append(event.kind)
+        if len(kinds.get("0xhot", [])) >= 6:
+            break
+    await events.aclose()
+
+    assert kinds["0xhot"][0] == "initial"
+    assert set(kinds["0xhot"][1:]) == {"changed"}
+    assert kinds["0xcold"] == ["initial"]
+    assert kinds["0xbad"][0] == "error"
+    assert wallet.calls.count("0xcold") < wallet.calls.count("0xhot")
+    assert watcher.wallets["0xcold"].interval > watcher.wallets["0xhot"].interval
+
+
+@pytest.mark.asyncio
+async def test_removed_wallet_is_not_polled():
+    """Test removed wallets drop out of the schedule."""
+    wallet = FakeWallet({
+        "0x1": [make_positions(eth=1)],
+        "0x2": [make_positions(eth=i) for i in range(100)],
+    })
+    watcher = Watcher(wallet, ["0x1", "0x2"], WatchPolicy(0.01, 0.01, 1))
+    watcher.remove("0x1")
+    events = watcher.events()
+    seen = [(await events.__anext__()).address for _ in range(3)]
+    await events.aclose()
+    assert set(seen) == {"0x2"}
+    assert "0x1" not in wallet.calls